@@ -0,0 +1,56 @@
+"""
+Benchmarks for concatenation.
+
+- `bench_stub_concat`: glues a single stub column onto bodies of increasing
+  size.
+- `bench_nary_concat`: concatenates many small per-model tables with
+  `tabx.concat` and with a `reduce` over `|`.
+
+Run with `python benchmarks/bench_concat.py`.
+"""
+
+import timeit
+from functools import reduce
+
+import tabx
+
+
+def body(nrows: int, ncols: int = 5) -> tabx.Table:
+    return tabx.Table.from_values(
+        [[f"{i}.{j}" for j in range(ncols)] for i in range(nrows)]
+    )
+
+
+def bench_stub_concat(sizes: list[int], number: int = 5):
+    print("stub | body")
+    print(f"{'rows':>8} {'ms/concat':>10}")
+    for n in sizes:
+        tab = body(n)
+        stub = tabx.Table.from_values([[f"r{i}"] for i in range(n)])
+        t = timeit.timeit(lambda: stub | tab, number=number) / number
+        print(f"{n:>8} {t * 1e3:>10.2f}")
+
+
+def model(i: int, nvars: int = 20) -> tabx.Table:
+    header = tabx.Row([tabx.Cell(f"m{i}")])
+    return (
+        header
+        / tabx.Midrule()
+        / tabx.Table.from_values([[f"{j}.{i}"] for j in range(nvars)])
+    )
+
+
+def bench_nary_concat(sizes: list[int], number: int = 3):
+    print("concat(tables, 'horizontal') vs reduce(|)")
+    print(f"{'tables':>8} {'concat ms':>10} {'reduce ms':>10}")
+    for n in sizes:
+        tables = [model(i) for i in range(n)]
+        t1 = timeit.timeit(lambda: tabx.concat(tables, how="horizontal"), number=number)
+        t2 = timeit.timeit(lambda: reduce(lambda x, y: x | y, tables), number=number)
+        print(f"{n:>8} {t1 / number * 1e3:>10.2f} {t2 / number * 1e3:>10.2f}")
+
+
+if __name__ == "__main__":
+    bench_stub_concat([500, 1_000, 2_000, 5_000])
+    print()
+    bench_nary_concat([50, 100, 300])
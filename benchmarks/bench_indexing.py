@@ -0,0 +1,49 @@
+"""
+Benchmarks for integer indexing.
+
+- `bench_row_access`: `tab[-1]`, `tab[0]` and `tab[-1, -1]` on tables of
+  increasing size.
+- `bench_insert_row`: `insert_row` at the end and at a negative index.
+
+Times of single row and cell access should stay flat in the number of rows.
+
+Run with `python benchmarks/bench_indexing.py`.
+"""
+
+import timeit
+
+import tabx
+
+
+def body(nrows: int, ncols: int = 5) -> tabx.Table:
+    return tabx.Table.from_values(
+        [[f"{i}.{j}" for j in range(ncols)] for i in range(nrows)]
+    )
+
+
+def bench_row_access(sizes: list[int], number: int = 1_000):
+    print("single row and cell access")
+    print(f"{'rows':>8} {'tab[-1] us':>11} {'tab[0] us':>10} {'tab[-1, -1] us':>15}")
+    for n in sizes:
+        tab = body(n)
+        t1 = timeit.timeit(lambda: tab[-1], number=number) / number
+        t2 = timeit.timeit(lambda: tab[0], number=number) / number
+        t3 = timeit.timeit(lambda: tab[-1, -1], number=number) / number
+        print(f"{n:>8} {t1 * 1e6:>11.1f} {t2 * 1e6:>10.1f} {t3 * 1e6:>15.1f}")
+
+
+def bench_insert_row(sizes: list[int], number: int = 100):
+    print("insert_row")
+    print(f"{'rows':>8} {'append us':>10} {'at -1 us':>10}")
+    for n in sizes:
+        tab = body(n)
+        row = tabx.Row([tabx.Cell(str(j)) for j in range(5)])
+        t1 = timeit.timeit(lambda: tab.insert_row(row, n), number=number) / number
+        t2 = timeit.timeit(lambda: tab.insert_row(row, -1), number=number) / number
+        print(f"{n:>8} {t1 * 1e6:>10.1f} {t2 * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    bench_row_access([1_000, 10_000, 100_000])
+    print()
+    bench_insert_row([1_000, 10_000, 100_000])
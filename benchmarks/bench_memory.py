@@ -0,0 +1,43 @@
+"""
+Memory benchmarks for cells.
+
+- `bench_cell_memory`: bytes allocated per `Cell`, for plain cells and for
+  cells of a table built with `Table.from_values`.
+
+Run with `python benchmarks/bench_memory.py`.
+"""
+
+import tracemalloc
+
+import tabx
+
+
+def allocated(build) -> tuple[object, int]:
+    """Returns the result of `build()` and the bytes it kept allocated."""
+    tracemalloc.start()
+    try:
+        start = tracemalloc.get_traced_memory()[0]
+        obj = build()
+        size = tracemalloc.get_traced_memory()[0] - start
+    finally:
+        tracemalloc.stop()
+    return obj, size
+
+
+def bench_cell_memory(sizes: list[int]):
+    print("bytes per cell")
+    print(f"{'cells':>10} {'Cell':>8} {'styled':>8} {'table':>8}")
+    for n in sizes:
+        # Values are built outside the measurement
+        values = [str(i) for i in range(n)]
+        _, plain = allocated(lambda: [tabx.Cell(v) for v in values])
+        _, styled = allocated(
+            lambda: [tabx.Cell(v, style="bold", colspec="l") for v in values]
+        )
+        rows = [values[i : i + 10] for i in range(0, n, 10)]
+        _, table = allocated(lambda: tabx.Table.from_values(rows))
+        print(f"{n:>10} {plain / n:>8.1f} {styled / n:>8.1f} {table / n:>8.1f}")
+
+
+if __name__ == "__main__":
+    bench_cell_memory([10_000, 100_000, 1_000_000])
@@ -0,0 +1,79 @@
+"""
+Benchmarks for rendering large tables.
+
+- `bench_render_workers`: `Table.render(workers=n)` for 1, 2, 4, ... workers
+  up to the number of cores, for a table of `Row` objects with plain and
+  with number formatted cells and a columnar table.
+
+Every run renders a freshly built table s.t. no cell or row renders are
+cached. The speedup is bounded by the number of cores, printed first, and
+includes starting the worker processes and packing the rows for them.
+
+Run with `python benchmarks/bench_render.py`.
+"""
+
+import os
+import time
+from collections.abc import Callable
+
+import tabx
+
+
+def rows_table(nrows: int, ncols: int = 8) -> tabx.Table:
+    return tabx.Table(
+        [tabx.Row([tabx.Cell(f"{i}.{j}") for j in range(ncols)]) for i in range(nrows)]
+    )
+
+
+def formatted_table(nrows: int, ncols: int = 8) -> tabx.Table:
+    fmt = tabx.NumberFormat(decimals=2, thousands=True)
+    return tabx.Table.from_values(
+        [[i * 1.5 + j for j in range(ncols)] for i in range(nrows)],
+        formats=[fmt] * ncols,
+    )
+
+
+def columnar_table(nrows: int, ncols: int = 8) -> tabx.Table:
+    return tabx.Table.from_values(
+        [[i * 1.5 + j for j in range(ncols)] for i in range(nrows)],
+        storage="columnar",
+    )
+
+
+def time_render(
+    make: Callable[[int], tabx.Table], nrows: int, workers: int, number: int
+) -> tuple[float, str]:
+    """Best time of `number` renders of fresh tables and the output."""
+    best = float("inf")
+    for _ in range(number):
+        tab = make(nrows)
+        t0 = time.perf_counter()
+        out = tab.render(workers=workers)
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def bench_render_workers(nrows: int, number: int = 3):
+    cores = os.cpu_count() or 1
+    workers = [1]
+    while workers[-1] * 2 <= cores:
+        workers.append(workers[-1] * 2)
+    print(f"render {nrows} rows; {cores} cores")
+    makers = [rows_table, formatted_table, columnar_table]
+    print(
+        f"{'workers':>8}" + "".join(f" {m.__name__:>16} {'speedup':>8}" for m in makers)
+    )
+    base: list[tuple[float, str]] = []
+    for n in workers:
+        line = f"{n:>8}"
+        for k, make in enumerate(makers):
+            t, out = time_render(make, nrows, n, number)
+            if n == 1:
+                base.append((t, out))
+            assert out == base[k][1]
+            line += f" {t:>16.3f} {base[k][0] / t:>8.2f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    bench_render_workers(200_000)
@@ -23,20 +23,6 @@ def get_lines(c: str):
     return [c for c in c.splitlines() if c]
 
 
-def parse_c(c: str):
-    if c == "_":
-        return r"\_"
-    if c == "|":
-        return r"\textbar"
-    if c == "\\":
-        return r"\textbackslash"
-    if c == "<":
-        return r"\textless"
-    if c == ">":
-        return r"\textgreater"
-    return c
-
-
 def get_table(s: str):
     parts = get_lines(s)
     max_len = max([len(p) for p in parts])
@@ -46,7 +32,7 @@ def get_table(s: str):
         lp = len(p)
         diff = max_len - lp
         for c in p:
-            row.append(Cell(value=parse_c(c), style="bold"))
+            row.append(Cell(value=c, style="bold", escape=True))
         for _ in range(diff):  # pad differences
             row.append(tabx.empty_cell())
         rows.append(tabx.Row(row))
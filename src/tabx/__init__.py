@@ -2,7 +2,7 @@
 tabx - compose LaTeX tables using booktabs in Python
 """
 
-from tabx import custom, table, utils
+from tabx import custom, formatting, preview, table, utils
 from tabx.custom import (
     ColMap,
     DescData,
@@ -13,6 +13,7 @@ from tabx.custom import (
     simple_table,
     simple_table_from_pl,
 )
+from tabx.formatting import NumberFormat
 from tabx.table import (
     Bottomrule,
     Cell,
@@ -24,6 +25,7 @@ from tabx.table import (
     Midrule,
     Row,
     Table,
+    TableExpr,
     Toprule,
     concat,
     empty_cell,
@@ -32,6 +34,7 @@ from tabx.table import (
     empty_table,
     filled_columns,
     filled_table,
+    lazy,
     multicolumn_row,
     multirow_column,
 )
@@ -55,6 +58,8 @@ __all__ = [
     "Midrule",
     "Bottomrule",
     "ColoredRow",
+    "TableExpr",
+    "NumberFormat",
     # table
     "empty_columns",
     "empty_cell",
@@ -64,6 +69,7 @@ __all__ = [
     "filled_table",
     "multirow_column",
     "multicolumn_row",
+    "lazy",
     # custom
     "DescData",
     "ModelData",
@@ -79,6 +85,8 @@ __all__ = [
     "save_table",
     # modules
     "custom",
+    "formatting",
+    "preview",
     "table",
     "utils",
 ]
@@ -15,6 +15,7 @@ from functools import reduce
 from itertools import chain
 from typing import TYPE_CHECKING, Any, Iterable
 
+from tabx.formatting import NumberFormat
 from tabx.table import (
     Cell,
     Cmidrule,
@@ -23,6 +24,7 @@ from tabx.table import (
     Midrule,
     NumOrStr,
     Row,
+    Storage,
     Table,
     TableRow,
     empty_cell,
@@ -174,6 +176,8 @@ class ModelData:
     """Name of the model."""
     extra_data: dict[str, Any] = dataclasses.field(default_factory=dict)
     """Dictionary to hold any extra data associated with the model."""
+    number_format: NumberFormat | None = None
+    """Format of the estimates and standard errors; the latter get parentheses."""
 
     def __repr__(self) -> str:
         return f"ModelData(name={self.name}, #variables={len(self.variables)})"
@@ -259,6 +263,8 @@ class DescData:
     """Name of the descriptive statistics."""
     extra_data: dict[str, Any] = dataclasses.field(default_factory=dict)
     """Dictionary to hold any extra data associated with the variable."""
+    number_format: NumberFormat | None = None
+    """Format of the values."""
 
     def __repr__(self) -> str:
         return f"DescData(name={self.name}, #variables={len(self.values)})"
@@ -344,13 +350,12 @@ class DescData:
 
 def make_est_col(data: ModelData) -> list[RegCell]:
     """Make column of estimates and standard errors."""
+    est_format = data.number_format
+    se_format = dataclasses.replace(est_format or NumberFormat(), parens=True)
     cells = [
         RegCell(
-            est=Cell(name=name, value=f"{est}"),
-            se=Cell(
-                name="",
-                value=f"({se})",
-            ),
+            est=Cell(name=name, value=est, number_format=est_format),
+            se=Cell(name="", value=se, number_format=se_format),
             name=name,
         )
         for name, est, se in zip(data.variables, data.estimates, data.ses)
@@ -361,7 +366,7 @@ def make_est_col(data: ModelData) -> list[RegCell]:
 def make_desc_col(data: DescData) -> list[Cell]:
     """Make column of estimates and standard errors."""
     cells = [
-        Cell(name=f"{var}", value=f"{val}")
+        Cell(name=f"{var}", value=val, number_format=data.number_format)
         for var, val in zip(data.variables, data.values)
     ]
     return cells
@@ -822,9 +827,13 @@ def simple_table(
     column_names: Sequence[str] | None = None,
     col_maps: ColMaps | None = None,
     row_maps: RowMaps | None = None,
+    storage: Storage = "rows",
 ) -> Table:
-    """Simple table with optional column names and row/col maps."""
-    tab = Table.from_values(values)
+    """Simple table with optional column names and row/col maps.
+
+    See `Columns.from_values` for `storage`.
+    """
+    tab = Table.from_values(values, storage=storage)
     if column_names:
         if len(column_names) != tab.ncols:
             raise ValueError(
@@ -872,5 +881,8 @@ def simple_table(
 
 
 def simple_table_from_pl(df: "pl.DataFrame", **kwargs) -> Table:
-    """Create simple table from a polars dataframe"""
+    """Create simple table from a polars dataframe
+
+    Keyword arguments are passed to `simple_table`.
+    """
     return simple_table(values=df.rows(), column_names=df.columns, **kwargs)
@@ -0,0 +1,104 @@
+"""
+Number formats for numeric cells.
+
+Cells keep their values as given and a `NumberFormat` turns numbers into text
+when the cell is rendered. Columnar tables format whole columns at once with
+`NumberFormat.format_many`.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+
+__all__ = ["NumberFormat"]
+
+
+@dataclass(frozen=True)
+class NumberFormat:
+    """Format of the numbers in a cell or column.
+
+    Strings are not formatted as numbers; non-empty ones are only wrapped in
+    `\\num{}` and parentheses.
+
+    **Example**:
+    ```python
+    NumberFormat(decimals=2, thousands=True).format(1234.567)  # '1,234.57'
+    NumberFormat(decimals=3, parens=True).format(0.0123)  # '(0.012)'
+    NumberFormat(decimals=1, scientific=True, siunitx=True).format(1234)
+    # '\\num{1.2e+03}'
+    ```
+    """
+
+    decimals: int | None = None
+    """Number of decimals; `None` leaves the number as `str` gives it."""
+    thousands: bool = False
+    """Separate thousands with commas."""
+    scientific: bool = False
+    """Scientific notation, e.g. 1.23e+04."""
+    siunitx: bool = False
+    """Wrap the number in `\\num{}` of the `siunitx` package."""
+    parens: bool = False
+    """Wrap the number in parentheses, e.g. for standard errors."""
+    _template: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.decimals is not None and self.decimals < 0:
+            raise ValueError(f"decimals must be non-negative; got {self.decimals}")
+        if self.thousands and self.siunitx:
+            raise ValueError("siunitx groups digits itself; drop `thousands`")
+        spec = "," if self.thousands else ""
+        if self.decimals is not None:
+            spec += f".{self.decimals}"
+        if self.scientific:
+            spec += "e"
+        elif self.decimals is not None:
+            spec += "f"
+        template = "{:" + spec + "}" if spec else "{}"
+        object.__setattr__(self, "_template", self.wrap(template, braces="{{}}"))
+
+    def wrap(self, text: str, braces: str = "{}") -> str:
+        """Wraps formatted `text` in `\\num{}` and parentheses.
+
+        `braces` are the ones of `\\num`, doubled for a `str.format` template.
+        """
+        if self.siunitx:
+            half = len(braces) // 2
+            text = r"\num" + braces[:half] + text + braces[half:]
+        if self.parens:
+            text = "(" + text + ")"
+        return text
+
+    def format(self, value: int | float | str) -> str:
+        """Formats a single value."""
+        if isinstance(value, str):
+            return self.wrap(value) if value else value
+        return self._template.format(value)
+
+    def format_many(self, values: Iterable[int | float | str]) -> list[str]:
+        """Formats a column of values at once.
+
+        Numbers are formatted in a single pass by `str.format` instead of a
+        Python call per value. Arrays with a `tolist` method, e.g. NumPy
+        arrays, are converted to lists first.
+        """
+        tolist = getattr(values, "tolist", None)
+        values = tolist() if tolist is not None else list(values)
+        if any(isinstance(value, str) for value in values):
+            return [self.format(value) for value in values]
+        return list(map(self._template.format, values))
+
+
+def column_formats(
+    formats: NumberFormat | Sequence[NumberFormat | None] | None,
+    ncols: int,
+) -> list[NumberFormat | None]:
+    """One number format per column from a single format or one per column."""
+    if formats is None or isinstance(formats, NumberFormat):
+        return [formats] * ncols
+    formats = list(formats)
+    if len(formats) != ncols:
+        raise ValueError(
+            f"Expected one number format per column ({ncols}); got {len(formats)}"
+        )
+    return formats
@@ -0,0 +1,320 @@
+"""
+Plain-text, Markdown and HTML previews of tables.
+
+The previews lay out the values of the cells in a grid without going
+through LaTeX, e.g. to look at a table in a terminal, a CI log or a
+notebook. Use `Table.render_text`, `Table.render_markdown` and
+`Table.render_html`; the latter is also the notebook display of a `Table`.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+from collections.abc import Iterator, Sequence
+
+from tabx.table import (
+    RENDER_BLOCK,
+    Bottomrule,
+    Cell,
+    Cmidrule,
+    Cmidrules,
+    ColoredCell,
+    ColoredRow,
+    ColumnarRows,
+    Midrule,
+    Row,
+    Table,
+    TableRow,
+    Toprule,
+    column_texts,
+)
+
+__all__ = ["render_html", "render_markdown", "render_text"]
+
+type Span = tuple[int, int, str, str, Cell | None]
+"""First column, number of columns, text, alignment and the cell itself, if
+any, of a cell in a preview."""
+
+SEP = "  "
+"""Separator of the columns in `render_text`."""
+RULE_CHARS: dict[type, str] = {Toprule: "=", Bottomrule: "=", Midrule: "-"}
+"""Characters drawing the rules in `render_text`."""
+RULE_BORDERS: dict[type, str] = {
+    Toprule: "2px solid",
+    Bottomrule: "2px solid",
+    Midrule: "1px solid",
+}
+"""CSS borders drawing the rules in `render_html`; cmidrules are thin."""
+HTML_ALIGNS = {"l": "left", "c": "center", "r": "right"}
+HTML_TABLE = (
+    '<table class="tabx" style="border-collapse: collapse; '
+    'border-top: 2px solid; border-bottom: 2px solid">'
+)
+"""Opening tag of `render_html`, with the top and bottom rule as borders."""
+
+
+def cell_text(cell: Cell) -> str:
+    """The value of `cell` as shown in a preview: formatted, not escaped."""
+    number_format = cell.number_format
+    if number_format is None:
+        text = str(cell.value)
+    else:
+        text = number_format.format(cell.value)
+    return text.replace("\n", " ")
+
+
+def column_aligns(align: str, ncols: int) -> list[str]:
+    """Alignment ('l', 'c' or 'r') of each column from a column spec.
+
+    Arguments such as `@{}`, `p{2cm}` or `>{...}` are dropped; `p`, `m`,
+    `b` and `X` columns are left aligned and `S` columns right aligned. Falls
+    back to centered columns if the spec doesn't give one per column.
+    """
+    while (stripped := re.sub(r"\{[^{}]*\}", "", align)) != align:
+        align = stripped
+    aligns = [
+        "l" if c in "pmbX" else "r" if c == "S" else c for c in align if c in "lcrpmbXS"
+    ]
+    return aligns if len(aligns) == ncols else ["c"] * ncols
+
+
+def row_spans(
+    rows: Sequence[TableRow], aligns: list[str]
+) -> Iterator[list[Span] | TableRow]:
+    """The spans of each `Row` in `rows`; other rows are yielded as is.
+
+    Unmaterialized columnar bodies are formatted a block of each column at
+    once without creating `Row` objects; their spans have no cell.
+    """
+    if isinstance(rows, ColumnarRows) and not rows.is_materialized():
+        yield from row_spans(rows.head, aligns)
+        lo, hi = rows.off, rows.off + rows.nbody
+        for start in range(lo, hi, RENDER_BLOCK):
+            stop = min(start + RENDER_BLOCK, hi)
+            block = [
+                column_texts(col[start:stop], fmt, False)
+                for col, fmt in zip(rows.columns, rows.formats)
+            ]
+            for texts in zip(*block):
+                yield [
+                    (j, 1, text.replace("\n", " "), aligns[j], None)
+                    for j, text in enumerate(texts)
+                ]
+        yield from row_spans(rows.tail, aligns)
+        return
+    for row in rows:
+        if not isinstance(row, Row):
+            yield row
+            continue
+        spans = []
+        col = 0
+        for cell in row.cells:
+            n = len(cell)
+            align = cell.colspec if n > 1 else aligns[col]
+            spans.append((col, n, cell_text(cell), align, cell))
+            col += n
+        yield spans
+
+
+def pad(text: str, width: int, align: str) -> str:
+    if align == "l":
+        return text.ljust(width)
+    if align == "r":
+        return text.rjust(width)
+    return text.center(width)
+
+
+def column_widths(rows: list[list[Span] | TableRow], ncols: int) -> list[int]:
+    """Widths of the columns s.t. every cell fits.
+
+    Cells spanning several columns that don't fit widen their columns evenly.
+    """
+    widths = [0] * ncols
+    spanning = []
+    for spans in rows:
+        if not isinstance(spans, list):
+            continue
+        for col, n, text, _, _ in spans:
+            if n == 1:
+                widths[col] = max(widths[col], len(text))
+            else:
+                spanning.append((col, n, len(text)))
+    for col, n, width in spanning:
+        need = width - sum(widths[col : col + n]) - len(SEP) * (n - 1)
+        for k in range(max(need, 0)):
+            widths[col + k % n] += 1
+    return widths
+
+
+def render_text(tab: Table) -> str:
+    """Render `tab` as plain text in a monospace grid.
+
+    Multicolumn cells are laid out across the columns they span and the
+    value of a multirow cell is shown in its first row. Top and bottom rules
+    are drawn with `=`, midrules and cmidrules with `-`; row colors are left
+    out.
+    """
+    aligns = column_aligns(tab.align, tab.ncols)
+    rows = list(row_spans(tab.rows, aligns))
+    widths = column_widths(rows, tab.ncols)
+    starts = [0]
+    for width in widths:
+        starts.append(starts[-1] + width + len(SEP))
+    total = starts[-1] - len(SEP)
+
+    def cmidrule_line(cmidrules: list[Cmidrule]) -> str:
+        line = [" "] * total
+        for cm in cmidrules:
+            line[starts[cm.start - 1] : starts[cm.end] - len(SEP)] = "-" * (
+                starts[cm.end] - len(SEP) - starts[cm.start - 1]
+            )
+        return "".join(line).rstrip()
+
+    lines = ["=" * total]
+    for spans in rows:
+        if isinstance(spans, list):
+            texts = [
+                pad(text, starts[col + n] - len(SEP) - starts[col], align)
+                for col, n, text, align, _ in spans
+            ]
+            lines.append(SEP.join(texts).rstrip())
+        elif isinstance(spans, Cmidrules):
+            lines.append(cmidrule_line(spans.values))
+        elif isinstance(spans, Cmidrule):
+            lines.append(cmidrule_line([spans]))
+        elif (char := RULE_CHARS.get(type(spans))) is not None:
+            lines.append(char * total)
+    lines.append("=" * total)
+    return "\n".join(lines)
+
+
+def markdown_rule(width: int, align: str) -> str:
+    """Delimiter of a Markdown column, e.g. `:---:` for a centered one."""
+    if align == "c":
+        return ":" + "-" * (width - 2) + ":"
+    if align == "r":
+        return "-" * (width - 1) + ":"
+    return ":" + "-" * (width - 1)
+
+
+def render_markdown(tab: Table) -> str:
+    """Render `tab` as a Markdown (GitHub flavored) pipe table.
+
+    The rows above the first midrule are the header; as Markdown has a single
+    header row, the first one becomes the header and the others the first
+    rows of the body. Markdown has no spans: the value of a multicolumn or
+    multirow cell is shown in its first column or row. Rules are left out.
+    """
+    ncols = tab.ncols
+    aligns = column_aligns(tab.align, ncols)
+    header: list[list[str]] = []
+    body: list[list[str]] = []
+    out = header
+    for spans in row_spans(tab.rows, aligns):
+        if isinstance(spans, Midrule):
+            out = body
+        if not isinstance(spans, list):
+            continue
+        texts = [""] * ncols
+        for col, _, text, _, _ in spans:
+            texts[col] = text.replace("|", r"\|")
+        out.append(texts)
+    if out is header:
+        # No midrule, hence no header
+        header, body = [], header
+    rows = [*header, *body] if header else [[""] * ncols, *body]
+    widths = [max(3, *(len(row[j]) for row in rows)) for j in range(ncols)]
+    rules = [markdown_rule(w, a) for w, a in zip(widths, aligns)]
+
+    def line(texts: list[str]) -> str:
+        return "| " + " | ".join(t.ljust(w) for t, w in zip(texts, widths)) + " |"
+
+    return "\n".join([line(rows[0]), line(rules), *map(line, rows[1:])])
+
+
+def css_color(color: str) -> str:
+    """CSS color of an xcolor color, e.g. `red`, `gray!20` or `red!30!blue`.
+
+    Mixtures become `color-mix()`; as in xcolor a missing last color is white.
+    """
+    name, *mix = color.split("!")
+    for k in range(0, len(mix), 2):
+        other = mix[k + 1] if k + 1 < len(mix) else "white"
+        name = f"color-mix(in srgb, {name} {mix[k]}%, {other})"
+    return name
+
+
+def html_cell(span: Span, border: bool) -> str:
+    """The `<td>` of `span`, with a top border if `border`."""
+    _, n, text, align, cell = span
+    attrs = f' colspan="{n}"' if n > 1 else ""
+    if cell is not None and cell.multirow > 1:
+        attrs += f' rowspan="{cell.multirow}"'
+    styles = [f"text-align: {HTML_ALIGNS.get(align, 'center')}"]
+    if isinstance(cell, ColoredCell):
+        styles.append(f"background-color: {css_color(cell.color)}")
+    if border:
+        styles.append("border-top: 1px solid")
+    text = html.escape(text)
+    if cell is not None and cell.style == "bold":
+        text = "<b>" + text + "</b>"
+    elif cell is not None and cell.style == "italic":
+        text = "<i>" + text + "</i>"
+    return f'<td{attrs} style="{html.escape("; ".join(styles))}">{text}</td>'
+
+
+def render_html(tab: Table) -> str:
+    """Render `tab` as an HTML table.
+
+    Multicolumn cells get a `colspan` and multirow cells a `rowspan`; the
+    cells they cover are left out. Rules become top borders of the next row,
+    or of the cells under a cmidrule, and the table has the top and bottom
+    rule of `Table.render`. `ColoredRow` and `ColoredCell` colors become
+    background colors. Values are number formatted but not LaTeX escaped.
+    """
+    aligns = column_aligns(tab.align, tab.ncols)
+    # Number of rows each column is still covered by a multirow cell
+    covered = [0] * tab.ncols
+    styles: list[str] = []
+    cmidrules: list[Cmidrule] = []
+    trs: list[tuple[list[str], list[str]]] = []
+    for spans in row_spans(tab.rows, aligns):
+        if isinstance(spans, Cmidrules):
+            cmidrules.extend(spans.values)
+        elif isinstance(spans, Cmidrule):
+            cmidrules.append(spans)
+        elif isinstance(spans, ColoredRow):
+            styles.append(f"background-color: {css_color(spans.color)}")
+        elif not isinstance(spans, list):
+            if (border := RULE_BORDERS.get(type(spans))) is not None:
+                styles.append(f"border-top: {border}")
+        else:
+            tds = []
+            for span in spans:
+                col, n, *_ = span
+                if covered[col] > 0:
+                    continue
+                ruled = any(
+                    cm.start - 1 <= col and col + n <= cm.end for cm in cmidrules
+                )
+                tds.append(html_cell(span, ruled))
+                if (cell := span[4]) is not None and cell.multirow > 1:
+                    covered[col : col + n] = [cell.multirow] * n
+            trs.append((styles, tds))
+            covered = [max(k - 1, 0) for k in covered]
+            styles, cmidrules = [], []
+    if styles and trs:
+        # A rule below the last row
+        trs[-1][0].extend(
+            f.replace("border-top", "border-bottom")
+            for f in styles
+            if f.startswith("border-top")
+        )
+    lines = [HTML_TABLE, "<tbody>"]
+    for tr_styles, tds in trs:
+        style = html.escape("; ".join(tr_styles))
+        attrs = f' style="{style}"' if style else ""
+        lines.append(f"<tr{attrs}>" + "".join(tds) + "</tr>")
+    lines += ["</tbody>", "</table>"]
+    return "\n".join(lines)
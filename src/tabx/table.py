@@ -1,23 +1,30 @@
 from __future__ import annotations
 
+import bisect
 import dataclasses
 import dataclasses as dc
 import itertools as it
 import operator
+import os
+import sys
+import threading
 from abc import ABC, abstractmethod
 from collections import abc
 from collections.abc import Sequence
-from copy import deepcopy
-from dataclasses import dataclass
+from copy import copy
+from dataclasses import dataclass, field
 from functools import reduce
 from itertools import chain
 from os import PathLike
 from pathlib import Path
 from typing import (
+    IO,
     Any,
     Callable,
     Iterable,
+    Iterator,
     Literal,
+    NamedTuple,
     Self,
     TypeAlias,
     TypeVar,
@@ -26,6 +33,9 @@ from typing import (
     overload,
 )
 
+from tabx.formatting import NumberFormat, column_formats
+from tabx.text import escape_latex
+
 PathArg: TypeAlias = str | PathLike[str]
 
 __all__ = [
@@ -48,15 +58,109 @@ __all__ = [
     "Row",
     "Rule",
     "Table",
+    "TableExpr",
     "concat",
+    "lazy",
 ]
 
 # type alias notation >= 3.12
 type TableRow = Row | Cmidrule | Cmidrules | Rule
 type NumOrStr = int | float | str
+type Index = int | slice | Sequence[int] | Sequence[bool]
+
+
+type Style = Literal["math", "bold", "italic", "none"]
+
+STYLES: tuple[Style, ...] = ("math", "bold", "italic", "none")
+
+
+class IncrementalRender(NamedTuple):
+    """Result of `Table.render_incremental`."""
+
+    text: str
+    """The rendered table."""
+    changed: bool
+    """Whether `text` differs from the previous output."""
+    rendered_rows: int
+    """Number of rows rendered anew; the others were reused."""
+
+
+class CellFormat(NamedTuple):
+    """Formatting options of a `Cell` that are mostly left at their default."""
+
+    style: Style = "none"
+    colspec: str = "c"
+    vpos: str = ""
+    vmove: str = ""
+    width: str = "*"
+    number_format: NumberFormat | None = None
+    escape: bool = False
+
+
+CELL_FORMATS: list[CellFormat] = [CellFormat()]
+"""Interned cell formats; a `Cell` stores the index of its format."""
+CELL_FORMAT_CODES: dict[CellFormat, int] = {CellFormat(): 0}
+CELL_FORMAT_LOCK = threading.Lock()
+
+
+def cell_format_code(fmt: tuple) -> int:
+    """Returns the code of `fmt`, interning it if it is new.
+
+    `fmt` is a `CellFormat` or a plain tuple of its fields.
+    """
+    code = CELL_FORMAT_CODES.get(fmt)  # type: ignore[call-overload]
+    if code is not None:
+        return code
+    fmt = CellFormat(*fmt)
+    if fmt.style not in STYLES:
+        raise ValueError(f"Unknown style: {fmt.style}")
+    with CELL_FORMAT_LOCK:
+        code = CELL_FORMAT_CODES.get(fmt)
+        if code is None:
+            code = len(CELL_FORMATS)
+            CELL_FORMATS.append(fmt)
+            CELL_FORMAT_CODES[fmt] = code
+    return code
+
+
+def slot_names(cls: type) -> tuple[str, ...]:
+    """Names of all slots of `cls` and its bases."""
+    names = []
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get("__slots__", ())
+        names.extend([slots] if isinstance(slots, str) else slots)
+    return tuple(names)
+
+
+def format_property(field: str) -> property:
+    """Property reading and writing `field` of the cell's interned format."""
+
+    def fget(self: Cell):
+        return getattr(CELL_FORMATS[self._fmt], field)
+
+    def fset(self: Cell, value):
+        fmt = CELL_FORMATS[self._fmt]._replace(**{field: value})
+        self._fmt = cell_format_code(fmt)
+        self._rendered = None
+
+    return property(fget, fset, doc=f"The `{field}` of the cell.")
+
+
+CACHED_RENDER = operator.attrgetter("_rendered")
+"""Cached render of a cell; `None` if the cell changed since rendered."""
+
+
+def render_property(slot: str, doc: str) -> property:
+    """Property for the attribute stored in `slot` that resets cached renders
+    when set."""
+
+    def fset(self: Cell, value):
+        setattr(self, slot, value)
+        self._rendered = None
+
+    return property(operator.attrgetter(slot), fset, doc=doc)
 
 
-@dataclass
 class Cell:
     """
     A cell in a table with optional formatting and spanning behavior.
@@ -76,6 +180,10 @@ class Cell:
     - `multirow`: Number of rows this cell spans.
     - `width`: Width specification for multirow cells (LaTeX syntax, e.g.,
                                                      '*', '2cm').
+    - `number_format`: `NumberFormat` turning a numeric value into text when
+      rendered; by default `str(value)`.
+    - `escape`: Escape LaTeX special characters of a string value when
+      rendered, e.g. for free-text labels.
 
     Raises:
     - ValueError: If both multicolumn and multirow are greater than 1.
@@ -91,62 +199,150 @@ class Cell:
     ```
     """
 
-    value: NumOrStr
-    name: str = dc.field(
-        default="",
-        init=True,
-        repr=True,
-        metadata={"help": "The name of the cell, used for identification."},
-    )
-    style: Literal["math", "bold", "italic", "none"] = "none"
-    multicolumn: int = 1
-    colspec: Literal["l", "c", "r"] = "c"
-    multirow: int = 1
-    vpos: Literal["c", "t", "b", ""] = ""  # vertical position for multirow
-    vmove: str = ""  # vertical move for multirow
-    width: str = "*"  # for multirow width ("*", "2cm", etc.)
+    __slots__ = ("_value", "name", "_multicolumn", "_multirow", "_fmt", "_rendered")
+
+    name: str
+    _value: NumOrStr
+    _multicolumn: int
+    _multirow: int
+    _fmt: int
+    """Code of the cell's `CellFormat` in `CELL_FORMATS`."""
+    _rendered: str | None
+    """Cached output of `render`; reset when the cell changes."""
+
+    def __init__(
+        self,
+        value: NumOrStr,
+        name: str = "",
+        style: Style = "none",
+        multicolumn: int = 1,
+        colspec: Literal["l", "c", "r"] = "c",
+        multirow: int = 1,
+        vpos: Literal["c", "t", "b", ""] = "",  # vertical position for multirow
+        vmove: str = "",  # vertical move for multirow
+        width: str = "*",  # for multirow width ("*", "2cm", etc.)
+        number_format: NumberFormat | None = None,
+        escape: bool = False,
+    ):
+        self._value = value
+        self.name = name
+        self._multicolumn = multicolumn
+        self._multirow = multirow
+        self._fmt = cell_format_code(
+            (style, colspec, vpos, vmove, width, number_format, escape)
+        )
+        self._rendered = None
+        self.__post_init__()
+
+    value = render_property("_value", "The displayed value of the cell.")
+    multicolumn = render_property("_multicolumn", "Number of columns spanned.")
+    multirow = render_property("_multirow", "Number of rows spanned.")
+
+    style = format_property("style")
+    colspec = format_property("colspec")
+    vpos = format_property("vpos")
+    vmove = format_property("vmove")
+    width = format_property("width")
+    number_format = format_property("number_format")
+    escape = format_property("escape")
+
+    def _key(self) -> tuple:
+        return (
+            self._value,
+            self.name,
+            self._multicolumn,
+            self._multirow,
+            CELL_FORMATS[self._fmt],
+        )
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return self._key() == other._key()
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Format codes are local to the process; pickle the format itself
+        state = {
+            name: getattr(self, name)
+            for name in slot_names(type(self))
+            if hasattr(self, name)
+        }
+        state["_fmt"] = tuple(CELL_FORMATS[self._fmt])
+        state["_rendered"] = None
+        state.update(getattr(self, "__dict__", {}))
+        return state
+
+    def __setstate__(self, state: dict[str, Any]):
+        for name, value in state.items():
+            if name != "_fmt":
+                object.__setattr__(self, name, value)
+        self._fmt = cell_format_code(state["_fmt"])
 
     def __repr__(self) -> str:
         if self.name:
-            return f'Cell(name="{self.name}", value="{self.value}", multirow={self.multirow}, multicolumn={self.multicolumn})'
-        return f'Cell(value="{self.value}", multirow={self.multirow}, multicolumn={self.multicolumn})'
+            return f'Cell(name="{self.name}", value="{self._value}", multirow={self._multirow}, multicolumn={self._multicolumn})'
+        return f'Cell(value="{self._value}", multirow={self._multirow}, multicolumn={self._multicolumn})'
 
     def __post_init__(self):
-        if self.multicolumn <= 0:
+        if self._multicolumn <= 0:
             raise ValueError("Cannot have multicolumn <= 0")
-        if self.multirow <= 0:
+        if self._multirow <= 0:
             raise ValueError("Cannot have multirow <= 0")
 
-        if self.multicolumn > 1 and self.multirow > 1:
+        if self._multicolumn > 1 and self._multirow > 1:
             raise ValueError(
                 "Cell cannot be both multicolumn and multirow at the same time."
             )
 
     def __len__(self) -> int:
-        if self.multicolumn > 1:
-            return self.multicolumn
+        if self._multicolumn > 1:
+            return self._multicolumn
         return 1
 
     def clen(self) -> int:
         """Return the number of rows in a column this cell occupies."""
-        return self.multirow
+        return self._multirow
 
     def is_multirow(self) -> bool:
         """Return True if this cell is a multirow cell."""
-        return self.multirow > 1
+        return self._multirow > 1
 
     def is_multicolumn(self) -> bool:
         """Return True if this cell is a multicolumn cell."""
-        return self.multicolumn > 1
+        return self._multicolumn > 1
 
     def is_empty(self) -> bool:
-        """Return True if this cell is empty."""
-        return not self.value
+        """Return True if this cell is empty; a value of 0 is not empty."""
+        value = self._value
+        return value is None or (isinstance(value, str) and not value)
+
+    def text(self) -> str:
+        """The value as text, formatted by `number_format` if set.
+
+        With `escape` the special characters of a string value are escaped,
+        see `tabx.text.escape_latex`; the value itself is kept as is.
+        """
+        fmt = CELL_FORMATS[self._fmt]
+        value = self._value
+        if fmt.escape and isinstance(value, str):
+            value = escape_latex(value)
+        if fmt.number_format is None:
+            return str(value)
+        return fmt.number_format.format(value)
 
     def render(self) -> str:
-        text = str(self.value)
+        text = self._rendered
+        if text is None:
+            text = self._rendered = self._render()
+        return text
 
-        match self.style:
+    def _render(self) -> str:
+        text = self.text()
+        fmt = CELL_FORMATS[self._fmt]
+
+        match fmt.style:
             case "math":
                 text = r"$" + text + r"$"
             case "bold":
@@ -156,28 +352,28 @@ class Cell:
             case "none":
                 pass
             case _:
-                raise ValueError(f"Unknown style: {self.style}")
+                raise ValueError(f"Unknown style: {fmt.style}")
 
         # Apply multicolumn
-        if self.multicolumn > 1:
+        if self._multicolumn > 1:
             text = (
                 r"\multicolumn{"
-                + str(self.multicolumn)
+                + str(self._multicolumn)
                 + "}{"
-                + self.colspec
+                + fmt.colspec
                 + "}{"
                 + text
                 + "}"
             )
 
         # Apply multirow
-        if self.multirow > 1:
+        if self._multirow > 1:
             # \\multirow[〈vpos〉]{〈nrows〉}{〈width〉}[〈vmove〉]{〈text〉}
             parts = [
-                f"[{self.vpos}]" if self.vpos else "",
-                f"{{{str(self.multirow)}}}",
-                f"{{{self.width}}}" if self.width else "",
-                f"[{self.vmove}]" if self.vmove else "",
+                f"[{fmt.vpos}]" if fmt.vpos else "",
+                f"{{{str(self._multirow)}}}",
+                f"{{{fmt.width}}}" if fmt.width else "",
+                f"[{fmt.vmove}]" if fmt.vmove else "",
                 f"{{{text}}}",
             ]
             text = r"\multirow" + "".join(parts)
@@ -185,6 +381,8 @@ class Cell:
         return text
 
     def __truediv__(self: Self, other):
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, (Table, Columns)):
             return other.prepend_row(Row([self]))
         if isinstance(other, Cell):
@@ -205,6 +403,8 @@ class Cell:
     def __or__(self: Self, other: Sequence[Cell]) -> Table: ...
 
     def __or__(self: Self, other):
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, (Cmidrule, Cmidrules, Midrule)):
             raise TypeError(
                 f"unsupported operand type(s) for |: '{type(self).__name__}' "
@@ -233,6 +433,8 @@ class ColoredCell(Cell):
     Requires the `xcolor` package in LaTeX.
     """
 
+    __slots__ = ("_color",)
+
     def __init__(
         self,
         value: str,
@@ -244,18 +446,22 @@ class ColoredCell(Cell):
         super().__init__(
             name=name, value=value, multicolumn=multicolumn, multirow=multirow
         )
-        self.color = color
+        self._color = color
+
+    color = render_property("_color", "The background color of the cell.")
 
     def __repr__(self) -> str:
         if self.name:
             return f"ColoredCell(name={self.name}, color={self.color})"
         return f"ColoredCell(color={self.color})"
 
-    def render(self) -> str:
-        return r"\cellcolor{" + self.color + "}" + super().render()
+    def _render(self) -> str:
+        return r"\cellcolor{" + self.color + "}" + super()._render()
 
 
 class EmptyCell(Cell):
+    __slots__ = ()
+
     def __init__(self, name: str = ""):
         super().__init__(name=name, value="", multicolumn=1, multirow=1)
 
@@ -264,22 +470,26 @@ class EmptyCell(Cell):
             return f"EmptyCell(name={self.name})"
         return "EmptyCell()"
 
-    def render(self) -> str:
+    def _render(self) -> str:
         return ""
 
 
 class Placeholder(Cell):
+    __slots__ = ()
+
     def __init__(self, name: str = ""):
         super().__init__(name=name, value="", multicolumn=1, multirow=1)
 
     def __repr__(self) -> str:
         return f"PlaceholderCell(name={self.name})"
 
-    def render(self) -> str:
+    def _render(self) -> str:
         return ""
 
 
 class MrEmptyCell(Cell):
+    __slots__ = ("mr",)
+
     def __init__(self, name: str = "", mr: MultirowCell | None = None):
         super().__init__(name=name, value="", multicolumn=1, multirow=1)
         self.mr = mr
@@ -298,11 +508,13 @@ class MrEmptyCell(Cell):
         self.mr.decrease()
         self.mr = None
 
-    def render(self) -> str:
+    def _render(self) -> str:
         return ""
 
 
 class MultirowCell(Cell):
+    __slots__ = ("empty_cells",)
+
     def __init__(
         self,
         value: NumOrStr,
@@ -327,15 +539,10 @@ class MultirowCell(Cell):
 
     @classmethod
     def from_cell(cls, cell: Cell):
-        return cls(
-            name=cell.name,
-            value=cell.value,
-            multirow=cell.multirow,
-            vpos=cell.vpos,
-            vmove=cell.vmove,
-            width=cell.width,
-            style=cell.style,
-        )
+        """Multirow cell with the value, span and full format of `cell`."""
+        new = cls(name=cell.name, value=cell.value, multirow=cell.multirow)
+        new._fmt = cell._fmt
+        return new
 
     def __repr__(self) -> str:
         return f"MultirowCell(name={self.name}, value={self.value}, multirow={self.multirow})"
@@ -546,6 +753,28 @@ class Cmidrule:
             raise ValueError(f"Out of bounds {start=}, {end=}")
         return Cmidrule(start=start, end=end, trim=self.trim)
 
+    def clip(self, start: int, stop: int, base: int = 0) -> Cmidrule | None:
+        """Part of the cmidrule inside the 0-indexed columns [start, stop).
+
+        The part is moved `base` columns to the left. Returns `None` if the
+        cmidrule is outside the columns or would be moved before the first
+        column.
+        """
+        lo, hi = max(self.start - 1, start), min(self.end, stop)
+        if lo >= hi or lo < base:
+            return None
+        return Cmidrule(
+            start=lo + 1 - base, end=hi - base, trim=self.trim, dim=self.dim
+        )
+
+    def shift(self, n: int) -> Cmidrule:
+        """The cmidrule moved `n` columns to the right."""
+        if not n:
+            return self
+        return Cmidrule(
+            start=self.start + n, end=self.end + n, trim=self.trim, dim=self.dim
+        )
+
     def __sub__(self, other: Cmidrule | int | tuple[int, int]):
         """
         Adding two Cmidrules should result in a Cmidrules object.
@@ -585,6 +814,8 @@ class Cmidrule:
     def __truediv__(self: Self, other) -> Table: ...
 
     def __truediv__(self: Self, other):
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, (Table, Columns)):
             return other.prepend_row(self)
         if isinstance(other, Row):
@@ -622,12 +853,18 @@ class Cmidrule:
 
 @dataclass
 class Cmidrules:
-    """A collection of Cmidrules."""
+    """A collection of Cmidrules.
+
+    The cmidrules are kept sorted by column and, being disjoint, so are
+    their ends; `_starts` and `_ends` index them for bisection.
+    """
 
     values: list[Cmidrule]
 
     start: int = dataclasses.field(init=False)
     end: int = dataclasses.field(init=False)
+    _starts: list[int] = dataclasses.field(init=False, repr=False, compare=False)
+    _ends: list[int] = dataclasses.field(init=False, repr=False, compare=False)
 
     def __repr__(self) -> str:
         return f"Cmidrules(#cmidrules={len(self.values)})"
@@ -639,20 +876,36 @@ class Cmidrules:
         return "\n".join(cmidrule.render_base() for cmidrule in self.values)
 
     def __post_init__(self):
-        # check overlap
-        for cm1, cm2 in it.combinations(self.values, 2):
-            cond = interval_conditions(cm1.interval, cm2.interval)
-            if not cond.condition == "none":
+        self.values = sorted(self.values, key=operator.attrgetter("start"))
+        # check overlap; sorted by start only neighbours can overlap
+        for cm1, cm2 in zip(self.values, self.values[1:]):
+            if cm2.start <= cm1.end:
                 raise ValueError(f"Cmidrules {cm1=} and {cm2=} overlap.")
+        self._index()
+
+    @classmethod
+    def _from_sorted(cls, values: list[Cmidrule]) -> Cmidrules:
+        """Construct from cmidrules known to be sorted and disjoint."""
+        obj = cls.__new__(cls)
+        obj.values = values
+        obj._index()
+        return obj
+
+    def _index(self):
+        self._starts = [cmidrule.start for cmidrule in self.values]
+        self._ends = [cmidrule.end for cmidrule in self.values]
         if self.values:  # Else empty cmidrule
-            self.start = min(self.values, key=operator.attrgetter("start")).start
-            self.end = max(self.values, key=operator.attrgetter("end")).end
-            self.values = sorted(self.values, key=operator.attrgetter("start"))
+            self.start = self._starts[0]
+            self.end = self._ends[-1]
+
+    def shift(self, n: int) -> Cmidrules:
+        """The cmidrules moved `n` columns to the right."""
+        if not n:
+            return self
+        return Cmidrules._from_sorted([cmidrule.shift(n) for cmidrule in self.values])
 
     def clen(self) -> int:
-        max_end = max(self.values, key=operator.attrgetter("end")).end
-        min_start = min(self.values, key=operator.attrgetter("start")).start
-        return max_end - min_start + 1
+        return self._ends[-1] - self._starts[0] + 1
 
     def __getitem__(
         self,
@@ -661,19 +914,35 @@ class Cmidrules:
     ) -> Cmidrules:
         """
         Cmidrules are 1-indexed in latex
+
+        The cmidrules overlapping the index are found by bisection and
+        clipped to it. With `standardize` an integer the clipped cmidrules
+        are moved that many columns to the left; with `True` each one is
+        moved to start at the first column.
         """
 
         if isinstance(index, int):
             index = standardize_index(index, len(self))
+            k = bisect.bisect_right(self._starts, index + 1) - 1
+            if k >= 0 and index < self._ends[k]:
+                return Cmidrules([Cmidrule(start=1, end=1, trim=self.values[k].trim)])
+            return Cmidrules([])
 
+        start, stop, _ = slice(index.start, index.stop).indices(
+            self.end if self.values else 0
+        )
+        lo = bisect.bisect_right(self._ends, start)
+        hi = bisect.bisect_right(self._starts, stop)
         cmids = []
-        for cmidrule in self.values:
-            try:
-                cmids.append(cmidrule.__getitem__(index, standardize=standardize))
-            except (ValueError, IndexError):
-                pass
-        if not cmids and isinstance(index, slice):
-            return Cmidrules([])
+        for cmidrule in self.values[lo:hi]:
+            if standardize is True:
+                base = max(start, 1, cmidrule.start - 1)
+            elif isinstance(standardize, int):
+                base = standardize
+            else:
+                base = 0
+            if (clipped := cmidrule.clip(start, stop, base)) is not None:
+                cmids.append(clipped)
         return Cmidrules(values=cmids)
 
     def print(self):
@@ -696,6 +965,8 @@ class Cmidrules:
     def __truediv__(self: Self, other) -> Table: ...
 
     def __truediv__(self: Self, other):
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, (Table, Columns)):
             return other.prepend_row(self)
         if isinstance(other, Cell):
@@ -736,6 +1007,8 @@ class Rule(ABC):
         return self
 
     def __truediv__(self, other: Table | Columns):
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, Row):
             return Table([self, other])
         if isinstance(other, Cell):
@@ -875,11 +1148,18 @@ LenMeasure = Literal["column", "row"]
 
 
 def slice_cells(
-    cells: Sequence[Cell], sl: slice, len_measure: LenMeasure = "column"
+    cells: Sequence[Cell],
+    sl: slice,
+    len_measure: LenMeasure = "column",
+    offsets: list[int] | None = None,
 ) -> Sequence[Cell]:
     """
     Slices cells.
 
+    `offsets` are the cells' column offsets (see `Row.offsets`) and are
+    computed from `len_measure` if not given. The first and last cell in
+    the slice are found by bisection; only those two can be clipped, the
+    cells in between are copied as one slice of `cells`.
     """
     if (sl.step or 1) > 1:  # Hack for getattr not having default value option
         raise ValueError(
@@ -887,60 +1167,44 @@ def slice_cells(
             "Go outside and get some fresh air."
         )
 
-    start, stop = sl.start, sl.stop
+    if offsets is None:
+        if len_measure == "column":
+            lens = [len(f) for f in cells]
+        else:
+            lens = [f.clen() for f in cells]
+        offsets = [0, *it.accumulate(lens)]
 
-    if (isinstance(start, int) and isinstance(stop, int)) and (start == stop):
+    start, stop, _ = slice(sl.start, sl.stop).indices(offsets[-1])
+    if start >= stop:
         # e.g. degenerate slice(0, 0), slice(1, 1) etc..
-
         return []
 
-    if len_measure == "column":
-        lens = [len(f) for f in cells]
-    else:
-        lens = [f.clen() for f in cells]
-
-    if not isinstance(start, int):
-        start = 0
-    if not isinstance(stop, int):
-        stop = sum(lens)  # 0-indexed
-
-    cs = cumsum(lens)
-    idc_s = [0] + cs[:-1]
-    idcs = [(s, s + e) for s, e in zip(idc_s, lens)]
-    idc_to_f = {idc: i for i, idc in enumerate(idcs)}
+    first = bisect.bisect_right(offsets, start) - 1
+    last = bisect.bisect_left(offsets, stop) - 1
 
-    # Get the cells that are in the slice
-    slice_cells = []
-    for idc, i in idc_to_f.items():
+    def clip(i: int) -> list[Cell]:
         f = cells[i]
-        is_mc, is_mr = f.is_multicolumn(), f.is_multirow()
-        if is_subint(idc, (start, stop)):
+        istart, istop = offsets[i], offsets[i + 1]
+        if is_subint((istart, istop), (start, stop)):
             # Cell is inside slice interval
-            slice_cells.append(f)
-        elif is_mc or is_mr:
-            istart, istop = idc
-            ic = interval_conditions((istart, istop), (start, stop))
-            match ic.condition:
-                case "center" | "left" | "right":
-                    if is_mc:
-                        slice_cells.append(
-                            Cell(
-                                name=f.name,
-                                value=f.value,
-                                multicolumn=ic.diff(),
-                            )
-                        )
-                    elif is_mr:
-                        slice_cells.append(
-                            Cell(
-                                name=f.name,
-                                value=f.value,
-                                multirow=ic.diff(),
-                            )
-                        )
-                case "none":
-                    pass
-    return slice_cells
+            return [f]
+        diff = min(istop, stop) - max(istart, start)
+        # Clipped copies keep the cell's type and format
+        if f.is_multicolumn():
+            new = copy(f)
+            new.multicolumn = diff
+            return [new]
+        if f.is_multirow():
+            new = copy(f)
+            new.multirow = diff
+            if isinstance(new, MultirowCell):
+                new.empty_cells = []
+            return [new]
+        return []
+
+    if first == last:
+        return clip(first)
+    return [*clip(first), *cells[first + 1 : last], *clip(last)]
 
 
 def is_contiguous(idc_rest: list[int]):
@@ -981,76 +1245,273 @@ def slice_from_set(rest: set[int]) -> slice | list[slice]:
     return slices_from_indices(idc_rest)
 
 
-def slice_array(array: list[list[Cell]], sl: slice) -> list[list[Cell]]:
-    array = deepcopy(array)  # If we slice multiple times in repl
+type CellPosition = tuple[int, int]
+"""Row and cell index of a cell in a list of rows of cells."""
+type SpanCut = tuple[MultirowCell, list[CellPosition], int]
+"""Multirow cell, positions of its selected cells and its new multirow."""
+
+
+def column_cell_index(cells: Sequence[Cell], col: int) -> int | None:
+    """Index of the cell covering column `col`; `None` if out of bounds."""
+    visited = 0
+    for j, cell in enumerate(cells):
+        visited += len(cell)
+        if visited > col:
+            return j
+    return None
+
+
+def walk_span(
+    selected: list[list[Cell] | None],
+    rows: range,
+    col: int,
+    mr: MultirowCell,
+) -> list[CellPosition]:
+    """Positions of the cells of `mr`'s span at column `col` along `rows`.
 
-    # Slice array
-    idc = list(range(len(array)))
-    idc_sl = idc[sl]
-    idc_rest = set(idc) - set(idc_sl)
+    Walks until a row holding a cell outside the span; rows without cells
+    are skipped. The multirow cell itself starts the span: walking upwards
+    it is the last cell of the walk, walking downwards it starts another
+    span of the same cell, e.g. of a table joined with itself.
+    """
+    positions = []
+    for i in rows:
+        if (cells := selected[i]) is None:
+            continue
+        j = column_cell_index(cells, col)
+        if j is None:
+            break
+        cell = cells[j]
+        if cell is mr and rows.step > 0:
+            break
+        if not (cell is mr or isinstance(cell, MrEmptyCell) and cell.mr is mr):
+            break
+        positions.append((i, j))
+        if cell is mr:
+            break
+    return positions
+
+
+def boundary_spans(selected: list[list[Cell] | None]) -> list[SpanCut]:
+    """Multirow spans crossing the boundary of a contiguous slice.
+
+    Only the first and last rows with cells are scanned: a span crossing the
+    top has a linked `MrEmptyCell` in the first row and a span crossing the
+    bottom has its cells in the last row. The rows of a crossing span are
+    then found by walking its column. Spans are told apart by their rows,
+    not their cells, as joined tables may share a multirow cell between
+    several spans.
+    """
+    n = len(selected)
+    first = next((i for i in range(n) if selected[i] is not None), None)
+    if first is None:
+        return []
+    last = next(i for i in reversed(range(n)) if selected[i] is not None)
+
+    cuts: list[SpanCut] = []
+    col = 0
+    for cell in cast(list[Cell], selected[first]):
+        if isinstance(cell, MrEmptyCell) and cell.mr is not None:
+            positions = walk_span(selected, range(first, n), col, cell.mr)
+            multirow = positions[-1][0] - first + 1
+            cuts.append((cell.mr, positions, multirow))
+        col += len(cell)
+
+    col = 0
+    for cell in cast(list[Cell], selected[last]):
+        col, ccol = col + len(cell), col
+        if isinstance(cell, MultirowCell):
+            mr = cell
+        elif isinstance(cell, MrEmptyCell) and cell.mr is not None:
+            mr = cell.mr
+        else:
+            continue
+        positions = walk_span(selected, range(last, -1, -1), ccol, mr)
+        i, j = positions[-1]
+        # Without its multirow cell the span crosses the top as well
+        if selected[i][j] is not mr or i + mr.multirow <= n:  # type: ignore[index]
+            continue
+        cuts.append((mr, positions[::-1], n - i))
+    return cuts
+
+
+def holds_cell(row: Sequence[Cell] | TableRow, cell: Cell) -> bool:
+    """Whether `row`, a `Row` or its cells, holds `cell` itself."""
+    cells = row.cells if isinstance(row, Row) else row
+    return isinstance(cells, abc.Sequence) and any(f is cell for f in cells)
+
+
+def scan_spans(
+    selected: list[list[Cell] | None],
+    idc: Sequence[int],
+    rows: Sequence[Sequence[Cell] | TableRow],
+) -> list[SpanCut]:
+    """Multirow spans of a gathered selection of rows.
+
+    `idc` are the indices of the selected rows in the sliced `rows`. Every
+    cell is scanned and each span is split into runs of selected rows that
+    follow each other within the span in the sliced rows, with only rows
+    without cells from inside the span in between. A multirow cell shared by
+    several spans, e.g. of a table joined with itself, starts a new span in
+    each row of `rows` holding it. Runs that keep a whole span in place are
+    skipped.
+    """
+    spans: dict[int, tuple[MultirowCell, list[CellPosition]]] = {}
+    for i, cells in enumerate(selected):
+        if cells is None:
+            continue
+        for j, cell in enumerate(cells):
+            if isinstance(cell, MultirowCell):
+                mr = cell
+            elif isinstance(cell, MrEmptyCell) and cell.mr is not None:
+                mr = cell.mr
+            else:
+                continue
+            if (span := spans.get(id(mr))) is None:
+                span = spans[id(mr)] = (mr, [])
+            span[1].append((i, j))
 
-    # Elements that weren't sliced
-    sl_rest = slice_from_set(idc_rest)
+    def follows(mr: MultirowCell, prev: int, i: int) -> bool:
+        lo, hi = idc[prev], idc[i]
+        return (
+            lo < hi < lo + mr.multirow
+            and all(
+                selected[k] is None and lo < idc[k] < hi for k in range(prev + 1, i)
+            )
+            and not any(holds_cell(rows[k], mr) for k in range(lo + 1, hi + 1))
+        )
 
-    if isinstance(sl_rest, list):
-        rest = [subarr for slr in sl_rest for subarr in array[slr]]
+    cuts = []
+    for mr, positions in spans.values():
+        runs = [[positions[0]]]
+        for pos in positions[1:]:
+            if follows(mr, runs[-1][-1][0], pos[0]):
+                runs[-1].append(pos)
+            else:
+                runs.append([pos])
+        for run in runs:
+            (i, j), last = run[0], run[-1][0]
+            multirow = last - i + 1
+            if selected[i][j] is mr and multirow == mr.multirow:  # type: ignore[index]
+                continue
+            cuts.append((mr, run, multirow))
+    return cuts
+
+
+def repair_multirow_spans(
+    selected: list[list[Cell] | None],
+    idc: Sequence[int] | None = None,
+    rows: Sequence[Sequence[Cell] | TableRow] = (),
+) -> set[int]:
+    """Rewrites the multirow spans cut by a slice of rows in place.
+
+    Returns the indices of the rows whose cells were replaced.
+
+    `selected` holds the cells of the selected rows (`None` for rows without
+    cells) as fresh lists whose cells are shared with the sliced rows. Spans
+    lying inside the slice are kept as is. A span crossing the slice boundary
+    gets a copy of its `MultirowCell` with `multirow` reduced to the selected
+    part, placed in the first selected row of the span, and new `MrEmptyCell`s
+    linked to the copy below it. The original cells are not modified.
+
+    For a contiguous selection only the crossing spans are visited, see
+    `boundary_spans`. Otherwise `idc` are the indices of the selected rows in
+    the sliced `rows`, e.g. from a stepped slice or an index list, and every
+    span is rewritten to the rows it keeps, see `scan_spans`.
+    """
+    if idc is None:
+        cuts = boundary_spans(selected)
     else:
-        rest = array[sl_rest]
-
-    selected = array[sl]
-
-    # Check if elements in the non-selected parts are part of a multirow
-    # - if emptycell then we unlink it
-    # - if multirowcell we add it to dict for further logic below
-    mr_map: dict[MultirowCell, list[tuple[MrEmptyCell, int, int]]] = dict()
-    for i, row in enumerate(rest):
-        for ele in row:
-            if isinstance(ele, MrEmptyCell):
-                ele.unlink()
-            if isinstance(ele, MultirowCell):
-                mr_map[ele] = []
-
-    # Slice from above rows[2:] logic where multirow in rows[:2] and its
-    # empty cells inside rows[2:].
-    # Find mrempty cells in the selected slice and add them to the mr_map
-    # if their multirow has been removed by the slice
-    for i, row in enumerate(selected):
-        for j, ele in enumerate(row):
-            if isinstance(ele, MrEmptyCell):
-                if ele.mr is not None and ele.mr in mr_map:
-                    mr_map[ele.mr].append((ele, i, j))
-
-    # Swap non-selected multirows with its first empty cell in the
-    # selected part and unlink the cell.
-    for k in mr_map:
-        vals = mr_map[k]
-        if vals:
-            vals = sorted(vals, key=operator.itemgetter(1))
-            cell, i, j = min(vals, key=operator.itemgetter(1))
-            selected[i][j] = k
-            cell.unlink()
-
-    return array[sl]
+        cuts = scan_spans(selected, idc, rows)
+    touched = set()
+    for mr, positions, multirow in cuts:
+        touched.update(i for i, _ in positions)
+        i, j = positions[0]
+        new = copy(mr)
+        new.empty_cells = []
+        new.multirow = multirow
+        selected[i][j] = new  # type: ignore[index]
+        listed = {id(f) for f in mr.empty_cells}
+        for k, m in positions[1:]:
+            old = selected[k][m]  # type: ignore[index]
+            ncell = MrEmptyCell(name=old.name)
+            if id(old) in listed:
+                new.add_empty_cell(ncell)
+            else:
+                ncell.link(new)
+            selected[k][m] = ncell  # type: ignore[index]
+    return touched
 
 
-def slice_rows_horizontal(cols: Columns | Table, sl: slice):
-    """Slices each row in the columns by `sl`.
+def slice_array(
+    array: list[list[Cell]],
+    sl: slice | Sequence[int],
+) -> list[list[Cell]]:
+    """Selects rows of cells by a slice or row indices.
 
-    Corresponds to a slice across columns i.e. cols[:, n:m]
-    in familiar numpy notation.
+    The returned rows are new lists but only the cells of multirow spans cut
+    by the selection are copied; `array` is left untouched. See
+    `repair_multirow_spans`.
     """
-    rows = cols.all_rows()
+    idc = range(len(array))[sl] if isinstance(sl, slice) else sl
+    selected: list[list[Cell] | None] = [list(array[i]) for i in idc]
+    contiguous = isinstance(idc, range) and idc.step == 1
+    repair_multirow_spans(selected, None if contiguous else idc, array)
+    return cast(list[list[Cell]], selected)
+
+
+def slice_rows(rows: Iterable[TableRow], sl: slice) -> list[TableRow]:
+    """Slices each row by `sl`."""
     sliced_rows = []
     for row in rows:
-        if isinstance(row, (Cmidrule, Cmidrules)):
+        start = sl.start or 0
+        if isinstance(row, Cmidrule) and (sl.step or 1) == 1 and start < sl.stop:
+            # As for cmidrules, a cmidrule outside the slice leaves no rule
+            clipped = row.clip(start, sl.stop, start)
+            sliced_rows.append(Cmidrules([]) if clipped is None else clipped)
+        elif isinstance(row, (Cmidrule, Cmidrules)):
             # If sl.start is None we slice whole range from left hence no
             # standardization
             sliced_rows.append(row.__getitem__(sl, standardize=sl.start))
         else:
             sliced_rows.append(row[sl])
+    return sliced_rows
+
+
+def slice_rows_horizontal(cols: Columns | Table, sl: slice):
+    """Slices each row in the columns by `sl`.
+
+    Corresponds to a slice across columns i.e. cols[:, n:m]
+    in familiar numpy notation.
+    """
+    if (sl.step or 1) == 1:
+        # Relative to the columns s.t. cells and cmidrules agree on
+        # negative bounds
+        start, stop, _ = sl.indices(cols.ncols)
+        sl = slice(start, max(start, stop))
+    rows = cols.all_rows()
+    if (
+        isinstance(rows, ColumnarRows)
+        and rows.nbody
+        and (sl.step or 1) == 1
+        and not rows.is_materialized()
+    ):
+        body = rows.body_columns()[sl]
+        sliced_rows = ColumnarRows(
+            body,
+            nbody=rows.nbody,
+            head=slice_rows(rows.head, sl),
+            tail=slice_rows(rows.tail, sl),
+            formats=rows.formats[sl],
+            escapes=rows.escapes[sl],
+        )
+        return type(cols)._from_trusted(sliced_rows, "", len(body))
+    sliced_rows = slice_rows(rows, sl)
+    # Known without rows to count, e.g. when slicing columns without rows
+    ncols = sl.stop - sl.start if (sl.step or 1) == 1 else None
     if isinstance(cols, Table):
-        return Table.from_columns(columns=Columns(rows=sliced_rows))
-    return Columns(rows=sliced_rows)
+        return Table._from_trusted(sliced_rows, "", ncols)
+    return Columns._from_trusted(sliced_rows, "", ncols)
 
 
 def slice_rows_vertical(cols: Columns | Table, sl: slice):
@@ -1065,40 +1526,190 @@ def slice_rows_vertical(cols: Columns | Table, sl: slice):
             return Table.from_columns(ecols)
         return ecols
     rows = cols.all_rows()
-    array = []
-    orig = dict()
-    idc = list(range(len(rows)))
-    for i, row in enumerate(rows):
-        if isinstance(row, Row):
-            array.append(row.cells)
-        else:
-            array.append([Placeholder() for _ in range(cols.ncols)])
-            orig[i] = row
+    idc = range(len(rows))[sl]
+    if idc.step != 1:
+        return take_rows(cols, idc)
+    if (
+        isinstance(rows, ColumnarRows)
+        and not rows.is_materialized()
+        and not any(has_multirow(row) for row in chain(rows.head, rows.tail))
+    ):
+        new = rows[sl]
+        ncols = new.ncols if new.nbody else count_columns(list(new))
+        return type(cols)._from_trusted(new, cols.align, ncols)
+    return select_rows(cols, rows[sl])
 
-    new_rows = []
-    slices = slice_array(array, sl)
-    for idx, cells in zip(idc[sl], slices):
-        if idx in orig:
-            new_rows.append(orig[idx])
+
+def take_rows(cols: Columns | Table, idc: Sequence[int]):
+    """Selects the rows at indices `idc` in one pass.
+
+    Corresponds to cols[[i, j, ...]] or a stepped slice cols[n:m:k]. Multirow
+    spans are cut to the rows they keep, see `scan_spans`.
+    """
+    rows = cols.all_rows()
+    if isinstance(idc, range) and idc.step == 1:
+        return slice_rows_vertical(cols, slice(idc.start, idc.stop))
+    return select_rows(cols, [rows[i] for i in idc], idc)
+
+
+def select_rows(
+    cols: Columns | Table,
+    selected: Sequence[TableRow],
+    idc: Sequence[int] | None = None,
+):
+    """New columns over the `selected` rows of `cols`.
+
+    Rows get shells over their cells and rule rows, being immutable, are
+    shared with `cols`; see `repair_multirow_spans` for `idc`.
+    """
+    cells: list[list[Cell] | None] = [
+        list(row.cells) if isinstance(row, Row) else None for row in selected
+    ]
+    touched = repair_multirow_spans(cells, idc, cols.all_rows())
+    new_rows = [
+        row if row_cells is None else cast(Row, row)._shell(row_cells, i in touched)
+        for i, (row, row_cells) in enumerate(zip(selected, cells))
+    ]
+    # Rows without cells, e.g. a lone cmidrule, don't tell the #columns
+    ncols = cols.ncols if new_rows else None
+    if isinstance(cols, Table):
+        return Table._from_trusted(new_rows, cols.align, ncols)
+    return Columns._from_trusted(new_rows, cols.align, ncols)
+
+
+def column_runs(idc: Sequence[int]) -> list[slice]:
+    """Splits column indices into runs of consecutive columns.
+
+    E.g. [0, 1, 2, 5, 4] gives [slice(0, 3), slice(5, 6), slice(4, 5)].
+    """
+    runs: list[slice] = []
+    for i in idc:
+        if runs and runs[-1].stop == i:
+            runs[-1] = slice(runs[-1].start, i + 1)
         else:
-            new_rows.append(Row(cells=cells))
+            runs.append(slice(i, i + 1))
+    return runs
+
+
+def take_row_columns(
+    row: TableRow,
+    runs: list[slice],
+    memos: list[dict[int, tuple[MultirowCell, set[int]]] | None],
+) -> TableRow:
+    """Gathers the column `runs` of a single row.
+
+    Multicolumn cells and cmidrules are clipped to each run. Multirow cells
+    of runs with a memo, i.e. repeating columns of an earlier run, are copied
+    s.t. every group keeps its own links; see `copy_multirow_cell`.
+    """
+    if isinstance(row, Row):
+        cells: list[Cell] = []
+        offsets = row.offsets()
+        for run, memo in zip(runs, memos):
+            part = slice_cells(row.cells, run, "column", offsets)
+            if memo is not None:
+                part = [copy_multirow_cell(f, memo) for f in part]
+            cells.extend(part)
+        return Row(cells=cells)
+    if isinstance(row, (Cmidrule, Cmidrules)):
+        values = []
+        offset = 0
+        for run in runs:
+            # Move the clipped cmidrules from the run to its output columns
+            base = run.start - offset
+            if isinstance(row, Cmidrules):
+                values.extend(row.__getitem__(run, standardize=base).values)
+            elif (clipped := row.clip(run.start, run.stop, base)) is not None:
+                values.append(clipped)
+            offset += run.stop - run.start
+        if isinstance(row, Cmidrule) and len(values) == 1:
+            return values[0]
+        return Cmidrules(values)
+    return row
+
+
+def take_columns(cols: Columns | Table, idc: Sequence[int]):
+    """Selects the columns at indices `idc` in one pass over the rows.
+
+    Corresponds to cols[:, [i, j, ...]] or a stepped slice cols[:, n:m:k].
+    """
+    runs = column_runs(idc)
+    if len(runs) <= 1:
+        return slice_rows_horizontal(cols, runs[0] if runs else slice(0, 0))
+    seen: set[int] = set()
+    memos: list[dict[int, tuple[MultirowCell, set[int]]] | None] = []
+    for run in runs:
+        columns = range(run.start, run.stop)
+        memos.append(None if seen.isdisjoint(columns) else {})
+        seen.update(columns)
 
+    rows = cols.all_rows()
+    if isinstance(rows, ColumnarRows) and rows.nbody and not rows.is_materialized():
+        body = rows.body_columns()
+        new_rows = ColumnarRows(
+            [body[i] for i in idc],
+            nbody=rows.nbody,
+            head=[take_row_columns(row, runs, memos) for row in rows.head],
+            tail=[take_row_columns(row, runs, memos) for row in rows.tail],
+            formats=[rows.formats[i] for i in idc],
+            escapes=[rows.escapes[i] for i in idc],
+        )
+        return type(cols)._from_trusted(new_rows, "", len(idc))
+    new = [take_row_columns(row, runs, memos) for row in rows]
     if isinstance(cols, Table):
-        return Table.from_columns(columns=Columns(new_rows, align=cols.align))
-    return Columns(new_rows, align=cols.align)
+        return Table._from_trusted(new, "", len(idc))
+    return Columns._from_trusted(new, "", len(idc))
+
+
+def index_positions(index: Index, n: int) -> Sequence[int]:
+    """Positions selected by `index` along an axis of length `n`.
+
+    Accepts an integer, a slice, a sequence of integers (negative ones count
+    from the end) or a boolean mask of length `n`.
+    """
+    if isinstance(index, int) and not isinstance(index, bool):
+        i = normalize_index(index, n)
+        return range(i, i + 1)
+    if isinstance(index, slice):
+        return range(n)[index]
+    if isinstance(index, abc.Sequence) and not isinstance(index, (str, tuple)):
+        if index and all(isinstance(i, bool) for i in index):
+            if len(index) != n:
+                raise IndexError(
+                    f"Boolean index of length {len(index)} does not match "
+                    f"axis of length {n}"
+                )
+            return [i for i, keep in enumerate(index) if keep]
+        if all(isinstance(i, int) and not isinstance(i, bool) for i in index):
+            idc = range(n)
+            try:
+                return [idc[i] for i in index]
+            except IndexError:
+                raise IndexError(f"Index {list(index)} out of bounds for {n}")
+    raise ValueError(f"Index {index} not valid")
+
+
+def normalize_index(index: int, n: int) -> int:
+    """Position of `index` in a sequence of length `n` in constant time.
+
+    Negative indices count from the end as in Python; raises `IndexError`
+    if the index is out of bounds.
+    """
+    i = operator.index(index)
+    if i < 0:
+        i += n
+    if not 0 <= i < n:
+        raise IndexError(f"Index {index} out of bounds for {n}")
+    return i
 
 
 def index_to_slice(index: int, values: Sequence) -> slice:
-    idc = list(range(len(values)))
-    try:
-        index = idc[index]
-    except IndexError:
-        raise IndexError(f"Index {index} out of bounds with {idc=} and{values=}")
+    index = normalize_index(index, len(values))
     return slice(index, index + 1)
 
 
 def standardize_index(index: int, n: int):
-    return list(range(n))[index]
+    return normalize_index(index, n)
 
 
 @dataclass
@@ -1109,6 +1720,18 @@ class Row:
     """
 
     cells: Sequence[Cell]
+    _offsets: list[int] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Lazily built column offsets of the cells; see `Row.offsets`."""
+    _rendered: tuple[tuple[str | None, ...], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Renders of the cells and output of the last `render`."""
+    _snapshot: tuple[tuple[str | None, ...], str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    """Renders of the cells and output of the last `render_changed`."""
 
     def __post_init__(self):
         if not (
@@ -1123,22 +1746,108 @@ class Row:
     def __repr__(self) -> str:
         return f"Row(#cells={len(self.cells)})"
 
+    def __setattr__(self, name: str, value: Any):
+        if name == "cells":
+            object.__setattr__(self, "_offsets", None)
+        object.__setattr__(self, name, value)
+
+    def __getstate__(self) -> dict[str, Any]:
+        return {**self.__dict__, "_rendered": None, "_snapshot": None}
+
+    def _shell(self, cells: list[Cell], replaced: bool = False) -> Row:
+        """New row over `cells` without validation.
+
+        `cells` is a copy of this row's cells, possibly with cells `replaced`
+        by cells of the same length. The cached offsets are reused and so is
+        the cached render; it is checked against the cells when used.
+        """
+        row = object.__new__(Row)
+        object.__setattr__(row, "cells", cells)
+        object.__setattr__(row, "_offsets", self._offsets)
+        object.__setattr__(row, "_rendered", self._rendered)
+        object.__setattr__(row, "_snapshot", None)
+        return row
+
+    def offsets(self) -> list[int]:
+        """Column offsets of the cells.
+
+        The i-th cell spans the columns `[offsets[i], offsets[i + 1])` and
+        the last element is the number of columns of the row. Built on first
+        use and invalidated when cells are set through the row.
+        """
+        if self._offsets is None:
+            self._offsets = [0, *it.accumulate(len(cell) for cell in self.cells)]
+        return self._offsets
+
+    def cell_index(self, col: int) -> int:
+        """Index of the cell that covers column `col`.
+
+        E.g. for cells of lengths [4, 1] columns 0-3 map to the multicolumn
+        cell at index 0 and column 4 to the cell at index 1.
+        """
+        offsets = self.offsets()
+        if not 0 <= col < offsets[-1]:
+            raise IndexError(
+                f"Column {col} out of bounds for row with {offsets[-1]} columns"
+            )
+        return bisect.bisect_right(offsets, col) - 1
+
     def __len__(self) -> int:
-        return sum(len(cell) for cell in self.cells)
+        return self.offsets()[-1]
 
     def __getitem__(self, index: int | slice) -> Row:
         cells = self.cells
         if isinstance(index, slice):
-            return Row(cells=slice_cells(cells, index, "column"))
+            return Row(cells=slice_cells(cells, index, "column", self.offsets()))
         sl = index_to_slice(index, cells)
-        return Row(cells=slice_cells(cells, sl, "column"))
+        return Row(cells=slice_cells(cells, sl, "column", self.offsets()))
 
     def __setitem__(self, index: int, cell: Cell):
-        self.cells = list(self.cells)  # Sequence doesn't allow setitem
-        self.cells[index] = cell
-
-    def render(self) -> str:
-        return " & ".join(cell.render() for cell in self.cells) + r" \\"
+        if not isinstance(self.cells, list):
+            self.cells = list(self.cells)  # Sequence doesn't allow setitem
+        old, self.cells[index] = self.cells[index], cell
+        if len(old) != len(cell):
+            self._offsets = None
+
+    def _render(self) -> tuple[tuple[str, ...], str]:
+        texts = tuple([cell.render() for cell in self.cells])
+        return texts, " & ".join(texts) + r" \\"
+
+    def render(self, cache: bool = True) -> str:
+        """Renders the row.
+
+        The output is cached along with the renders of the cells and reused
+        while the cells hold the same cached renders. Cells reset their
+        cached render when changed, so edits of a cell and cells replaced in
+        `cells`, also without going through the row, are noticed. With
+        `cache=False` a new render is not stored, e.g. when streaming a table.
+        """
+        cached = self._rendered
+        if cached is not None and cached[0] == tuple(map(CACHED_RENDER, self.cells)):
+            return cached[1]
+        rendered = self._render()
+        if cache:
+            object.__setattr__(self, "_rendered", rendered)
+        return rendered[1]
+
+    def render_changed(self) -> tuple[str, bool]:
+        """Renders the row and tells if it changed since the last call.
+
+        Checked like the cache of `render` but against the last call of
+        `render_changed`, s.t. rendering the row elsewhere in between, e.g.
+        through a slice of the table, doesn't hide a change.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot[0] == tuple(
+            map(CACHED_RENDER, self.cells)
+        ):
+            return snapshot[1], False
+        snapshot = self._rendered
+        if snapshot is None or snapshot[0] != tuple(map(CACHED_RENDER, self.cells)):
+            snapshot = self._render()
+            object.__setattr__(self, "_rendered", snapshot)
+        object.__setattr__(self, "_snapshot", snapshot)
+        return snapshot[1], True
 
     @overload
     def __truediv__(self: Self, other: Table) -> Table: ...
@@ -1156,6 +1865,8 @@ class Row:
     def __truediv__(self: Self, other: Row) -> Table: ...
 
     def __truediv__(self, other):
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, TableRow_):
             return Table([self, other])
         if isinstance(other, Table | Columns):
@@ -1172,6 +1883,8 @@ class Row:
     def __or__(self: Self, other: Row | Cell) -> Row: ...
 
     def __or__(self: Self, other):
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, Columns):
             return Columns([self]) | other
         if isinstance(other, Row):
@@ -1203,14 +1916,277 @@ def len_rows(rows: Iterable[TableRow]) -> set[int]:
 
 def render_rows(rows: Iterable[TableRow]) -> str:
     """Renders a sequence of `TableRow` objects to a LaTeX table body."""
+    if isinstance(rows, ColumnarRows):
+        return rows.render()
     return "\n".join(row.render() for row in rows)
 
 
+def row_chunks(rows: Sequence[TableRow], size: int) -> list[Sequence[TableRow]]:
+    """Splits the rows into chunks of `size` rows that pickle on their own.
+
+    Slices of `Rows` and `ColumnarRows` are views which would pickle all the
+    rows they share.
+    """
+    chunks: list[Sequence[TableRow]] = []
+    for i in range(0, len(rows), size):
+        chunk = rows[i : i + size]
+        if isinstance(chunk, ColumnarRows) and not chunk.is_materialized():
+            chunk = ColumnarRows(
+                chunk.body_columns(),
+                chunk.nbody,
+                chunk.head,
+                chunk.tail,
+                chunk.formats,
+                chunk.escapes,
+            )
+        elif not isinstance(chunk, list):
+            chunk = list(chunk)
+        chunks.append(chunk)
+    return chunks
+
+
+class PackedRows(NamedTuple):
+    """Rows packed into plain values to be sent to a worker process.
+
+    Rows of plain cells are given by their number of cells, whose values and
+    format codes follow each other in `values` and `codes`; other rows are
+    rendered when packed. See `pack_rows`.
+    """
+
+    items: list[int | str]
+    values: list[NumOrStr]
+    codes: list[int]
+    formats: dict[int, CellFormat]
+    """The formats of `codes`, as codes are local to the process."""
+
+
+CELL_VALUE = operator.attrgetter("_value")
+CELL_FORMAT = operator.attrgetter("_fmt")
+
+
+def is_plain_row(row: TableRow) -> bool:
+    """Whether `row` is a `Row` of plain `Cell`s spanning one column and row."""
+    return isinstance(row, Row) and all(
+        type(cell) is Cell and cell._multicolumn == 1 and cell._multirow == 1
+        for cell in row.cells
+    )
+
+
+def pack_rows(rows: Sequence[TableRow]) -> PackedRows | ColumnarRows:
+    """Packs rows s.t. they pickle fast, see `PackedRows`.
+
+    Pickling `Cell` objects costs about as much as rendering them. Columnar
+    bodies which are not materialized are returned as is; they pickle as
+    plain values already.
+    """
+    if isinstance(rows, ColumnarRows) and not rows.is_materialized():
+        return rows
+    items: list[int | str] = []
+    values: list[NumOrStr] = []
+    codes: list[int] = []
+    for row in rows:
+        if is_plain_row(row):
+            cells = cast(Row, row).cells
+            values.extend(map(CELL_VALUE, cells))
+            codes.extend(map(CELL_FORMAT, cells))
+            items.append(len(cells))
+        else:
+            items.append(row.render())
+    formats = {code: CELL_FORMATS[code] for code in set(codes)}
+    return PackedRows(items, values, codes, formats)
+
+
+def render_packed(packed: PackedRows | ColumnarRows) -> str:
+    """Renders rows packed by `pack_rows`; equals `render_rows` of the rows."""
+    if isinstance(packed, ColumnarRows):
+        return packed.render()
+    items, values, codes, formats = packed
+    local = {code: cell_format_code(fmt) for code, fmt in formats.items()}
+    cell = Cell("")
+    lines = []
+    k = 0
+    for item in items:
+        if isinstance(item, str):
+            lines.append(item)
+            continue
+        texts = []
+        for value, code in zip(values[k : k + item], codes[k : k + item]):
+            cell._value, cell._fmt = value, local[code]
+            texts.append(cell._render())
+        lines.append(" & ".join(texts) + r" \\")
+        k += item
+    return "\n".join(lines)
+
+
+def render_worker():
+    """Entry point of the worker processes of `render_rows_parallel`.
+
+    Reads a pickled packed chunk from stdin and writes its pickled render to
+    stdout.
+    """
+    import pickle
+
+    pickle.dump(render_packed(pickle.load(sys.stdin.buffer)), sys.stdout.buffer)
+
+
+def start_render_worker():
+    """Starts a worker process running `render_worker`.
+
+    Workers are new interpreters rather than `multiprocessing` processes:
+    those either fork, which can deadlock a process running threads, e.g. of
+    polars, or import the main module again, which fails for scripts without
+    an `if __name__ == "__main__"` guard.
+    """
+    import subprocess
+
+    # The worker imports this tabx, wherever it was imported from
+    path = [str(Path(__file__).resolve().parents[1])]
+    if pythonpath := os.environ.get("PYTHONPATH"):
+        path.append(pythonpath)
+    return subprocess.Popen(
+        [sys.executable, "-c", "from tabx.table import render_worker; render_worker()"],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(path)},
+    )
+
+
+def render_rows_parallel(rows: Sequence[TableRow], workers: int) -> str:
+    """Renders the rows in chunks with `workers` processes.
+
+    Each worker gets a contiguous chunk of rows, packed s.t. it pickles fast,
+    see `pack_rows`. Packing still touches every cell, so this pays off when
+    cells are costly to render, e.g. with number formats or escaping, or
+    for columnar bodies, which are sent as their values. Free-threaded
+    builds of Python render the chunks with threads instead. The output is
+    the same as of `render_rows`.
+    """
+    import pickle
+    from concurrent.futures import ThreadPoolExecutor
+
+    n = len(rows)
+    if n < 2 or workers < 2:
+        return render_rows(rows)
+    chunks = row_chunks(rows, -(-n // workers))
+    if not getattr(sys, "_is_gil_enabled", lambda: True)():
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return "\n".join(pool.map(render_rows, chunks))
+    # Workers start up while the chunks are packed
+    procs = [start_render_worker() for _ in chunks]
+    try:
+        with ThreadPoolExecutor(max_workers=len(procs)) as pool:
+            futures = [
+                pool.submit(
+                    proc.communicate,
+                    pickle.dumps(pack_rows(chunk), pickle.HIGHEST_PROTOCOL),
+                )
+                for proc, chunk in zip(procs, chunks)
+            ]
+            outputs = [future.result() for future in futures]
+    finally:
+        for proc in procs:
+            if proc.poll() is None:
+                proc.kill()
+    texts = []
+    for proc, (out, err) in zip(procs, outputs):
+        if proc.returncode != 0:
+            raise RuntimeError(f"Render worker failed:\n{err.decode()}")
+        texts.append(pickle.loads(out))
+    return "\n".join(texts)
+
+
+def spanned_rows(rows: Sequence[TableRow]) -> list[bool]:
+    """Whether each row continues a multirow span of a row above it.
+
+    The body of a `ColumnarRows` holds no spans unless materialized.
+    """
+    if isinstance(rows, ColumnarRows):
+        h = len(rows.head)
+        indexed: Iterable[tuple[int, TableRow]] = chain(
+            enumerate(rows.head),
+            (
+                (h + k - rows.off, row)
+                for k, row in rows._cache.items()
+                if rows.off <= k < rows.off + rows.nbody
+            ),
+            enumerate(rows.tail, start=h + rows.nbody),
+        )
+    else:
+        indexed = enumerate(rows)
+    spanned = [False] * len(rows)
+    for i, row in indexed:
+        if not isinstance(row, Row):
+            continue
+        span = max((cell.multirow for cell in row.cells), default=1)
+        for j in range(i + 1, min(i + span, len(rows))):
+            spanned[j] = True
+    return spanned
+
+
+def chunk_bounds(spanned: Sequence[bool], max_rows: int) -> list[tuple[int, int]]:
+    """Splits rows into consecutive chunks of at most `max_rows` rows.
+
+    A chunk never ends inside a multirow span, see `spanned_rows`; a span
+    longer than `max_rows` makes its chunk longer.
+    """
+    if max_rows < 1:
+        raise ValueError(f"max_rows must be positive; got {max_rows}")
+    n = len(spanned)
+    bounds = []
+    lo = 0
+    while lo < n:
+        hi = min(lo + max_rows, n)
+        while lo < hi < n and spanned[hi]:
+            hi -= 1
+        if hi == lo:
+            hi = lo + max_rows
+            while hi < n and spanned[hi]:
+                hi += 1
+        bounds.append((lo, hi))
+        lo = hi
+    return bounds
+
+
+def with_head(head: Sequence[TableRow], rows: Sequence[TableRow]) -> Sequence[TableRow]:
+    """The rows with `head` in front; columnar rows stay columnar."""
+    if not head:
+        return rows
+    if isinstance(rows, ColumnarRows):
+        return rows._view(rows.off, rows.nbody, [*head, *rows.head], rows.tail)
+    return [*head, *rows]
+
+
+def iter_render_rows(rows: Iterable[TableRow]) -> Iterator[str]:
+    """Renders the rows one at a time without caching the renders.
+
+    Joined by newlines the renders give `render_rows(rows)`.
+    """
+    if isinstance(rows, ColumnarRows):
+        yield from rows.iter_render(cache=False)
+        return
+    for row in rows:
+        yield row.render(cache=False) if isinstance(row, Row) else row.render()
+
+
+def split_lines(texts: Iterable[str]) -> Iterator[str]:
+    """Lines of the texts joined by newlines, as given by `str.splitlines`."""
+    last = None
+    for text in texts:
+        for line in text.split("\n"):
+            if last is not None:
+                yield last
+            last = line
+    # `splitlines` drops a trailing empty line
+    if last:
+        yield last
+
+
 def int_idx_to_slice(n: int, index: int):
     """
     Handles negative index by delegating to usual python indexing.
     """
-    index = list(range(n))[index]
+    index = normalize_index(index, n)
     sl = slice(index, index + 1)
     return sl
 
@@ -1256,6 +2232,43 @@ def validate_rows(rows: Sequence[TableRow]):
     return ncols
 
 
+def count_columns(rows: Sequence[TableRow]) -> int:
+    """Returns the number of columns of rows that are known to be valid.
+
+    Reads the length of the first `Row`; falls back to `validate_rows` when
+    there are only (c)midrules.
+    """
+    for row in rows:
+        if isinstance(row, Row):
+            return len(row)
+    return validate_rows(rows) or 0
+
+
+type ValidationLevel = Literal["full", "structural", "off"]
+
+VALIDATION_LEVELS: tuple[ValidationLevel, ...] = ("full", "structural", "off")
+VALIDATE_ENV = "TABX_VALIDATE"
+
+
+def validation_level(level: ValidationLevel | None = None) -> ValidationLevel:
+    """Resolves the validation level used when constructing `Columns`.
+
+    - "full": check row lengths and cmidrules, and link multirow cells.
+    - "structural": check row lengths and cmidrules only.
+    - "off": no checks; the number of columns is read off the first row.
+
+    If `level` is None the level is read from the `TABX_VALIDATE`
+    environment variable and defaults to "full".
+    """
+    if level is None:
+        level = cast(ValidationLevel, os.environ.get(VALIDATE_ENV, "full"))
+    if level not in VALIDATION_LEVELS:
+        raise ValueError(
+            f"Validation level must be one of {VALIDATION_LEVELS}; got {level!r}"
+        )
+    return level
+
+
 def is_type_seq(seq, type_: type = int):
     return (
         isinstance(seq, Sequence)
@@ -1291,38 +2304,437 @@ def match_seq(x, type_) -> SequenceKind:
             return "other"
 
 
-class Rows:
-    values: Sequence[TableRow]
-    ncols: int
-    nrows: int
+class RowBuffer:
+    """Storage shared by `Rows` objects.
+
+    Positions >= 0 live in `back`; positions < 0 live in `front` in reverse
+    order i.e. position -1 is `front[0]`, position -2 is `front[1]` etc.
+    """
 
-    def __post_init__(self): ...
+    __slots__ = ("front", "back")
 
+    def __init__(self, rows: Iterable[TableRow] = ()):
+        self.front: list[TableRow] = []
+        self.back: list[TableRow] = list(rows)
 
-class Columns:
-    """Columns class for LaTeX tables.
 
-    This is the base of the `Table` object.
+class Rows(abc.Sequence):
+    """Persistent sequence of rows.
+
+    A `Rows` object is an immutable view `[lo, hi)` into a `RowBuffer` that
+    is shared between versions. `with_row` returns a new version; adding a
+    row at the end (start) of a view that ends (starts) at the end (start)
+    of its buffer extends the buffer in place and returns a new view, hence
+    amortized O(1). Older views are unaffected since they do not see
+    positions outside their bounds. Otherwise the rows are copied into a
+    new buffer.
     """
 
-    ncols: int
-    """Number of columns in the table."""
-    nrows: int
+    __slots__ = ("_buf", "_lo", "_hi")
+
+    def __init__(self, rows: Iterable[TableRow] = ()):
+        self._buf = RowBuffer(rows)
+        self._lo = 0
+        self._hi = len(self._buf.back)
+
+    @classmethod
+    def _view(cls, buf: RowBuffer, lo: int, hi: int) -> Rows:
+        obj = cls.__new__(cls)
+        obj._buf, obj._lo, obj._hi = buf, lo, hi
+        return obj
+
+    def __len__(self) -> int:
+        return self._hi - self._lo
+
+    @overload
+    def __getitem__(self, index: int) -> TableRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Rows: ...
+
+    def __getitem__(self, index):
+        n = self._hi - self._lo
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step == 1:
+                return Rows._view(
+                    self._buf, self._lo + start, self._lo + max(start, stop)
+                )
+            return Rows(list(self)[index])
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"Index {index} out of bounds for {n} rows")
+        pos = self._lo + index
+        if pos >= 0:
+            return self._buf.back[pos]
+        return self._buf.front[-pos - 1]
+
+    def __iter__(self):
+        buf, lo, hi = self._buf, self._lo, self._hi
+        # Index lazily; slicing the buffer would copy it
+        if lo < 0:
+            yield from map(buf.front.__getitem__, range(-lo - 1, -min(hi, 0) - 1, -1))
+        if hi > 0:
+            yield from map(buf.back.__getitem__, range(max(lo, 0), hi))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Rows, list)):
+            return len(self) == len(other) and all(
+                r1 == r2 for r1, r2 in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"Rows({list(self)!r})"
+
+    def with_row(self, row: TableRow, index: int) -> Rows:
+        """Return new rows with `row` inserted at (normalized) `index`.
+
+        Only adding rows at either end avoids copying the rows.
+        """
+        buf = self._buf
+        if index == len(self) and self._hi == len(buf.back):
+            buf.back.append(row)
+            return Rows._view(buf, self._lo, self._hi + 1)
+        if index == 0 and self._lo == -len(buf.front):
+            buf.front.append(row)
+            return Rows._view(buf, self._lo - 1, self._hi)
+        rows = list(self)
+        rows.insert(index, row)
+        return Rows(rows)
+
+
+type Storage = Literal["rows", "columnar"]
+
+
+RENDER_BLOCK = 4096
+"""Number of body rows of a `ColumnarRows` formatted at once."""
+
+
+def column_texts(
+    values: list[NumOrStr],
+    number_format: NumberFormat | None,
+    escape: bool,
+) -> Iterable[str]:
+    """Texts of a block of column values as rendered by their cells."""
+    if escape:
+        values = [escape_latex(v) if isinstance(v, str) else v for v in values]
+    if number_format is None:
+        return map(str, values)
+    return number_format.format_many(values)
+
+
+class ColumnarRows(abc.Sequence):
+    """Rows of a table whose body is stored as per-column arrays of values.
+
+    The body consists of plain cells with default formatting; the cell in body
+    row `k` and column `j` has the value `columns[j][off + k]` and the number
+    format `formats[j]`; its strings are escaped if `escapes[j]`. Values are
+    kept as given and only converted to strings when rendered, a block of
+    each column at once. `Row` objects
+    for the body are only created when a row is accessed and are cached from
+    then on s.t. changes to them persist. The cache is shared by all views of
+    the same arrays. Rows before and after the body, e.g. a header, are held
+    as is in `head` and `tail`.
+
+    Rendering, slicing and joining work directly on the arrays as long as no
+    body row has been materialized.
+    """
+
+    __slots__ = (
+        "columns",
+        "formats",
+        "escapes",
+        "off",
+        "nbody",
+        "head",
+        "tail",
+        "_cache",
+        "_rendered",
+    )
+
+    def __init__(
+        self,
+        columns: Sequence[list[NumOrStr]],
+        nbody: int | None = None,
+        head: Iterable[TableRow] = (),
+        tail: Iterable[TableRow] = (),
+        formats: Sequence[NumberFormat | None] | None = None,
+        escapes: Sequence[bool] | None = None,
+    ):
+        self.columns = list(columns)
+        self.formats = column_formats(formats, len(self.columns))
+        self.escapes = [False] * len(self.columns) if escapes is None else list(escapes)
+        self.off = 0
+        if nbody is None:
+            nbody = len(self.columns[0]) if self.columns else 0
+        self.nbody = nbody
+        self.head: list[TableRow] = list(head)
+        self.tail: list[TableRow] = list(tail)
+        self._cache: dict[int, Row] = {}
+        self._rendered: str | None = None
+
+    @classmethod
+    def from_values(
+        cls,
+        values: Sequence[NumOrStr] | Sequence[Sequence[NumOrStr]],
+        flat: bool = False,
+        formats: NumberFormat | Sequence[NumberFormat | None] | None = None,
+    ) -> ColumnarRows:
+        """Store `values` column by column.
+
+        If `flat` the values are a single column. See `Columns.from_values`
+        for `formats`.
+        """
+        if flat:
+            values = cast(Sequence[NumOrStr], values)
+            return cls([list(values)], formats=column_formats(formats, 1))
+        values = cast(Sequence[Sequence[NumOrStr]], values)
+        if len(s := set(len(row) for row in values)) > 1:
+            raise ValueError(
+                f"All rows must have same #cells i.e. columns differ."
+                f" Found unique row lengths: {s}"
+            )
+        columns = [list(column) for column in zip(*values)]
+        formats = column_formats(formats, len(columns))
+        return cls(columns, nbody=len(values), formats=formats)
+
+    def _view(
+        self,
+        off: int,
+        nbody: int,
+        head: list[TableRow],
+        tail: list[TableRow],
+    ) -> ColumnarRows:
+        obj = ColumnarRows.__new__(ColumnarRows)
+        obj.columns, obj.off, obj.nbody = self.columns, off, nbody
+        obj.formats, obj.escapes = self.formats, self.escapes
+        obj.head, obj.tail = head, tail
+        # Rows set through the view stay in the view, as for slices of rows
+        obj._cache = {
+            k: row._shell(list(row.cells))
+            for k, row in self._cache.items()
+            if off <= k < off + nbody
+        }
+        obj._rendered = None
+        return obj
+
+    @property
+    def ncols(self) -> int:
+        return len(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.head) + self.nbody + len(self.tail)
+
+    def body_columns(self) -> list[list[NumOrStr]]:
+        """Values of the body column by column; shared if not a view."""
+        off, nbody = self.off, self.nbody
+        return [
+            col if off == 0 and len(col) == nbody else col[off : off + nbody]
+            for col in self.columns
+        ]
+
+    def is_materialized(self) -> bool:
+        """Whether any body row has been created as a `Row`."""
+        lo, hi = self.off, self.off + self.nbody
+        return any(lo <= k < hi for k in self._cache)
+
+    def is_lazy(self, index: int) -> bool:
+        """Whether `index` is a body row that has not been materialized."""
+        k = index - len(self.head)
+        return 0 <= k < self.nbody and (self.off + k) not in self._cache
+
+    def _body_row(self, k: int) -> Row:
+        k += self.off
+        row = self._cache.get(k)
+        if row is None:
+            row = self._cache[k] = Row(
+                [
+                    Cell(col[k], number_format=fmt, escape=esc)
+                    for col, fmt, esc in zip(self.columns, self.formats, self.escapes)
+                ]
+            )
+        return row
+
+    @overload
+    def __getitem__(self, index: int) -> TableRow: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[TableRow]: ...
+
+    def __getitem__(self, index):
+        n = len(self)
+        if isinstance(index, slice):
+            start, stop, step = index.indices(n)
+            if step != 1:
+                return [self[i] for i in range(start, stop, step)]
+            return self._slice(start, max(start, stop))
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError(f"Index {index} out of bounds for {n} rows")
+        h = len(self.head)
+        if index < h:
+            return self.head[index]
+        if index < h + self.nbody:
+            return self._body_row(index - h)
+        return self.tail[index - h - self.nbody]
+
+    def _slice(self, start: int, stop: int) -> ColumnarRows:
+        h, nbody = len(self.head), self.nbody
+        k0 = min(max(start - h, 0), nbody)
+        k1 = min(max(stop - h, 0), nbody)
+        return self._view(
+            self.off + k0,
+            k1 - k0,
+            self.head[start : min(stop, h)],
+            self.tail[max(start - h - nbody, 0) : max(stop - h - nbody, 0)],
+        )
+
+    def __getstate__(self):
+        state = {name: getattr(self, name) for name in self.__slots__}
+        return None, {**state, "_rendered": None}
+
+    def __iter__(self):
+        yield from self.head
+        for k in range(self.nbody):
+            yield self._body_row(k)
+        yield from self.tail
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ColumnarRows, Rows, list)):
+            return len(self) == len(other) and all(
+                r1 == r2 for r1, r2 in zip(self, other)
+            )
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnarRows(head={len(self.head)}, body={self.nbody}, "
+            f"tail={len(self.tail)}, ncols={self.ncols})"
+        )
+
+    def render(self) -> str:
+        """Renders the rows.
+
+        The render of the body is cached while no body row is materialized;
+        the values themselves are not changed after construction. Head and
+        tail rows and materialized rows are cached like `Row.render`.
+        """
+        if self.nbody == 0 or self.is_materialized():
+            return "\n".join(self.iter_render())
+        if self._rendered is None:
+            self._rendered = "\n".join(self._iter_render_body(True))
+        return "\n".join(
+            [
+                *(row.render() for row in self.head),
+                self._rendered,
+                *(row.render() for row in self.tail),
+            ]
+        )
+
+    def iter_render(self, cache: bool = True) -> Iterator[str]:
+        """Renders the rows one at a time; body rows are not materialized.
+
+        With `cache=False` the renders of the rows are not cached, see
+        `Row.render`.
+        """
+        for row in self.head:
+            yield row.render(cache) if isinstance(row, Row) else row.render()
+        yield from self._iter_render_body(cache)
+        for row in self.tail:
+            yield row.render(cache) if isinstance(row, Row) else row.render()
+
+    def _iter_render_body(self, cache: bool) -> Iterator[str]:
+        rows, off = self._cache, self.off
+        if self.columns:
+            for lo in range(off, off + self.nbody, RENDER_BLOCK):
+                hi = min(lo + RENDER_BLOCK, off + self.nbody)
+                # Format a block of each column at once
+                block = [
+                    column_texts(col[lo:hi], fmt, esc)
+                    for col, fmt, esc in zip(self.columns, self.formats, self.escapes)
+                ]
+                for k, texts in enumerate(zip(*block), start=lo):
+                    row = rows.get(k)
+                    if row is not None:
+                        yield row.render(cache)
+                    else:
+                        yield " & ".join(texts) + r" \\"
+        else:
+            for k in range(self.nbody):
+                yield self._body_row(k).render(cache)
+
+    def with_row(self, row: TableRow, index: int) -> Sequence[TableRow]:
+        """Return new rows with `row` inserted at (normalized) `index`.
+
+        Rows inserted before or after the body go into `head` or `tail`;
+        inserting inside the body materializes the rows.
+        """
+        h = len(self.head)
+        if index <= h:
+            head = self.head[:index] + [row] + self.head[index:]
+            return self._view(self.off, self.nbody, head, list(self.tail))
+        if index >= h + self.nbody:
+            k = index - h - self.nbody
+            tail = self.tail[:k] + [row] + self.tail[k:]
+            return self._view(self.off, self.nbody, list(self.head), tail)
+        rows = list(self)
+        rows.insert(index, row)
+        return Rows(rows)
+
+
+def columnar_parts(all_cols: Sequence[Columns]) -> list[ColumnarRows] | None:
+    """The columnar rows of `all_cols` if all of them have unmaterialized ones."""
+    parts = [c.all_rows() for c in all_cols]
+    if all(
+        isinstance(rows, ColumnarRows) and not rows.is_materialized() for rows in parts
+    ):
+        return cast(list[ColumnarRows], parts)
+    return None
+
+
+class Columns:
+    """Columns class for LaTeX tables.
+
+    This is the base of the `Table` object.
+    """
+
+    ncols: int
+    """Number of columns in the table."""
+    nrows: int
     """Number of rows in the table."""
     rows: Sequence[TableRow]
     """List of rows in the table."""
     align: str = ""
     """Alignment string of columns"""
+    _incremental: tuple[str, list[str], str] | None = None
+    """Alignment, row renders and output of the last
+    `Table.render_incremental`."""
 
-    def __init__(self, rows: Sequence[TableRow], align: str = ""):
+    def __init__(
+        self,
+        rows: Sequence[TableRow],
+        align: str = "",
+        validate: ValidationLevel | None = None,
+    ):
         self.rows = rows
         self.align = align
 
-        self.__post_init__()
+        self.__post_init__(validate)
 
-    def __post_init__(self):
+    def __post_init__(self, validate: ValidationLevel | None = None):
+        level = validation_level(validate)
         # ncols
-        ncols = validate_rows(self.rows)
+        if level == "off":
+            ncols = count_columns(self.rows)
+        else:
+            ncols = validate_rows(self.rows)
         if not ncols:
             # empty columns
             ncols = 0
@@ -1332,13 +2744,58 @@ class Columns:
         if not self.align:
             self.align = "c" * self.ncols
 
-        # Validate rows in columns; linking multirows and their cells
-        validate_column_rows(self.rows)
-        validate_cmidrules(self)
+        if level == "full":
+            # Validate rows in columns; linking multirows and their cells
+            validate_column_rows(self.rows)
+        if level != "off":
+            validate_cmidrules(self)
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        rows: Sequence[TableRow],
+        align: str = "",
+        ncols: int | None = None,
+    ) -> Self:
+        """Construct from rows that are known to be valid and linked.
+
+        Skips all validation; used internally when the rows come from
+        already validated objects.
+        """
+        obj = cls.__new__(cls)
+        obj.rows = rows
+        obj.ncols = count_columns(rows) if ncols is None else ncols
+        obj.nrows = len(rows)
+        obj.align = align or "c" * obj.ncols
+        return obj
+
+    def _with_row(self, row: TableRow, index: int) -> Columns:
+        """Returns new columns with `row` inserted at normalized `index`.
+
+        Only the new row is validated when the existing rows fix the number
+        of columns and the row is not inserted inside a multirow span.
+        """
+        if not isinstance(row, TableRow_):
+            raise TypeError(f"Row must be a TableRow object; got {type(row)}")
+        rows = self.rows
+        if not isinstance(rows, (Rows, ColumnarRows)):
+            rows = Rows(rows)
+        if not has_row(rows) or inside_multirow(rows, index):
+            return Columns(rows=rows.with_row(row, index), align=self.align)
+        validate_new_row(row, self.ncols)
+        new_rows = rows.with_row(row, index)
+        if isinstance(row, Row):
+            link_row_multirows(new_rows, index)
+        return Columns._from_trusted(new_rows, self.align, self.ncols)
 
     def __repr__(self) -> str:
         return f"Columns(nrows={self.nrows}, ncols={self.ncols})"
 
+    def __getstate__(self) -> dict[str, Any]:
+        state = self.__dict__.copy()
+        state.pop("_incremental", None)
+        return state
+
     def __len__(self) -> int:
         return self.nrows
 
@@ -1355,6 +2812,16 @@ class Columns:
         self.align = align
         return self
 
+    def escape(self, escape: bool = True) -> Columns:
+        """Return the columns with LaTeX special characters of the cells
+        escaped when rendered, see `Cell.escape`.
+
+        The values are kept as is; `escape=False` turns escaping off again.
+        """
+        return Columns._from_trusted(
+            escape_rows(self.all_rows(), escape), self.align, self.ncols
+        )
+
     def all_rows(self) -> Sequence[TableRow]:
         """Return all rows"""
         return self.rows
@@ -1384,15 +2851,11 @@ class Columns:
 
     def prepend_row(self, row: TableRow):
         """Prepend a row."""
-        if not isinstance(row, TableRow_):
-            raise TypeError(f"Row must be a TableRow object; got {type(row)}")
-        return Columns(rows=[row] + list(self.rows), align=self.align)
+        return self._with_row(row, 0)
 
     def append_row(self, row: TableRow):
         """Append a row"""
-        if not isinstance(row, TableRow_):
-            raise TypeError(f"Row must be a TableRow object; got {type(row)}")
-        return Columns(rows=list(self.rows) + [row], align=self.align)
+        return self._with_row(row, self.nrows)
 
     def insert_row(self, row: TableRow, index: int):
         """Insert a row at index."""
@@ -1402,11 +2865,7 @@ class Columns:
             return self.append_row(row)
         if index > self.nrows or index < -self.nrows:
             raise IndexError(f"Index {index} out of bounds for {self.nrows} rows")
-        index = list(range(self.nrows))[index]
-        return Columns(
-            rows=list(self.rows[:index]) + [row] + list(self.rows[index:]),
-            align=self.align,
-        )
+        return self._with_row(row, normalize_index(index, self.nrows))
 
     def insert_rows(self, rows: Sequence[TableRow], indices: list[int]):
         """Insert multiple rows at specified indices."""
@@ -1416,12 +2875,9 @@ class Columns:
             if not isinstance(row, TableRow_):
                 raise TypeError(f"All rows must be TableRow objects; got {type(row)}")
 
-        def normalize_index(i: int) -> int:
-            if i == self.nrows:
-                return i
-            return list(range(self.nrows))[i]
-
-        norm_indices = [normalize_index(i) for i in indices]
+        norm_indices = [
+            i if i == self.nrows else normalize_index(i, self.nrows) for i in indices
+        ]
 
         # Sort by index descending so later insertions don't affect earlier ones
         inserts = sorted(zip(norm_indices, rows), key=lambda x: -x[0])
@@ -1460,24 +2916,48 @@ class Columns:
     def from_values(
         cls,
         values: Sequence[NumOrStr] | Sequence[Sequence[NumOrStr]],
+        storage: Storage = "rows",
+        formats: NumberFormat | Sequence[NumberFormat | None] | None = None,
     ):
         """Create a Column from a sequence of values.
 
 
-        Values could be str, int, float.
+        Values could be str, int, float. They are kept as given and turned
+        into text when rendered, by `formats` if given: a `NumberFormat` for
+        all columns or one (or `None`) per column.
+
+        With `storage="columnar"` the values are stored column by column
+        (see `ColumnarRows`) and cells are only created when rows are
+        accessed.
         """
         if any(isinstance(val, TableRow_) for val in values):
             raise ValueError("Cannot pass TableRow_ as value")
-        match match_seq(values, type_=(int, float, str)):
+        kind = match_seq(values, type_=(int, float, str))
+        if storage == "columnar" and kind != "other":
+            rows = ColumnarRows.from_values(values, flat=kind == "seq", formats=formats)
+            if issubclass(cls, Column):
+                return cls(rows=rows)
+            return cls._from_trusted(rows, "", rows.ncols)
+        match kind:
             case "seq":
                 values = cast(Sequence[NumOrStr], values)
+                (fmt,) = column_formats(formats, 1)
                 return cls(
-                    rows=[Row([Cell(str(value))]) for value in values],
+                    rows=[Row([Cell(value, number_format=fmt)]) for value in values],
                 )
             case "seq_of_seq":
                 values = cast(Sequence[Sequence[NumOrStr]], values)
+                fmts = column_formats(formats, max(map(len, values), default=0))
                 return cls(
-                    rows=[Row([Cell(str(value)) for value in row]) for row in values],
+                    rows=[
+                        Row(
+                            [
+                                Cell(value, number_format=fmt)
+                                for value, fmt in zip(row, fmts)
+                            ]
+                        )
+                        for row in values
+                    ],
                 )
             case "other":
                 raise TypeError(
@@ -1485,34 +2965,28 @@ class Columns:
                     f"sequence of sequence of objects; got {values=}"
                 )
 
-    def __getitem__(
-        self,
-        index: int | slice | tuple[slice | int, slice | int],
-    ) -> Columns:
-        if isinstance(index, int):
-            sl = self._save_index_to_slice(index, self.nrows)
-            return slice_rows_vertical(self, sl)
-        if isinstance(index, slice):
-            return slice_rows_vertical(self, index)
-        if isinstance(index, tuple) and len(index) == 2:
+    def __getitem__(self, index: Index | tuple[Index, Index]) -> Columns:
+        """Selects rows and columns, e.g. cols[1:3], cols[:, [0, 2]].
+
+        Either axis takes an integer, a slice (also stepped), a sequence of
+        integers or a boolean mask.
+
+        Cells are not copied: the result shares the cells of the rows it
+        keeps, like a numpy view, and a cell changed in place, e.g.
+        `cols[:2].rows[0].cells[0].value = "x"`, changes in both. The rows
+        are the result's own, so setting a cell through a row,
+        `cols[:2].rows[0][0] = Cell("x")`, only changes the result. Only the
+        cells of multirow spans cut by the selection and of clipped
+        multicolumn cells are copied; columnar bodies create the cells of
+        rows not materialized on demand.
+        """
+        if isinstance(index, tuple):
+            if len(index) != 2:
+                raise ValueError(f"Index {index} not valid")
             idx_row, idx_column = index
-            # handle case of either being an integer
-            if isinstance(idx_row, int):
-                idx_row = self._save_index_to_slice(idx_row, self.nrows)
-            if isinstance(idx_column, int):
-                idx_column = self._save_index_to_slice(idx_column, self.ncols)
-            # Slice and return
-            cols = slice_rows_vertical(self, idx_row)
-            return slice_rows_horizontal(cols, idx_column)
-        raise ValueError(f"Index {index} not valid")
-
-    def _save_index_to_slice(self, index: int, n: int):
-        try:
-            slice = int_idx_to_slice(n, index)
-        except IndexError:
-            raise IndexError(f"Index {index} out of bounds for {n}")
-        else:
-            return slice
+            cols = take_rows(self, index_positions(idx_row, self.nrows))
+            return take_columns(cols, index_positions(idx_column, self.ncols))
+        return take_rows(self, index_positions(index, self.nrows))
 
     @overload
     def __or__(self: Self, other: Table) -> Table: ...
@@ -1526,18 +3000,18 @@ class Columns:
 
     def __or__(self: Columns | Table, other):
         """Overload `|`"""
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, Cell):
             other = Columns([Row([other])])  # delegate to Columns below
         if isinstance(other, Row):
             other = Columns([other])  # delegate to Columns below
         if isinstance(other, Table):
-            cols = join_columns([self, other])
-            return Table.from_columns(cols)
+            return join_columns([self, other], cls=Table)
         if isinstance(other, Columns):
-            cols = join_columns([self, other])
             if isinstance(self, Table):
-                return Table.from_columns(cols)
-            return cols
+                return join_columns([self, other], cls=Table)
+            return join_columns([self, other])
         raise TypeError(
             f"unsupported operand type(s) for |: '{type(self).__name__}' "
             f"and '{type(other).__name__}'"
@@ -1555,18 +3029,18 @@ class Columns:
 
     def __truediv__(self: Columns | Table, other):
         """Overload `/`"""
+        if isinstance(other, TableExpr):
+            return NotImplemented
         if isinstance(other, Cell):
             return self.append_row(Row([other]))
         if isinstance(other, (Rule, Row, Cmidrule, Cmidrules)):
             return self.append_row(other)
         if isinstance(other, Table):
-            cols = join_rows([self, other])
-            return Table.from_columns(cols)
+            return join_rows([self, other], cls=Table)
         if isinstance(other, Columns):
-            cols = join_rows([self, other])
             if isinstance(self, Table):
-                return Table.from_columns(cols)
-            return cols
+                return join_rows([self, other], cls=Table)
+            return join_rows([self, other])
         raise TypeError(
             f"unsupported operand type(s) for /: '{type(self).__name__}' "
             f"and '{type(other).__name__}'"
@@ -1618,26 +3092,31 @@ class Table(Columns):
     functionality.
     """
 
-    def __init__(self, rows: Sequence[TableRow], align: str = ""):
-        super().__init__(rows=rows, align=align)
+    def __init__(
+        self,
+        rows: Sequence[TableRow],
+        align: str = "",
+        validate: ValidationLevel | None = None,
+    ):
+        super().__init__(rows=rows, align=align, validate=validate)
 
     @classmethod
     def from_columns(
         cls,
         columns: Columns,
     ):
-        """Create a Table from rows."""
-        return cls(rows=columns.rows, align=columns.align)
+        """Create a Table from rows.
+
+        The columns are already validated so they are not validated again.
+        """
+        return cls._from_trusted(columns.rows, columns.align, columns.ncols)
 
     @property
     def columns(self) -> Columns:
         """Return the columns of the table."""
-        return Columns(rows=self.rows, align=self.align)
+        return Columns._from_trusted(self.rows, self.align, self.ncols)
 
-    def __getitem__(
-        self,
-        index: int | slice | tuple[int | slice, int | slice],
-    ) -> Table:
+    def __getitem__(self, index: Index | tuple[Index, Index]) -> Table:
         result = super().__getitem__(index)
         return Table.from_columns(result)
 
@@ -1648,20 +3127,47 @@ class Table(Columns):
         self,
         custom_render: Callable[..., str] | None = None,
         *args,
+        workers: int | None = None,
         **kwargs,
     ):
         """Render the table to a LaTeX string.
 
         It wraps the table in a tabular environment by default.
         If `custom_render` is provided, it will be used to render the table.
+        With `workers` the rows are rendered in chunks by that many processes,
+        see `render_rows_parallel`; this pays off for tables with many rows
+        of costly cells, e.g. number formatted ones, or columnar bodies.
         """
         if self.ncols == 0 or self.nrows == 0:
             raise ValueError("Cannot render empty table")
         if custom_render is not None:
             return custom_render(self, *args, **kwargs)
-        body = render_rows(self.rows)
+        if workers is not None and workers > 1:
+            body = render_rows_parallel(self.rows, workers)
+        else:
+            body = render_rows(self.rows)
         return render_body(body, n=self.ncols, align=self.align)
 
+    def iter_render(self) -> Iterator[str]:
+        """Renders the table line by line.
+
+        Joined by newlines the lines equal `render()`. Only one row is
+        rendered at a time and the renders are not cached s.t. memory stays
+        flat for large tables; see `render_to`.
+        """
+        if self.ncols == 0 or self.nrows == 0:
+            raise ValueError("Cannot render empty table")
+        lines = split_lines(iter_render_rows(self.rows))
+        return iter_render_body(lines, self.ncols, self.align)
+
+    def render_to(self, fp: IO[str]):
+        """Writes the rendered table to the text file `fp` line by line."""
+        lines = self.iter_render()
+        fp.write(next(lines))
+        for line in lines:
+            fp.write("\n")
+            fp.write(line)
+
     def render_body(self) -> str:
         """Render the body of the table without the tabular environment."""
         return render_rows(self.rows)
@@ -1682,16 +3188,198 @@ class Table(Columns):
         """insert a row."""
         return Table.from_columns(super().insert_rows(rows, indices))
 
+    def escape(self, escape: bool = True) -> Table:
+        """Escape LaTeX special characters of all cells when rendered."""
+        return Table.from_columns(super().escape(escape))
+
     def print(
         self,
         custom_render: Callable[..., str] | None = None,
     ):
         print(self.render(custom_render))
 
-    def save(self, file: PathArg):
+    def save(
+        self,
+        file: PathArg,
+        streaming: bool = False,
+        skip_unchanged: bool = False,
+    ) -> bool:
+        """Saves the rendered table to `file`.
+
+        With `streaming=True` the table is written line by line, see
+        `render_to`. With `skip_unchanged=True` the file is only written if
+        its content differs from the table, see `render_incremental`.
+        Returns whether the file was written.
+        """
         from tabx.utils import save_table
 
-        save_table(self.render(), file)
+        if skip_unchanged:
+            if streaming:
+                raise ValueError("Cannot combine streaming and skip_unchanged")
+            file = Path(file)
+            previous = file.read_text() if file.exists() else None
+            out = self.render_incremental(previous)
+            if not out.changed:
+                return False
+            save_table(out.text, file)
+            return True
+        save_table(self if streaming else self.render(), file, streaming=streaming)
+        return True
+
+    def render_incremental(
+        self,
+        previous_output: str | None = None,
+    ) -> IncrementalRender:
+        """Render the table, re-rendering only the rows that changed.
+
+        Rows keep their last render, see `Row.render_changed`, s.t. after a
+        few edits only the edited rows are rendered and the output is joined
+        from the kept renders. If no row rendered differently than in the last
+        incremental render the previous output is returned as is.
+        `changed` tells whether the output differs from `previous_output`,
+        e.g. the content of the file the table was saved to, s.t. writing
+        the file can be skipped. Columnar bodies are rendered from their
+        values every time.
+        """
+        if self.ncols == 0 or self.nrows == 0:
+            raise ValueError("Cannot render empty table")
+        rows = self.all_rows()
+        texts: list[str] = []
+        rendered = 0
+        if isinstance(rows, ColumnarRows):
+            texts.extend(rows.iter_render())
+        else:
+            for row in rows:
+                if isinstance(row, Row):
+                    text, changed = row.render_changed()
+                    rendered += changed
+                else:
+                    text = row.render()
+                texts.append(text)
+        last = self._incremental
+        if last is not None and last[0] == self.align and last[1] == texts:
+            output = last[2]
+        else:
+            output = render_body("\n".join(texts), n=self.ncols, align=self.align)
+        self._incremental = (self.align, texts, output)
+        changed = output is not previous_output and output != previous_output
+        return IncrementalRender(output, changed, rendered)
+
+    def split(self, max_rows: int, header_rows: int = 0) -> list[Table]:
+        """Splits the table into tables of at most `max_rows` rows each.
+
+        The first `header_rows` rows are repeated at the top of every table
+        and don't count towards `max_rows`. Tables never end inside a
+        multirow span, so a span longer than `max_rows` gives a longer table.
+        """
+        rows = self.all_rows()
+        spanned = spanned_rows(rows)
+        if 0 < header_rows < len(rows) and spanned[header_rows]:
+            raise ValueError("Header rows must not end inside a multirow span")
+        head = list(rows[:header_rows])
+        body = rows[header_rows:]
+        return [
+            Table._from_trusted(with_head(head, body[lo:hi]), self.align, self.ncols)
+            for lo, hi in chunk_bounds(spanned[header_rows:], max_rows)
+        ]
+
+    def render_longtable(self, header_rows: int = 0) -> str:
+        """Render the table as a `longtable` which breaks across pages.
+
+        The first `header_rows` rows are repeated at the top of every page
+        followed by a midrule. Pages don't break inside multirow spans.
+        Requires the `longtable` package.
+        """
+        if self.ncols == 0 or self.nrows == 0:
+            raise ValueError("Cannot render empty table")
+        rows = self.all_rows()
+        spanned = spanned_rows(rows)
+        if 0 < header_rows < len(rows) and spanned[header_rows]:
+            raise ValueError("Header rows must not end inside a multirow span")
+        head = [Toprule(), *rows[:header_rows]]
+        if header_rows and not isinstance(head[-1], Rule):
+            head.append(Midrule())
+        head_lines = ["  " + line for line in render_rows(head).splitlines()]
+        lines = [r"\begin{longtable}{@{}" + self.align + "@{}}"]
+        lines.extend([*head_lines, r"\endfirsthead", *head_lines, r"\endhead"])
+        lines.extend(["  " + Bottomrule().render(), r"\endfoot"])
+        body = rows[header_rows:]
+        for i, text in enumerate(iter_render_rows(body), start=header_rows):
+            # `\\*` keeps the page from breaking before the span continues
+            if i + 1 < len(rows) and spanned[i + 1] and text.endswith(r"\\"):
+                text += "*"
+            lines.extend("  " + line for line in text.splitlines())
+        lines.append(r"\end{longtable}")
+        return "\n".join(lines)
+
+    def save_split(
+        self,
+        file: PathArg,
+        max_rows: int,
+        header_rows: int = 0,
+    ) -> list[Path]:
+        """Saves the table split into tabulars of at most `max_rows` rows.
+
+        The tables, see `split`, are saved next to `file` as `<stem>_1.tex`,
+        `<stem>_2.tex`, ... and `file` gets an `\\input` of each, separated
+        by blank lines. Returns the paths of the tables.
+
+        The tables are input by their name, i.e. relative to the directory
+        of `file`, s.t. the directory can be moved. From a document in
+        another directory include `file` with the `import` package, e.g.
+        `\\import{tables/}{file.tex}`, which resolves the inputs relative to
+        `tables/`.
+        """
+        from tabx.utils import save_table
+
+        file = Path(file)
+        paths = []
+        for k, tab in enumerate(self.split(max_rows, header_rows), start=1):
+            path = file.with_name(f"{file.stem}_{k}{file.suffix or '.tex'}")
+            save_table(tab, path, streaming=True)
+            paths.append(path)
+        index = "\n\n".join(r"\input{" + path.name + "}" for path in paths)
+        save_table(index + "\n", file)
+        return paths
+
+    def render_text(self) -> str:
+        """Render the table as plain text in a monospace grid.
+
+        A quick preview without LaTeX, see `tabx.preview.render_text`.
+        """
+        from tabx.preview import render_text
+
+        if self.ncols == 0 or self.nrows == 0:
+            raise ValueError("Cannot render empty table")
+        return render_text(self)
+
+    def render_markdown(self) -> str:
+        """Render the table as a Markdown pipe table.
+
+        See `tabx.preview.render_markdown`.
+        """
+        from tabx.preview import render_markdown
+
+        if self.ncols == 0 or self.nrows == 0:
+            raise ValueError("Cannot render empty table")
+        return render_markdown(self)
+
+    def render_html(self) -> str:
+        """Render the table as an HTML table.
+
+        See `tabx.preview.render_html`.
+        """
+        from tabx.preview import render_html
+
+        if self.ncols == 0 or self.nrows == 0:
+            raise ValueError("Cannot render empty table")
+        return render_html(self)
+
+    def _repr_html_(self) -> str | None:
+        # Display in notebooks without compiling LaTeX
+        if self.ncols == 0 or self.nrows == 0:
+            return None
+        return self.render_html()
 
     def compile(
         self,
@@ -1727,11 +3415,15 @@ class Table(Columns):
     def from_values(
         cls,
         values: Sequence[NumOrStr] | Sequence[Sequence[NumOrStr]],
+        storage: Storage = "rows",
+        formats: NumberFormat | Sequence[NumberFormat | None] | None = None,
     ):
         """
         Construct Table from values.
+
+        See `Columns.from_values` for `storage` and `formats`.
         """
-        out = Columns.from_values(values)
+        out = Columns.from_values(values, storage=storage, formats=formats)
         return cls.from_columns(out)
 
 
@@ -1803,25 +3495,9 @@ def validate_next_cells_mr(
 def tot_visited_to_cell_idx(tot_visited: int, row: Row):
     """Helper to get the correct cell from the row.
 
-    Notes:
-    pick out next cells corresponding to column j
-    [
-        Cell(name="", value="sourcenotes", multirow=1, multicolumn=4),
-        EmptyCell(name=)
-
-    ]
-    Want index map:
-        {0: 0, 1: 0, 2: 0, 3: 0, 4: 1}
-    i.e. first 4 indices maps to the multicolumn cell and the last index
-    maps to the empty cell.
+    See `Row.cell_index`.
     """
-    cells = row.cells
-    lens = cumsum([len(f) for f in cells])
-    idc_pairs = list(zip([0] + lens, lens))
-    idx_to_cell_idx = {
-        i: j for j, pair in zip(range(len(cells)), idc_pairs) for i in range(*pair)
-    }
-    return idx_to_cell_idx[tot_visited]
+    return row.cell_index(tot_visited)
 
 
 def validate_multirow_cell(
@@ -1881,18 +3557,170 @@ def validate_multirow_cell(
     row[j] = cell
 
 
+@dataclass
+class MultirowSpan:
+    """A multirow cell whose following rows are still being visited."""
+
+    cell: MultirowCell
+    i: int
+    """Index of the row containing the multirow cell."""
+    j: int
+    """Index of the multirow cell in its row."""
+    col: int
+    """Logical column of the multirow cell."""
+    clen: int
+    next_cells: list[Cell] = field(default_factory=list)
+
+    def is_open(self) -> bool:
+        return len(self.next_cells) < self.clen - 1
+
+
+def extend_spans(
+    spans: list[MultirowSpan],
+    row: TableRow,
+    rows: Sequence[TableRow],
+    errors: list[tuple[int, int, ValueError]],
+    replacements: list[tuple[Row, int, Cell]],
+) -> list[MultirowSpan]:
+    """Extends the open multirow spans by `row` and returns those still open.
+
+    Empty cells below a multirow cell are to be replaced by `MrEmptyCell`s
+    linked to it; the replacements are recorded in `replacements`. Invalid
+    spans are recorded in `errors` keyed by the position of their multirow
+    cell.
+    """
+    if isinstance(row, Row):
+        for span in spans:
+            idx = row.cell_index(span.col)
+            cell = row.cells[idx]
+            span.next_cells.append(cell)
+            if not isinstance(cell, MrEmptyCell) and cell.is_empty():
+                ncell = MrEmptyCell()
+                ncell.link(span.cell)
+                replacements.append((row, idx, ncell))
+    elif isinstance(row, (Cmidrule, Cmidrules)):
+        for span in spans:
+            span.next_cells.append(MrEmptyCell())
+    else:
+        for span in spans:
+            f_rows = list(rows[span.i + 1 : span.i + span.clen])
+            errors.append(
+                (
+                    span.i,
+                    span.j,
+                    ValueError(
+                        "Row with multirow cell must be followed by "
+                        f"rows with empty cells. Found {f_rows}"
+                    ),
+                )
+            )
+        return []
+
+    still_open = []
+    for span in spans:
+        if span.is_open():
+            still_open.append(span)
+            continue
+        try:
+            validate_next_cells_mr(span.next_cells, span.clen)
+        except ValueError as e:
+            errors.append((span.i, span.j, e))
+    return still_open
+
+
 def validate_column_rows(rows: Sequence[TableRow]):
     """Validates rows in a single column.
 
-    I.e. all rows have one TableRow element.
+    I.e. all rows have one TableRow element. Multirow cells are converted to
+    `MultirowCell`s and linked to the cells below them in a single sweep
+    over the rows, keeping track of the spans open at each logical column.
+    If several spans are invalid the error of the first multirow cell is
+    raised. The cells of the rows are only replaced once all spans are
+    valid, s.t. the rows are left as they were if an error is raised.
     """
+    spans: list[MultirowSpan] = []
+    errors: list[tuple[int, int, ValueError]] = []
+    replacements: list[tuple[Row, int, Cell]] = []
     for i, row in enumerate(rows):
+        if spans:
+            spans = extend_spans(spans, row, rows, errors, replacements)
+        if errors:
+            first = min((e[0], e[1]) for e in errors)
+            if all((span.i, span.j) > first for span in spans):
+                break
         if isinstance(row, Row):
             tot_visited = 0
             for j, cell in enumerate(row.cells):
                 if cell.is_multirow():
-                    validate_multirow_cell(cell, row, rows, i, j, tot_visited)
+                    if not isinstance(cell, MultirowCell):
+                        cell = MultirowCell.from_cell(cell)
+                        replacements.append((row, j, cell))
+                    spans.append(MultirowSpan(cell, i, j, tot_visited, cell.clen()))
                 tot_visited += cell.__len__()  # e.g. multicolumn cell
+    else:
+        # Spans running past the last row
+        for span in spans:
+            try:
+                validate_next_cells_mr(span.next_cells, span.clen)
+            except ValueError as e:
+                errors.append((span.i, span.j, e))
+    if errors:
+        raise min(errors, key=lambda e: (e[0], e[1]))[2]
+    for row, j, cell in replacements:
+        row[j] = cell
+
+
+def has_multirow(row: TableRow) -> bool:
+    """Whether the row holds a multirow cell or a cell below one."""
+    return isinstance(row, Row) and any(
+        cell.is_multirow() or isinstance(cell, MrEmptyCell) for cell in row.cells
+    )
+
+
+def has_row(rows: Sequence[TableRow]) -> bool:
+    """Whether any of the rows is a `Row` i.e. fixes the number of columns."""
+    if isinstance(rows, ColumnarRows) and rows.nbody:
+        return True
+    return any(isinstance(row, Row) for row in rows)
+
+
+def inside_multirow(rows: Sequence[TableRow], index: int) -> bool:
+    """Whether a row inserted at `index` would land inside a multirow span.
+
+    That is the case if the first `Row` from `index` onwards holds a cell
+    linked to a multirow cell above it.
+    """
+    for i in range(index, len(rows)):
+        if isinstance(rows, ColumnarRows) and rows.is_lazy(i):
+            return False  # plain cells that have never been linked
+        if isinstance(row := rows[i], Row):
+            return any(isinstance(cell, MrEmptyCell) for cell in row.cells)
+    return False
+
+
+def validate_new_row(row: TableRow, ncols: int):
+    """Validates a single row against columns with `ncols` columns."""
+    if isinstance(row, Row):
+        if (n := len(row)) != ncols:
+            raise ValueError(
+                f"All rows must have same #cells i.e. columns differ."
+                f" Found unique row lengths: {set([n, ncols])}"
+            )
+    elif isinstance(row, Cmidrule):
+        check_cmidrule(row, ncols)
+    elif isinstance(row, Cmidrules):
+        for cmidrule in row.values:
+            check_cmidrule(cmidrule, ncols)
+
+
+def link_row_multirows(rows: Sequence[TableRow], i: int):
+    """Validates and links the multirow cells starting in row `i`."""
+    row = cast(Row, rows[i])
+    tot_visited = 0
+    for j, cell in enumerate(row.cells):
+        if cell.is_multirow():
+            validate_multirow_cell(cell, row, rows, i, j, tot_visited)
+        tot_visited += cell.__len__()
 
 
 def render_body(
@@ -1900,18 +3728,27 @@ def render_body(
     n: int,
     align: str | None = None,
 ):
+    return "\n".join(iter_render_body(body.splitlines(), n, align))
+
+
+def iter_render_body(
+    lines: Iterable[str],
+    n: int,
+    align: str | None = None,
+) -> Iterator[str]:
+    """Lines of `render_body` for a body given by its `lines`."""
     if not align:
         align = "@{}" + "c" * n + "{}@"
-    body = "\n".join("  " + line for line in body.splitlines())
-    return "\n".join(
-        [
-            r"\begin{tabular}{@{}" + align + "@{}}",
-            r"  \toprule",
-            body,
-            r"  \bottomrule",
-            r"\end{tabular}",
-        ]
-    )
+    yield r"\begin{tabular}{@{}" + align + "@{}}"
+    yield r"  \toprule"
+    empty = True
+    for line in lines:
+        empty = False
+        yield "  " + line
+    if empty:
+        yield ""
+    yield r"  \bottomrule"
+    yield r"\end{tabular}"
 
 
 def check_cmidrule(cmidrule: Cmidrule, n: int):
@@ -1961,19 +3798,108 @@ def cmidrules_ns(all_cols: Sequence[Columns | Column]):
 
 
 def update_cmidrules(
-    cmidrules: list[tuple[int, Cmidrule]],
+    cmidrules: list[tuple[int, Cmidrule | Cmidrules]],
     cmid_ns: list[int],
 ) -> Cmidrules:
+    """Joins cmidrules of the `j`-th columns displaced by `cmid_ns[j]`.
+
+    The joined columns are disjoint and given in order, hence so are the
+    displaced cmidrules and they are not sorted or checked again.
+    Undisplaced cmidrules are shared with the input.
+    """
     ncmidrules: list[Cmidrule] = []
     for j, cmidrule in cmidrules:
-        cmidrule = deepcopy(cmidrule)
-        d = cmidrule.dlen()
-        n = cmid_ns[j]
-        new_start = cmidrule.start + n
-        cmidrule.start = new_start
-        cmidrule.end = new_start + d
-        ncmidrules.append(cmidrule)
-    return Cmidrules(values=ncmidrules)
+        shifted = cmidrule.shift(cmid_ns[j])
+        if isinstance(shifted, Cmidrules):
+            ncmidrules.extend(shifted.values)
+        else:
+            ncmidrules.append(shifted)
+    return Cmidrules._from_sorted(ncmidrules)
+
+
+def copy_multirow_cell(
+    cell: Cell,
+    memo: dict[int, tuple[MultirowCell, set[int]]],
+) -> Cell:
+    """Copies `cell` if it is part of a multirow group; else returns it.
+
+    `memo` maps the id of an original `MultirowCell` to its copy and the ids
+    of its original empty cells s.t. a group is copied once and its copied
+    `MrEmptyCell`s are linked to the copied `MultirowCell`.
+    """
+    if isinstance(cell, MultirowCell):
+        return copy_multirow_group(cell, memo)[0]
+    if isinstance(cell, MrEmptyCell):
+        new = MrEmptyCell(name=cell.name)
+        if cell.mr is not None:
+            mr, empty_ids = copy_multirow_group(cell.mr, memo)
+            if id(cell) in empty_ids:
+                mr.add_empty_cell(new)
+            else:
+                new.link(mr)
+        return new
+    return cell
+
+
+def copy_multirow_group(
+    cell: MultirowCell,
+    memo: dict[int, tuple[MultirowCell, set[int]]],
+) -> tuple[MultirowCell, set[int]]:
+    if (out := memo.get(id(cell))) is not None:
+        return out
+    new = copy(cell)
+    new.empty_cells = []
+    out = memo[id(cell)] = (new, {id(f) for f in cell.empty_cells})
+    return out
+
+
+def row_cells_cow(rows: Sequence[TableRow]) -> list[Sequence[Cell] | TableRow]:
+    """Cells of each row with copy-on-write semantics for multirow groups.
+
+    Rows without multirow cells give their `cells` as is, i.e. the cells are
+    shared with the input. Only rows holding a `MultirowCell` or
+    `MrEmptyCell` get fresh copies, linked within the returned rows, s.t.
+    joining the same columns multiple times keeps the links apart.
+    Non-`Row` rows are returned as is.
+    """
+    memo: dict[int, tuple[MultirowCell, set[int]]] = {}
+    out: list[Sequence[Cell] | TableRow] = []
+    for row in rows:
+        if not isinstance(row, Row):
+            out.append(row)
+        elif any(isinstance(f, (MultirowCell, MrEmptyCell)) for f in row.cells):
+            out.append([copy_multirow_cell(f, memo) for f in row.cells])
+        else:
+            out.append(row.cells)
+    return out
+
+
+def escape_rows(rows: Sequence[TableRow], escape: bool = True) -> Sequence[TableRow]:
+    """Rows with the `escape` flag of all cells set to `escape`.
+
+    The cells are copied, see `row_cells_cow`, s.t. `rows` are not modified.
+    Columnar bodies that are not materialized only get new flags per column.
+    """
+    if isinstance(rows, ColumnarRows) and not rows.is_materialized():
+        out = rows._view(
+            rows.off,
+            rows.nbody,
+            list(escape_rows(rows.head, escape)),
+            list(escape_rows(rows.tail, escape)),
+        )
+        out.escapes = [escape] * rows.ncols
+        return out
+    out: list[TableRow] = []
+    for row, cells in zip(rows, row_cells_cow(rows)):
+        if not isinstance(row, Row):
+            out.append(row)
+            continue
+        # Fresh copies of multirow groups are ours; copy the shared cells
+        cells = [copy(f) if f is g else f for f, g in zip(cells, row.cells)]
+        for cell in cells:
+            cell.escape = escape
+        out.append(row._shell(cells, replaced=True))
+    return out
 
 
 def check_empty_cells(rows: Iterable[TableRow]):
@@ -1983,10 +3909,17 @@ def check_empty_cells(rows: Iterable[TableRow]):
             [row.cells for row in rows if isinstance(row, Row)]
         )
     ]
-    return all(not f.value for f in cells)
+    return all(f.is_empty() for f in cells)
+
 
+def join_rows[C: Columns](
+    all_cols: Sequence[Columns],
+    cls: type[C] = Columns,
+) -> C:
+    """Joins columns vertically into a single `cls` object.
 
-def join_rows(all_cols: list[Columns]):
+    The result is validated once.
+    """
     if not all(isinstance(c, Columns) for c in all_cols):
         raise TypeError(
             f"All columns must be Columns objects; got {[type(c) for c in all_cols]}"
@@ -1995,14 +3928,125 @@ def join_rows(all_cols: list[Columns]):
         raise ValueError(
             f"All columns must have same number of columns to join rows. Found: {r}"
         )
+    align = all_cols[0].align
+    if (out := stack_columnar(all_cols)) is not None:
+        return cls._from_trusted(out, align, all_cols[0].ncols)
     new_rows = []
     for col in all_cols:
         new_rows.extend(col.all_rows())
-    align = all_cols[0].align
-    return Columns(rows=new_rows, align=align)
+    return cls._from_trusted(new_rows, align, all_cols[0].ncols)
 
 
-def join_columns(all_cols: Sequence[Columns | Column]):
+def stack_columnar(all_cols: Sequence[Columns]) -> ColumnarRows | None:
+    """Stacks columns around columnar bodies by concatenating their arrays.
+
+    The rows of the columns before (after) the columnar ones are added to the
+    head (tail). Returns None if the columnar ones are not adjacent bodies
+    with the same number formats and escaping.
+    """
+    idx = [i for i, c in enumerate(all_cols) if isinstance(c.rows, ColumnarRows)]
+    if not idx:
+        return None
+    parts = columnar_parts(all_cols[idx[0] : idx[-1] + 1])
+    if (
+        parts is None
+        or any(p.tail for p in parts[:-1])
+        or any(p.head for p in parts[1:])
+        or any(p.formats != parts[0].formats for p in parts[1:])
+        or any(p.escapes != parts[0].escapes for p in parts[1:])
+    ):
+        return None
+    body = [
+        list(chain.from_iterable(c)) for c in zip(*(p.body_columns() for p in parts))
+    ]
+    before = chain.from_iterable(c.all_rows() for c in all_cols[: idx[0]])
+    after = chain.from_iterable(c.all_rows() for c in all_cols[idx[-1] + 1 :])
+    return ColumnarRows(
+        body,
+        nbody=sum(p.nbody for p in parts),
+        head=[*before, *parts[0].head],
+        tail=[*parts[-1].tail, *after],
+        formats=parts[0].formats,
+        escapes=parts[0].escapes,
+    )
+
+
+def join_columnar(all_cols: Sequence[Columns]) -> ColumnarRows | None:
+    """Joins columnar bodies side by side by concatenating their arrays.
+
+    The heads and tails are joined with `join_columns`. Returns None if not
+    all columns are columnar with equally shaped heads, bodies and tails.
+    """
+    parts = columnar_parts(all_cols)
+    if (
+        parts is None
+        or len(set((len(p.head), p.nbody, len(p.tail)) for p in parts)) != 1
+        or not parts[0].nbody
+    ):
+        return None
+
+    def join(rows: list[list[TableRow]]) -> list[TableRow]:
+        if not rows[0]:
+            return []
+        pieces = [
+            Columns._from_trusted(r, c.align, c.ncols) for r, c in zip(rows, all_cols)
+        ]
+        return list(join_columns(pieces).rows)
+
+    return ColumnarRows(
+        [col for p in parts for col in p.body_columns()],
+        nbody=parts[0].nbody,
+        head=join([p.head for p in parts]),
+        tail=join([p.tail for p in parts]),
+        formats=[fmt for p in parts for fmt in p.formats],
+        escapes=[esc for p in parts for esc in p.escapes],
+    )
+
+
+type RowKind = Literal["row", "cmidrule", "cmidrules", "colored", "midrule", "rule"]
+
+ROW_KINDS: dict[type, RowKind] = {}
+KINDS_ROW = frozenset({"row"})
+KINDS_CMIDRULE = frozenset({"cmidrule"})
+KINDS_CMIDRULE_ROW = frozenset({"cmidrule", "row"})
+KINDS_COLORED = frozenset({"colored"})
+KINDS_MIDRULE = frozenset({"midrule"})
+KINDS_RULES = frozenset({"colored", "midrule", "rule"})
+KINDS_CMIDRULES_MIX = frozenset({"cmidrules", "cmidrule", "row"})
+
+
+def row_kind(row: TableRow) -> RowKind:
+    """Classifies a `TableRow` for joining; cached per type."""
+    if (kind := ROW_KINDS.get(type(row))) is not None:
+        return kind
+    if isinstance(row, Row):
+        kind = "row"
+    elif isinstance(row, Cmidrule):
+        kind = "cmidrule"
+    elif isinstance(row, Cmidrules):
+        kind = "cmidrules"
+    elif isinstance(row, ColoredRow):
+        kind = "colored"
+    elif isinstance(row, Midrule):
+        kind = "midrule"
+    elif isinstance(row, Rule):
+        kind = "rule"
+    else:
+        raise TypeError(f"Row must be a TableRow object; got {type(row)}")
+    ROW_KINDS[type(row)] = kind
+    return kind
+
+
+def join_columns[C: Columns](
+    all_cols: Sequence[Columns | Column],
+    cls: type[C] = Columns,
+) -> C:
+    """Joins columns horizontally into a single `cls` object.
+
+    Works for any number of columns in one pass: the kinds of the rows at
+    each row index are classified once, cmidrule displacements come from
+    prefix sums of the column counts and the result is validated once.
+    """
     if not all(isinstance(c, Columns) for c in all_cols):
         raise TypeError(
             f"All columns must be Columns objects; got {[type(c) for c in all_cols]}"
@@ -2011,105 +4055,79 @@ def join_columns(all_cols: Sequence[Columns | Column]):
         raise ValueError(
             f"All columns must have same number of rows. Found: {sorted(r)}"
         )
-    all_cols = [
-        # e.g. when concatenating same column multiple times with multirow
-        # inside we need to deepcopy object for linking to work
-        deepcopy(col)
-        for col in all_cols
-    ]
+    new_align = "".join([c.align for c in all_cols])
+    if (out := join_columnar(all_cols)) is not None:
+        return cls._from_trusted(out, new_align, sum(c.ncols for c in all_cols))
     new_rows = []
-    new_n = sum([c.ncols for c in all_cols])
     cmid_ns = cmidrules_ns(all_cols)
-    new_align = "".join([c.align for c in all_cols])
-    for i, group in enumerate(zip(*[c.all_rows() for c in all_cols], strict=True)):
-        match group:
-            case [*rows] if all(isinstance(x, Row) for x in rows):
-                rows = cast(list[Row], rows)
-                new_row = Row(
-                    cells=[f for f in chain.from_iterable([row.cells for row in rows])]
-                )
-                new_rows.append(new_row)
-            case [*rows] if all(isinstance(x, Cmidrule) for x in rows):
-                rows = cast(list[Cmidrule], rows)
-                new_cmidrule = update_cmidrules(
-                    [(j, r) for j, r in enumerate(rows)],
-                    cmid_ns,
-                )
-                new_rows.append(new_cmidrule)
-            case [*rows] if all(isinstance(x, (Cmidrule, Row)) for x in rows):
-                # Cmidrules and rows; assert cells empty and return cmidrules
-                # Also have to update cmidrule start and end
-                rows = cast(list[TableRow], rows)
-                if not check_empty_cells(rows):
-                    raise ValueError(
-                        "Row cells must be empty when mixing Cmidrule and Row"
-                    )
-                new_cmidrule = update_cmidrules(
-                    [(j, r) for j, r in enumerate(rows) if isinstance(r, Cmidrule)],
-                    cmid_ns,
-                )
-                new_rows.append(new_cmidrule)
-            case [*rows] if all(isinstance(x, ColoredRow) for x in rows):
-                rows = cast(list[ColoredRow], rows)
-                if len(rows) > 1:
-                    raise ValueError("Cannot have multiple ColoredRows in same row.")
-                (row,) = rows
-                new_rows.append(row)
-            case [*rows] if all(isinstance(x, Midrule) for x in rows):
+    all_rows = [c.all_rows() for c in all_cols]
+    # e.g. when concatenating same column multiple times with multirow
+    # inside the multirow groups are copied for linking to work; all other
+    # cells are shared with the input columns.
+    all_cells = [row_cells_cow(rows) for rows in all_rows]
+    all_kinds = [[row_kind(row) for row in rows] for rows in all_rows]
+    for group, cells, group_kinds in zip(
+        zip(*all_rows, strict=True),
+        zip(*all_cells, strict=True),
+        zip(*all_kinds, strict=True),
+    ):
+        kinds = frozenset(group_kinds)
+        if kinds == KINDS_ROW:
+            new_rows.append(Row(cells=list(chain.from_iterable(cells))))
+        elif kinds == KINDS_CMIDRULE:
+            rows = cast(tuple[Cmidrule, ...], group)
+            new_cmidrule = update_cmidrules(list(enumerate(rows)), cmid_ns)
+            new_rows.append(new_cmidrule)
+        elif kinds == KINDS_CMIDRULE_ROW:
+            # Cmidrules and rows; assert cells empty and return cmidrules
+            # Also have to update cmidrule start and end
+            if not check_empty_cells(group):
+                raise ValueError("Row cells must be empty when mixing Cmidrule and Row")
+            new_cmidrule = update_cmidrules(
+                [(j, r) for j, r in enumerate(group) if isinstance(r, Cmidrule)],
+                cmid_ns,
+            )
+            new_rows.append(new_cmidrule)
+        elif kinds == KINDS_COLORED:
+            if len(group) > 1:
+                raise ValueError("Cannot have multiple ColoredRows in same row.")
+            (row,) = group
+            new_rows.append(row)
+        elif kinds == KINDS_MIDRULE:
+            new_rows.append(Midrule())
+        elif kinds <= KINDS_RULES:
+            is_color = "colored" in kinds
+            is_midrule = "midrule" in kinds
+            if is_color and is_midrule:
+                raise ValueError("Cannot mix ColoredRow and Midrule in same row.")
+            if is_midrule:
                 new_rows.append(Midrule())
-            case [*rows] if all(isinstance(x, Rule) for x in rows):
-                is_color = any([isinstance(x, ColoredRow) for x in rows])
-                is_midrule = any([isinstance(x, Midrule) for x in rows])
-                if is_color and is_midrule:
-                    raise ValueError("Cannot mix ColoredRow and Midrule in same row.")
-                if is_midrule:
-                    new_rows.append(Midrule())
-            case [*rows] if all(isinstance(x, (Row, Rule)) for x in rows):
-                rows = cast(list[TableRow], rows)
-                if not check_empty_cells(rows):
-                    raise ValueError(
-                        "Row cells must be empty when mixing Midrule and Row"
-                    )
-                rows_rule = [r for r in rows if isinstance(r, Rule)]
-                if len(rows_rule) == 1:
-                    (rule,) = rows_rule
-                    new_rows.append(rule)
-            case [*rows] if all(isinstance(x, (Cmidrules, Row)) for x in rows):
-                # Same as for single cmidrule
-                rows = cast(list[TableRow], rows)
-                if not check_empty_cells(rows):
-                    raise ValueError(
-                        "Row cells must be empty when mixing Cmidrules and Row"
-                    )
-                all_cmids = []
-                for j, r in enumerate(rows):
-                    if isinstance(r, Cmidrules):
-                        for cmid in r.values:
-                            # idx j for correct displacement
-                            # if multiple cmidrules they need same displacement
-                            # based on the Columns object they came from.
-                            all_cmids.append((j, cmid))
-                new_cmidrule = update_cmidrules(all_cmids, cmid_ns)
-                new_rows.append(new_cmidrule)
-            case [*rows] if all(isinstance(x, (Cmidrules, Cmidrule)) for x in rows):
-                cmidrules: list[Cmidrule] = []
-                for row in rows:
-                    if isinstance(row, Cmidrules):
-                        if len(row.values) > 1:
-                            raise ValueError(
-                                "Join with multiple cmidrules not implemented yet"
-                            )
-                        cmidrules.extend(row.values)
-                    else:
-                        cmidrules.append(row)
-                new_cmidrule = update_cmidrules(
-                    [(j, r) for j, r in enumerate(cmidrules)],
-                    cmid_ns,
+        elif "row" in kinds and kinds - KINDS_ROW <= KINDS_RULES:
+            if not check_empty_cells(group):
+                raise ValueError("Row cells must be empty when mixing Midrule and Row")
+            rows_rule = [r for r in group if isinstance(r, Rule)]
+            if len(rows_rule) == 1:
+                (rule,) = rows_rule
+                new_rows.append(rule)
+        elif "cmidrules" in kinds and kinds <= KINDS_CMIDRULES_MIX:
+            # Same as for single cmidrule; a mix of Cmidrule and Cmidrules
+            # rows is displaced per input as well
+            if not check_empty_cells(group):
+                raise ValueError(
+                    "Row cells must be empty when mixing Cmidrules and Row"
                 )
-                new_rows.append(new_cmidrule)
-            case _:  # pragma: no cover
-                raise ValueError("All rows must be of same type (Row or Cmidrule)")
-    return Columns(rows=new_rows, align=new_align)
+            # idx j for correct displacement based on the Columns object
+            # the cmidrule(s) came from.
+            all_cmids = [
+                (j, r)
+                for j, r in enumerate(group)
+                if isinstance(r, (Cmidrule, Cmidrules))
+            ]
+            new_cmidrule = update_cmidrules(all_cmids, cmid_ns)
+            new_rows.append(new_cmidrule)
+        else:  # pragma: no cover
+            raise ValueError("All rows must be of same type (Row or Cmidrule)")
+    return cls._from_trusted(new_rows, new_align)
 
 
 def concat(
@@ -2136,11 +4154,340 @@ def concat(
     match how:
         case "vertical":
             # Concatenate rows
-            new_cols = join_rows([t.columns for t in tables])
-            return Table.from_columns(columns=new_cols)
+            return join_rows(tables, cls=Table)
         case "horizontal":
             # Concatenate columns
-            new_cols = join_columns([t.columns for t in tables])
-            return Table.from_columns(columns=new_cols)
+            return join_columns(tables, cls=Table)
         case _:
             raise ValueError(f"Invalid {how=}")
+
+
+type ExprKind = Literal["leaf", "horizontal", "vertical"]
+
+
+@dataclass
+class TableExpr:
+    """A lazily composed table.
+
+    Records `|` and `/` between tables, columns, rows and cells without
+    building any intermediate `Columns`. Nothing is joined, copied or
+    validated until `collect` (or `render`) is called; chains of the same
+    operator are then flattened and joined in one go, so that reducing
+    over `n` parts does linear instead of quadratic work.
+
+    ```python
+    from functools import reduce
+    import tabx
+
+    parts = [tabx.Table.from_values([[i], [i]]) for i in range(100)]
+    tab = reduce(lambda x, y: x | y, parts, tabx.lazy(parts[0])).collect()
+    ```
+    """
+
+    how: ExprKind
+    parts: tuple[Any, ...]
+
+    def __repr__(self) -> str:
+        return f"TableExpr(how={self.how}, #parts={len(self.parts)})"
+
+    def __or__(self, other) -> TableExpr:
+        return TableExpr("horizontal", (self, _lazy_operand(other, "|")))
+
+    def __ror__(self, other) -> TableExpr:
+        return TableExpr("horizontal", (_lazy_operand(other, "|"), self))
+
+    def __truediv__(self, other) -> TableExpr:
+        return TableExpr("vertical", (self, _lazy_operand(other, "/")))
+
+    def __rtruediv__(self, other) -> TableExpr:
+        return TableExpr("vertical", (_lazy_operand(other, "/"), self))
+
+    def __getitem__(self, index: Index | tuple[Index, Index]) -> TableExpr:
+        """Lazily selects rows and columns, see `Table.__getitem__`.
+
+        The selection is pushed down to the operands of `|` and `/` s.t.
+        only the selected part of each operand is copied and joined on
+        `collect`, e.g. `(lazy(a) | b | c)[2:, 3:]` doesn't build the full
+        join. Cmidrules are displaced for the narrower result by the join.
+        Where pushing down could change the result, e.g. for rules merged by
+        a horizontal join, the expression is collected and then sliced.
+        """
+        if isinstance(index, tuple):
+            if len(index) != 2:
+                raise ValueError(f"Index {index} not valid")
+            idx_row, idx_column = index
+        else:
+            idx_row, idx_column = index, None
+        if (layout := expr_layout(self)) is not None:
+            kinds, ncols = layout
+            rows = index_positions(idx_row, len(kinds))
+            cols = None
+            if idx_column is not None:
+                cols = index_positions(idx_column, ncols or 0)
+            # Rules alone don't give the #columns to validate the stacking
+            has_row = any(kinds[i] == "row" for i in rows)
+            if has_row and (cols is None or cols):
+                return lazy(push_down(self, rows, cols))
+        return lazy(self.collect()[index])
+
+    def collect(self) -> Table:
+        """Materialize the expression into a `Table`."""
+        out = materialize_expr(self, cls=Table)
+        if isinstance(out, Table):
+            return out
+        if isinstance(out, Columns):
+            return Table.from_columns(out)
+        if isinstance(out, Cell):
+            return Table([Row([out])])
+        return Table([out])
+
+    def render(
+        self,
+        custom_render: Callable[..., str] | None = None,
+        *args,
+        **kwargs,
+    ) -> str:
+        """Materialize the expression and render it; see `Table.render`."""
+        return self.collect().render(custom_render, *args, **kwargs)
+
+
+LazyOperand_ = (Columns, Cell, Row, Cmidrule, Cmidrules, Rule)
+
+
+def lazy(obj: Columns | Cell | TableRow | TableExpr) -> TableExpr:
+    """Start a lazy composition from `obj`.
+
+    See `TableExpr`.
+    """
+    if isinstance(obj, TableExpr):
+        return obj
+    if not isinstance(obj, LazyOperand_):
+        raise TypeError(f"Cannot compose object of type '{type(obj).__name__}'")
+    return TableExpr("leaf", (obj,))
+
+
+def _lazy_operand(obj, op: Literal["|", "/"]) -> TableExpr:
+    if op == "|" and isinstance(obj, (Cmidrule, Cmidrules, Rule)):
+        raise TypeError(
+            f"unsupported operand type(s) for |: 'TableExpr' and '{type(obj).__name__}'"
+        )
+    return lazy(obj)
+
+
+def flatten_expr(expr: TableExpr) -> list[Any]:
+    """Flattens nested nodes of the same kind as `expr` into one list.
+
+    Iterative s.t. long left-deep chains (from `reduce`) don't hit the
+    recursion limit.
+    """
+    out = []
+    stack: list[Any] = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, TableExpr) and node.how == expr.how:
+            stack.extend(reversed(node.parts))
+        elif isinstance(node, TableExpr) and node.how == "leaf":
+            out.append(node.parts[0])
+        else:
+            out.append(node)
+    return out
+
+
+def materialize_expr(
+    expr: TableExpr,
+    cls: type[Columns] = Columns,
+) -> Columns | Cell | TableRow:
+    """Joins all parts of `expr` with one join per concatenation.
+
+    Concatenations are built as `cls` objects.
+    """
+    if expr.how == "leaf":
+        return expr.parts[0]
+    parts = [
+        materialize_expr(p) if isinstance(p, TableExpr) else p
+        for p in flatten_expr(expr)
+    ]
+    match expr.how:
+        case "horizontal":
+            return join_columns([as_columns(p) for p in parts], cls=cls)
+        case "vertical":
+            return stack_rows(parts, cls=cls)
+        case _:  # pragma: no cover
+            assert_never(expr.how)
+
+
+PUSHDOWN_KINDS: dict[RowKind, RowKind] = {
+    "row": "row",
+    "midrule": "midrule",
+    "cmidrule": "cmidrule",
+    "cmidrules": "cmidrule",
+}
+"""Row kinds that a horizontal join keeps as one row of the same kind."""
+
+
+type Layout = tuple[list[RowKind], int | None]
+
+
+def expr_layout(obj: Any) -> Layout | None:
+    """Row kinds and number of columns of a lazy operand without joining it.
+
+    `None` if selections can't be pushed down to the parts of `obj`: a
+    horizontal join merging rows of different kinds or dropping rules,
+    operands that don't fit together, or multirow cells in single rows that
+    are only linked when stacked.
+    """
+    if isinstance(obj, Columns):
+        rows = obj.all_rows()
+        if isinstance(rows, ColumnarRows):
+            kinds = [
+                *map(row_kind, rows.head),
+                *it.repeat(cast(RowKind, "row"), rows.nbody),
+                *map(row_kind, rows.tail),
+            ]
+        else:
+            kinds = [row_kind(row) for row in rows]
+        return kinds, obj.ncols
+    if isinstance(obj, (Cell, Row)):
+        return ["row"], len(obj)
+    if not isinstance(obj, TableExpr):
+        return [row_kind(obj)], None
+    if obj.how == "leaf":
+        return expr_layout(obj.parts[0])
+
+    parts = flatten_expr(obj)
+    layouts = [expr_layout(p) for p in parts]
+    if any(layout is None for layout in layouts):
+        return None
+    layouts = cast(list[Layout], layouts)
+    if obj.how == "horizontal":
+        kinds = [PUSHDOWN_KINDS.get(k) for k in layouts[0][0]]
+        if None in kinds:
+            return None
+        for other, _ in layouts[1:]:
+            if [PUSHDOWN_KINDS.get(k) for k in other] != kinds:
+                return None
+        return cast(list[RowKind], kinds), sum(n or 0 for _, n in layouts)
+    if any(
+        isinstance(p, Cell)
+        and p.is_multirow()
+        or isinstance(p, Row)
+        and has_multirow(p)
+        for p in parts
+    ):
+        return None
+    if len(ncols := {n for _, n in layouts if n is not None}) > 1:
+        return None
+    return [k for kinds, _ in layouts for k in kinds], next(iter(ncols), None)
+
+
+def group_positions(
+    positions: Sequence[int],
+    sizes: Sequence[int],
+) -> list[tuple[int, list[int]]]:
+    """Maps positions over consecutive parts of `sizes` to the parts.
+
+    Returns the part index and the positions local to the part for each run
+    of positions falling into the same part.
+    """
+    bounds = [0, *it.accumulate(sizes)]
+    groups: list[tuple[int, list[int]]] = []
+    for pos in positions:
+        k = bisect.bisect_right(bounds, pos) - 1
+        if groups and groups[-1][0] == k:
+            groups[-1][1].append(pos - bounds[k])
+        else:
+            groups.append((k, [pos - bounds[k]]))
+    return groups
+
+
+def push_down(obj: Any, rows: Sequence[int], cols: Sequence[int] | None) -> Any:
+    """Selects `rows` and `cols` of a lazy operand by selecting in its parts.
+
+    The operand must have a layout, see `expr_layout`. Returns an operand
+    for `lazy`; nothing is joined.
+    """
+    if isinstance(obj, Cell):
+        obj = Row([obj])
+    if isinstance(obj, Row) and list(rows) != [0]:
+        obj = Columns([obj])
+    if isinstance(obj, Columns):
+        if not rows:
+            # Only carries the alignment and #columns when stacking
+            if cols is None:
+                return type(obj)._from_trusted([], obj.align, obj.ncols)
+            return type(obj)._from_trusted([], "", len(cols))
+        out = take_rows(obj, rows)
+        return out if cols is None else take_columns(out, cols)
+    if not isinstance(obj, TableExpr):
+        if cols is None:
+            return obj
+        runs = column_runs(cols)
+        return take_row_columns(obj, runs, [None] * len(runs))
+    if obj.how == "leaf":
+        return push_down(obj.parts[0], rows, cols)
+
+    parts = flatten_expr(obj)
+    layouts = [cast(Layout, expr_layout(p)) for p in parts]
+    pieces: list[Any] = []
+    if obj.how == "horizontal":
+        if cols is None:
+            pieces = [push_down(p, rows, None) for p in parts]
+        else:
+            groups = group_positions(cols, [n or 0 for _, n in layouts])
+            pieces = [push_down(parts[k], rows, local) for k, local in groups]
+        return TableExpr("horizontal", tuple(map(lazy, pieces)))
+
+    # Stacking takes the alignment from the first part with columns
+    first = next(
+        (k for k, p in enumerate(parts) if isinstance(p, (Columns, TableExpr))),
+        None,
+    )
+    if not rows:
+        if first is not None:
+            return push_down(parts[first], [], cols)
+        ncols = cast(Layout, expr_layout(obj))[1] or 0
+        return Columns._from_trusted([], "", ncols if cols is None else len(cols))
+    for k, local in group_positions(rows, [len(kinds) for kinds, _ in layouts]):
+        if first is not None and not pieces and k != first:
+            pieces.append(push_down(parts[first], [], cols))
+        part = parts[k]
+        if isinstance(part, (Columns, TableExpr)):
+            pieces.append(push_down(part, local, cols))
+            continue
+        # A single row; repeats get their own row
+        piece = push_down(part, [0], cols)
+        pieces.append(piece)
+        for _ in local[1:]:
+            pieces.append(Row(list(piece.cells)) if isinstance(piece, Row) else piece)
+    return TableExpr("vertical", tuple(map(lazy, pieces)))
+
+
+def as_columns(obj: Columns | Cell | TableRow) -> Columns:
+    """Wrap a cell or row into `Columns` for horizontal joining."""
+    if isinstance(obj, Columns):
+        return obj
+    if isinstance(obj, Row):
+        return Columns([obj])
+    if isinstance(obj, Cell):
+        return Columns([Row([obj])])
+    raise TypeError(
+        f"unsupported operand type(s) for |: 'Columns' and '{type(obj).__name__}'"
+    )
+
+
+def stack_rows[C: Columns](
+    parts: Sequence[Columns | Cell | TableRow],
+    cls: type[C] = Columns,
+) -> C:
+    """Stacks columns, rows and cells vertically into a single `Columns`."""
+    rows: list[TableRow] = []
+    align = ""
+    for part in parts:
+        if isinstance(part, Columns):
+            rows.extend(part.all_rows())
+            align = align or part.align
+        elif isinstance(part, Cell):
+            rows.append(Row([part]))
+        else:
+            rows.append(part)
+    return cls(rows=rows, align=align)
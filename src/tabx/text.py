@@ -1,5 +1,38 @@
+import re
 from typing import Literal
 
+LATEX_ESCAPES = str.maketrans(
+    {
+        "&": r"\&",
+        "%": r"\%",
+        "$": r"\$",
+        "#": r"\#",
+        "_": r"\_",
+        "{": r"\{",
+        "}": r"\}",
+        "~": r"\textasciitilde{}",
+        "^": r"\textasciicircum{}",
+        "\\": r"\textbackslash{}",
+        "<": r"\textless{}",
+        ">": r"\textgreater{}",
+        "|": r"\textbar{}",
+    }
+)
+"""Translation table of `escape_latex`."""
+LATEX_SPECIAL = re.compile(r"[&%$#_{}~^\\<>|]")
+"""Characters that `escape_latex` escapes."""
+
+
+def escape_latex(s: str) -> str:
+    """Escape the characters with a special meaning in LaTeX.
+
+    E.g. `escape_latex("R&D_1")` gives `R\\&D\\_1`. Strings without such
+    characters are returned as is.
+    """
+    if LATEX_SPECIAL.search(s) is None:
+        return s
+    return s.translate(LATEX_ESCAPES)
+
 
 def bf(s: str):
     """Wrap text in LaTeX \\textbf{} (boldface)."""
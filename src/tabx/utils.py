@@ -149,15 +149,25 @@ def compile_table(
     )
 
 
-def save_table(tab: str | Table, file: PathArg):  # pragma: no cover
+def save_table(
+    tab: str | Table,
+    file: PathArg,
+    streaming: bool = False,
+):  # pragma: no cover
     """Saves a LaTeX table to a file.
 
     Args:
         file: The name of the file to save.
         tab: The LaTeX table to save.
+        streaming: Write a `Table` line by line instead of rendering it to
+            a single string first; see `Table.render_to`.
     """
     if isinstance(file, str):
         file = Path(file)
+    if isinstance(tab, Table) and streaming:
+        with open(file, "w") as f:
+            tab.render_to(f)
+        return
     if isinstance(tab, Table):
         tab = tab.render()
     with open(file, "w") as f:
@@ -189,7 +189,9 @@ def test_model_data():
     assert len(col := custom.make_est_col(mod1)) == 5
     assert all(isinstance(f, RegCell) for f in col)
     assert [f.est.name for f in col] == ["v1", "v2", "v3", "v4", "v5"]
-    assert [f.est.value for f in col] == [f"{i}" for i in range(1, 6)]
+    assert [f.est.value for f in col] == [1, 2, 3, 4, 5]
+    assert [f.est.render() for f in col] == [f"{i}" for i in range(1, 6)]
+    assert [f.se.render() for f in col] == [f"({i / 10})" for i in range(1, 6)]
 
 
 def test_model_table():
@@ -380,7 +382,8 @@ def test_desc_data():
     assert len(col) == 5
     assert all(isinstance(f, Cell) for f in col)
     assert [f.name for f in col] == ["v1", "v2", "v3", "v4", "v5"]
-    assert [f.value for f in col] == ["1.0", "2.0", "3", "4.0", "5"]
+    assert [f.value for f in col] == [1.0, 2.0, 3, 4.0, 5]
+    assert [f.render() for f in col] == ["1.0", "2.0", "3", "4.0", "5"]
 
 
 def test_desc_data_from_values():
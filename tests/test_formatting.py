@@ -0,0 +1,94 @@
+import pytest
+
+import tabx
+from tabx import Cell, NumberFormat
+
+
+def test_number_format():
+    assert NumberFormat().format(1.5) == "1.5"
+    assert NumberFormat(decimals=2).format(1) == "1.00"
+    assert NumberFormat(decimals=2, thousands=True).format(1234.567) == "1,234.57"
+    assert NumberFormat(decimals=1, scientific=True).format(1234) == "1.2e+03"
+    assert NumberFormat(decimals=0, siunitx=True).format(12) == r"\num{12}"
+    assert NumberFormat(decimals=3, parens=True).format(0.0123) == "(0.012)"
+    assert NumberFormat(siunitx=True, parens=True).format(2) == r"(\num{2})"
+    # Strings are only wrapped
+    assert NumberFormat(decimals=2, parens=True).format("n/a") == "(n/a)"
+    assert NumberFormat(decimals=2, parens=True).format("") == ""
+
+    with pytest.raises(ValueError):
+        NumberFormat(decimals=-1)
+    with pytest.raises(ValueError):
+        NumberFormat(thousands=True, siunitx=True)
+
+    fmt = NumberFormat(decimals=2, parens=True)
+    values = [1, 2.345, "x", 0.5]
+    assert fmt.format_many(values) == [fmt.format(v) for v in values]
+    assert fmt.format_many(range(3)) == ["(0.00)", "(1.00)", "(2.00)"]
+
+
+def test_number_format_numpy():
+    np = pytest.importorskip("numpy")
+    fmt = NumberFormat(decimals=1, thousands=True)
+    assert fmt.format_many(np.array([1234.56, 7.0])) == ["1,234.6", "7.0"]
+
+
+def test_cell_number_format():
+    cell = Cell(0.12345, number_format=NumberFormat(decimals=2), style="bold")
+    assert cell.value == 0.12345
+    assert cell.render() == r"\textbf{0.12}"
+    cell.number_format = NumberFormat(decimals=3)
+    assert cell.render() == r"\textbf{0.123}"
+    assert not Cell(0).is_empty()
+    assert Cell("").is_empty()
+
+
+@pytest.mark.parametrize("storage", ["rows", "columnar"])
+def test_from_values_formats(storage):
+    values = [[1234.5, 0.1, "a"], [2, 0.25, "b"]]
+    formats = [NumberFormat(decimals=0, thousands=True), NumberFormat(decimals=2), None]
+    tab = tabx.Table.from_values(values, storage=storage, formats=formats)
+    assert tab.render_body() == "1,234 & 0.10 & a \\\\\n2 & 0.25 & b \\\\"
+    assert tab.rows[0].cells[0].value == 1234.5
+    # Number formats are kept when slicing and joining columnar tables
+    assert (tab[:, 1] | tab[:, 0]).render_body() == "0.10 & 1,234 \\\\\n0.25 & 2 \\\\"
+    assert (tab / tab).render_body() == "\n".join([tab.render_body()] * 2)
+    with pytest.raises(ValueError):
+        tabx.Table.from_values(values, storage=storage, formats=formats[:2])
+
+    plain = tabx.Table.from_values(values, storage=storage)
+    assert plain.render_body() == "1234.5 & 0.1 & a \\\\\n2 & 0.25 & b \\\\"
+
+
+def test_models_table_number_format():
+    mod = tabx.ModelData(
+        variables=["x", "y"],
+        estimates=[1.23456, 2],
+        ses=[0.1, 0.25],
+        name="(1)",
+        number_format=NumberFormat(decimals=2),
+    )
+    col = tabx.custom.make_est_col(mod)
+    assert [c.est.render() for c in col] == ["1.23", "2.00"]
+    assert [c.se.render() for c in col] == ["(0.10)", "(0.25)"]
+
+
+def test_multirow_number_format():
+    fmt = NumberFormat(decimals=2)
+    tab = tabx.Table(
+        [
+            tabx.Row([Cell(3.14159, multirow=2, number_format=fmt), Cell("a")]),
+            tabx.Row([Cell(""), Cell("b")]),
+        ]
+    )
+    assert tab.render_body() == "\\multirow{2}{*}{3.14} & a \\\\\n & b \\\\"
+    assert tab.rows[0].cells[0].number_format == fmt
+
+
+def test_zero_is_not_empty():
+    # A zero valued cell is not an empty cell next to a rule
+    stub = tabx.Table([tabx.Midrule(), tabx.Row([Cell("x")])])
+    with pytest.raises(ValueError, match="must be empty"):
+        stub | tabx.Table.from_values([[0], [1]])
+    out = stub | tabx.Table([tabx.Row([Cell("")]), tabx.Row([Cell(1)])])
+    assert out.render_body() == "\\midrule\nx & 1 \\\\"
@@ -1,4 +1,5 @@
 import re
+from functools import reduce
 
 import pytest
 
@@ -439,3 +440,99 @@ def test_concat():
 
     with pytest.raises(ValueError):
         tabm.concat([tab, tab], "wrong")
+
+    # n-ary concat equals pairwise joins
+    tables = [
+        Row([Cell(f"m{i}")]) / Cmidrule(1, 1) / Midrule() / tabx.empty_table(2, 1)
+        for i in range(10)
+    ]
+    out = tabm.concat(tables, "horizontal")
+    assert isinstance(out, Table)
+    assert out.shape == (5, 10)
+    assert out == reduce(lambda x, y: x | y, tables)
+    assert out.rows[1].values == [Cmidrule(i, i) for i in range(1, 11)]
+    out = tabm.concat(tables, "vertical")
+    assert isinstance(out, Table)
+    assert out == reduce(lambda x, y: x / y, tables)
+
+
+def test_lazy():
+    from functools import reduce
+
+    tab = tabx.Table.from_values([[1, 2], [3, 4]])
+    col = tabx.multirow_column("mr", multirow=2)
+
+    expr = tabx.lazy(tab) | tab | col
+    assert isinstance(expr, tabx.TableExpr)
+    out = expr.collect()
+    assert isinstance(out, Table)
+    assert out == tab | tab | col
+    assert expr.render() == (tab | tab | col).render()
+
+    # Operands on the left are lifted into the expression
+    expr = col | tabx.lazy(tab)
+    assert isinstance(expr, tabx.TableExpr)
+    assert expr.collect() == col | tab
+
+    # Mixed `|` and `/`
+    expr = (tabx.lazy(tab) | tab) / Midrule() / (tab | tab)
+    assert expr.collect() == (tab | tab) / Midrule() / (tab | tab)
+    expr = Midrule() / tabx.lazy(tab)
+    assert expr.collect().rows[0] == Midrule()
+
+    # Cells and rows
+    assert (tabx.lazy(Cell("1")) | Cell("2")).collect() == Cell("1") | Cell("2")
+    assert (Cell("1") / tabx.lazy(Cell("2"))).collect().shape == (2, 1)
+    assert tabx.lazy(Cell("1")).collect().shape == (1, 1)
+
+    # Long chains are flattened into a single join
+    parts = [tabx.Table.from_values([[i], [i]]) for i in range(2_000)]
+    out = reduce(lambda x, y: x | y, parts[1:], tabx.lazy(parts[0])).collect()
+    assert out.shape == (2, 2_000)
+    out = reduce(lambda x, y: x / y, parts[1:], tabx.lazy(parts[0])).collect()
+    assert out.shape == (4_000, 1)
+
+    with pytest.raises(TypeError):
+        _ = tabx.lazy(tab) | Midrule()
+    with pytest.raises(TypeError):
+        _ = tabx.lazy(1)
+    with pytest.raises(ValueError, match="same number of rows"):
+        _ = (tabx.lazy(tab) | tabx.empty_table(3, 1)).collect()
+
+
+def test_lazy_getitem():
+    a = tabx.Table.from_values([[i, i + 1] for i in range(5)])
+    b = tabx.multirow_column("mr", multirow=5)
+    c = tabx.Table(
+        [
+            Row([Cell("x", multicolumn=2)]),
+            *[Row([Cell(i), Cell(i)]) for i in range(4)],
+        ]
+    )
+    expr = tabx.lazy(a) | b | c
+    eager = a | b | c
+    for index in [
+        (slice(2, None), slice(3, None)),
+        (slice(1, 3), slice(1, 4)),
+        ([4, 0], [True, False, True, False, True]),
+        (slice(None), slice(None, None, 2)),
+        -1,
+    ]:
+        sliced = expr[index]
+        assert isinstance(sliced, tabx.TableExpr)
+        assert sliced.render() == eager[index].render()
+
+    # Only the selected operands remain
+    sliced = expr[:, 3:]
+    assert [p.how for p in sliced.parts] == ["leaf"]
+
+    # Cmidrules are moved for the narrower result
+    d = tabx.Table([Row([Cell(1), Cell(2)]), Cmidrule(1, 2), Row([Cell(3), Cell(4)])])
+    expr = tabx.lazy(d) | d | d
+    assert expr[1:, 1:5].render() == (d | d | d)[1:, 1:5].render()
+    assert r"\cmidrule(lr){1-1}" in expr[1:, 1:5].render()
+
+    expr = tabx.lazy(a) / Midrule() / a
+    assert expr[4:7].render() == (a / Midrule() / a)[4:7].render()
+    with pytest.raises(IndexError):
+        _ = expr[20]
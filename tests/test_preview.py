@@ -0,0 +1,118 @@
+import pytest
+
+import tabx
+from tabx import (
+    Cell,
+    Cmidrule,
+    ColoredCell,
+    ColoredRow,
+    Midrule,
+    NumberFormat,
+    Row,
+    Table,
+)
+from tabx.preview import HTML_TABLE, column_aligns, css_color
+
+
+def example_table() -> Table:
+    header = Cell("") | tabx.multicolumn_row("Group|A", 2)
+    names = Table.from_values([["var", "a", "b"]])
+    body = Table.from_values([["x", 1.5, 22], ["yyyy", 2, 3]])
+    tab = header / Cmidrule(2, 3) / names / Midrule() / body
+    return tab.set_align("lcr")
+
+
+def test_render_text():
+    assert example_table().render_text().splitlines() == [
+        "=============",
+        "      Group|A",
+        "      -------",
+        "var    a    b",
+        "-------------",
+        "x     1.5  22",
+        "yyyy   2    3",
+        "=============",
+    ]
+    tab = tabx.multirow_column("Long label", 2) | Table.from_values([[1], [2]])
+    assert tab.render_text().splitlines() == [
+        "=============",
+        "Long label  1",
+        "            2",
+        "=============",
+    ]
+    with pytest.raises(ValueError):
+        tabx.empty_table(0, 0).render_text()
+
+
+def test_render_markdown():
+    assert example_table().render_markdown().splitlines() == [
+        "|      | Group\\|A |     |",
+        "| :--- | :------: | --: |",
+        "| var  | a        | b   |",
+        "| x    | 1.5      | 22  |",
+        "| yyyy | 2        | 3   |",
+    ]
+    # Without a midrule there is no header
+    assert Table.from_values([[1, 2]]).render_markdown().splitlines() == [
+        "|     |     |",
+        "| :-: | :-: |",
+        "| 1   | 2   |",
+    ]
+
+
+def test_render_html():
+    tab = example_table()
+    lines = tab.render_html().splitlines()
+    assert lines[:2] == [HTML_TABLE, "<tbody>"]
+    assert lines[2] == (
+        '<tr><td style="text-align: left"></td>'
+        '<td colspan="2" style="text-align: center">Group|A</td></tr>'
+    )
+    # The cmidrule borders the cells under it
+    assert lines[3] == (
+        '<tr><td style="text-align: left">var</td>'
+        '<td style="text-align: center; border-top: 1px solid">a</td>'
+        '<td style="text-align: right; border-top: 1px solid">b</td></tr>'
+    )
+    assert lines[4].startswith('<tr style="border-top: 1px solid"><td')
+    assert lines[-2:] == ["</tbody>", "</table>"]
+    assert tab._repr_html_() == tab.render_html()
+    assert tabx.empty_table(0, 0)._repr_html_() is None
+
+    tab = tabx.multirow_column("<b>", 2) | Table(
+        [Row([ColoredCell("1", "red")]), Row([Cell(2, style="bold")])]
+    )
+    tab = ColoredRow("gray!20") / tab / Midrule()
+    assert tab.render_html().splitlines()[2:4] == [
+        '<tr style="background-color: color-mix(in srgb, gray 20%, white)">'
+        '<td rowspan="2" style="text-align: center">&lt;b&gt;</td>'
+        '<td style="text-align: center; background-color: red">1</td></tr>',
+        '<tr style="border-bottom: 1px solid">'
+        '<td style="text-align: center"><b>2</b></td></tr>',
+    ]
+
+
+def test_css_color():
+    assert css_color("red") == "red"
+    assert css_color("red!30") == "color-mix(in srgb, red 30%, white)"
+    assert css_color("red!30!blue") == "color-mix(in srgb, red 30%, blue)"
+
+
+def test_preview_columnar():
+    values = [[1.23456, "a_b"], [10, "c"]]
+    kwargs = dict(formats=[NumberFormat(decimals=2), None])
+    rows = Table.from_values(values, **kwargs).escape()
+    columnar = Table.from_values(values, storage="columnar", **kwargs).escape()
+    assert columnar.render_text() == rows.render_text()
+    assert columnar.render_markdown() == rows.render_markdown()
+    assert columnar.render_html() == rows.render_html()
+    # Values are shown formatted, without LaTeX escapes
+    assert columnar.render_text().splitlines()[1:3] == [" 1.23  a_b", "10.00   c"]
+    assert not columnar.rows.is_materialized()
+
+
+def test_column_aligns():
+    assert column_aligns("lcr", 3) == ["l", "c", "r"]
+    assert column_aligns(r"@{}l>{\bfseries}p{2cm}S@{}", 3) == ["l", "l", "r"]
+    assert column_aligns("", 2) == ["c", "c"]
+    assert column_aligns("lc", 3) == ["c", "c", "c"]
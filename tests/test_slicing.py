@@ -84,6 +84,30 @@ def test_row():
     assert tabm.index_to_slice(-3, [0, 1, 2]) == slice(0, 1)
 
 
+def test_normalize_index():
+    n = 10**9
+    assert tabm.normalize_index(-1, n) == n - 1
+    assert tabm.normalize_index(0, n) == 0
+    # Same semantics as indexing a list
+    for i in range(-4, 4):
+        try:
+            want = list(range(3))[i]
+        except IndexError:
+            with pytest.raises(IndexError):
+                tabm.normalize_index(i, 3)
+        else:
+            assert tabm.normalize_index(i, 3) == want
+    with pytest.raises(IndexError):
+        tabm.normalize_index(0, 0)
+    with pytest.raises(TypeError):
+        tabm.normalize_index(1.0, 3)  # type: ignore
+
+    tab = tabx.Table.from_values([[i] for i in range(5)])
+    assert tab.insert_row(Row([Cell("x")]), -1).rows[4] == Row([Cell("x")])
+    with pytest.raises(IndexError):
+        tab.insert_rows([Row([Cell("x")])], [-6])
+
+
 def test_misc_slices():
     assert tabm.slices_from_indices([0, 1, 2, 4, 5]) == [slice(0, 3), slice(4, 6)]
     assert tabm.slices_from_indices([]) == []
@@ -151,6 +175,18 @@ def test_validate_column_rows():
             ]
         )
 
+    # The rows are left as they were when a later span is invalid
+    rows = [
+        Row([Cell(name="mf", value="1", multirow=2), Cell(value="2", multirow=3)]),
+        Row([empty_cell(), empty_cell()]),
+        Row([Cell(value="3"), Cell(value="4")]),
+    ]
+    cells = [list(row.cells) for row in rows]
+    with pytest.raises(ValueError, match="found 2 following cells of which 1"):
+        tabm.validate_column_rows(rows)
+    assert [list(row.cells) for row in rows] == cells
+    assert all(type(f) is Cell for row in rows for f in row.cells)
+
 
 def test_validate_rows():
     rows = [
@@ -360,7 +396,10 @@ def test_column():
         col[0, 1]
 
     with pytest.raises(ValueError):
-        col[[1]]
+        col["1"]
+
+    with pytest.raises(ValueError):
+        col[0, 0, 0]
 
 
 def test_multirow_cell():
@@ -593,3 +632,221 @@ def test_slice_table():
 
     tab = tabm.Table.from_columns(cols)[:2, :2]
     print(tab.render())
+
+
+def test_slice_shares_cells():
+    tab = tabm.Table(
+        [
+            Row([Cell("a", multirow=4), Cell("x")]),
+            Row([empty_cell(), Cell("y")]),
+            Cmidrule(2, 2),
+            Row([empty_cell(), Cell("z")]),
+            Row([Cell("b"), Cell("w")]),
+        ]
+    )
+    before = tab.render()
+    mr = tab.rows[0].cells[0]
+
+    out = tab[1:4]
+    # Plain cells and rules are shared; rows are new
+    assert out.rows[0].cells[1] is tab.rows[1].cells[1]
+    assert out.rows[1] is tab.rows[2]
+    assert out.rows[0] is not tab.rows[1]
+    # The cut multirow is a linked copy
+    head, below = out.rows[0].cells[0], out.rows[2].cells[0]
+    assert isinstance(head, tabm.MultirowCell) and head is not mr
+    assert head.multirow == 3
+    assert below.mr is head
+
+    out = tab[:2]
+    assert out.rows[0].cells[0].multirow == 2
+    assert out.rows[1].cells[0].mr is out.rows[0].cells[0]
+    assert tab[::2].rows[0].cells[0].multirow == 1
+
+    # Mutating the slice leaves the table untouched
+    out.rows[1][1] = Cell("new")
+    assert mr.multirow == 4
+    assert tab.rows[1].cells[0].mr is mr
+    assert tab.render() == before
+
+
+@pytest.mark.parametrize("index", [slice(1, 3), [1, 2], (slice(1, 3), slice(0, 2))])
+def test_slice_view_semantics(index):
+    tab = tabx.Table.from_values([[i, i + 1, i + 2] for i in range(4)])
+    view = tab[index]
+    # Setting a cell through a row of the view only changes the view
+    view.rows[0][1] = Cell("new")
+    assert view.rows[0].cells[1].value == "new"
+    assert tab.rows[1].cells[1].value == 2
+    # Cells are shared: a cell changed in place changes in both
+    view.rows[1].cells[0].value = "shared"
+    assert tab.rows[2].cells[0].value == "shared"
+    assert "shared & 3" in tab.render()
+
+
+def test_boundary_spans():
+    def block():
+        return [
+            Row([Cell("a", multirow=3), Cell("x")]),
+            Row([empty_cell(), Cell("y")]),
+            Row([empty_cell(), Cell("z")]),
+            Row([Cell("b", multirow=2), Cell("w")]),
+            Row([empty_cell(), Cell("v")]),
+        ]
+
+    tab = tabm.Table(block() + block() + block())
+    cells = [list(row.cells) for row in tab.rows[1:14]]
+
+    # Only the span cut at the top and the one cut at the bottom
+    cuts = tabm.boundary_spans(cells)
+    assert [(mr.value, pos, n) for mr, pos, n in cuts] == [
+        ("a", [(0, 0), (1, 0)], 2),
+        ("b", [(12, 0)], 1),
+    ]
+
+    out = tab[1:14]
+    assert out.rows[5].cells[0] is tab.rows[6].cells[0]
+    assert out.rows[0].cells[0].multirow == 2
+    assert out.rows[-1].cells[0].multirow == 1
+    expected = tabm.Table(
+        [Row([Cell("a", multirow=2), Cell("y")]), Row([empty_cell(), Cell("z")])]
+        + block()[3:]
+        + block()
+        + block()[:3]
+        + [Row([Cell("b"), Cell("w")])]
+    )
+    assert out.render() == expected.render()
+
+
+def test_slice_shared_spans():
+    # Joining a table with itself shares its multirow cells between spans
+    def block():
+        return tabx.multirow_column("m", 3) | tabx.Table.from_values([[1], [2], [3]])
+
+    tab = block()
+    shared = tab / tab
+    unshared = block() / block()
+    for index in [
+        slice(1, None),
+        slice(1, 5),
+        slice(2, 4),
+        slice(None, 4),
+        slice(1, None, 2),
+        [1, 2, 4],
+        [2, 3, 4],
+    ]:
+        assert shared[index].render() == unshared[index].render()
+    assert shared[1:].render_body() == "\n".join(
+        [
+            r"\multirow{2}{*}{m} & 2 \\",
+            r" & 3 \\",
+            r"\multirow{3}{*}{m} & 1 \\",
+            r" & 2 \\",
+            r" & 3 \\",
+        ]
+    )
+    # Nested slices of the shared spans
+    assert shared[1:][1:3].render() == unshared[2:4].render()
+    assert shared.render() == unshared.render()
+
+
+def test_slice_cells_boundaries():
+    cells = [
+        Cell(name="a", value="1", multicolumn=3),
+        Cell("2"),
+        Cell("3"),
+        Cell(name="b", value="4", multicolumn=2),
+    ]
+    # Only the boundary cells are clipped; the interior is shared
+    out = slice_cells(cells, slice(1, 6))
+    assert out == [
+        Cell(name="a", value="1", multicolumn=2),
+        Cell("2"),
+        Cell("3"),
+        Cell(name="b", value="4", multicolumn=1),
+    ]
+    assert out[1] is cells[1]
+    # Inside a single multicolumn cell
+    assert slice_cells(cells, slice(1, 2)) == [Cell(name="a", value="1")]
+    # Negative bounds count from the last column
+    assert slice_cells(cells, slice(-3, None)) == cells[2:]
+    assert slice_cells(cells, slice(None, -2)) == cells[:3]
+    assert slice_cells(cells, slice(4, 2)) == []
+
+
+def test_fancy_indexing():
+    tab = tabm.Table(
+        [
+            Row([Cell("a", multirow=3), Cell("x"), Cell("1")]),
+            Row([empty_cell(), Cell(name="m", value="y", multicolumn=2)]),
+            Row([empty_cell(), Cell("z"), Cell("3")]),
+            Cmidrule(2, 3),
+            Row([Cell("b"), Cell("w"), Cell("4")]),
+        ]
+    )
+    before = tab.render()
+
+    # Index lists, masks and stepped slices select the same rows
+    out = tab[[0, 2, 4]]
+    assert out.render() == tab[[True, False, True, False, True]].render()
+    assert out.render() == tab[::2].render() == tab[[0, -3, -1]].render()
+    # Rows 0 and 2 of the multirow are kept together
+    assert out.rows[0].cells[0].multirow == 2
+    assert out.rows[1].cells[0].mr is out.rows[0].cells[0]
+    # Out of order rows are split from their multirow
+    assert tab[[2, 0]].rows[0].cells[0] == tabm.MultirowCell("a", multirow=1)
+
+    # Columns: multicolumns and cmidrules are clipped per run of columns
+    out = tab[:, [2, 0]]
+    assert out.shape == (5, 2)
+    assert out.rows[1].cells == [Cell(name="m", value="y"), tabm.MrEmptyCell()]
+    assert out.rows[3] == Cmidrule(1, 1)
+    assert tab[:, ::-1].rows[3].values == [Cmidrule(1, 1), Cmidrule(2, 2)]
+
+    # Repeated columns get their own multirow groups
+    out = tab[:, [0, 0]]
+    first, second = out.rows[0].cells
+    assert first is not second
+    assert out.rows[2].cells[1].mr is second
+    assert out[1:].rows[0].cells[0].multirow == 2
+
+    assert tab[[1, 2], [False, True, True]].shape == (2, 2)
+    assert tab.render() == before
+
+    with pytest.raises(IndexError):
+        tab[[5]]
+    with pytest.raises(IndexError):
+        tab[[True]]
+    with pytest.raises(ValueError):
+        tab[[0, True]]
+
+
+def test_cmidrules_index():
+    cmids = Cmidrules([Cmidrule(7, 8), Cmidrule(1, 2), Cmidrule(4, 5, dim="1pt")])
+    assert cmids.values == [Cmidrule(1, 2), Cmidrule(4, 5), Cmidrule(7, 8)]
+    assert (cmids.start, cmids.end, cmids.clen()) == (1, 8, 8)
+
+    # Only overlapping cmidrules are clipped; dims are kept
+    out = cmids[1:5]
+    assert out.values == [Cmidrule(2, 2), Cmidrule(4, 5)]
+    assert out.values[1].dim == "1pt"
+    assert cmids[2:3].values == []
+    assert cmids[-2:].values == [Cmidrule(7, 8)]
+    assert cmids.__getitem__(slice(3, 8), standardize=3).values == [
+        Cmidrule(1, 2),
+        Cmidrule(4, 5),
+    ]
+    assert cmids[2].values == []
+    assert cmids[3].values == [Cmidrule(1, 1)]
+
+    assert cmids.shift(2).values == [Cmidrule(3, 4), Cmidrule(6, 7), Cmidrule(9, 10)]
+    assert cmids.shift(0) is cmids
+    assert Cmidrule(2, 4).clip(0, 2) == Cmidrule(2, 2)
+    assert Cmidrule(2, 4).clip(4, 6) is None
+
+    with pytest.raises(ValueError, match="overlap"):
+        Cmidrules([Cmidrule(4, 6), Cmidrule(1, 2), Cmidrule(2, 3)])
+
+    # Horizontal slices agree with the cells on negative bounds
+    tab = tabm.Table([Row([Cell(str(i)) for i in range(8)]), cmids])
+    assert tab[:, -4:].rows[1].values == [Cmidrule(1, 1), Cmidrule(3, 4)]
@@ -473,3 +473,420 @@ def test_insert_rows():
         tab = test_tab()
         tab = tab.insert_row(tabx.Midrule(), i)
         assert isinstance(tab.rows[i], tabx.Midrule)
+
+
+def test_join_columns_sharing():
+    body = tabx.Table.from_values([[1, 2], [3, 4], [5, 6]])
+    stub = tabx.multirow_column("mr", multirow=3)
+    out = tabm.join_columns([stub, body, stub])
+
+    # Cells without multirow are shared with the input
+    for row, brow in zip(out.rows, body.rows):
+        assert row.cells[1] is brow.cells[0]
+        assert row.cells[2] is brow.cells[1]
+
+    # Multirow groups are copied and linked within each copy
+    mr1, mr2 = out.rows[0].cells[0], out.rows[0].cells[3]
+    assert isinstance(mr1, tabm.MultirowCell)
+    assert mr1 is not mr2
+    assert mr1 is not stub.rows[0].cells[0]
+    assert all(r.cells[0].mr is mr1 for r in out.rows[1:])
+    assert all(r.cells[3].mr is mr2 for r in out.rows[1:])
+    assert all(r.cells[0].mr is stub.rows[0].cells[0] for r in stub.rows[1:])
+
+    # Slicing the joined table leaves the inputs untouched
+    assert out[1:].rows[0].cells[0].multirow == 2
+    assert stub.rows[0].cells[0].multirow == 3
+
+    cm = Cmidrule(1, 1, dim="0.5pt")
+    out = tabm.join_columns([Columns([cm]), Columns([cm])])
+    assert out.rows[0].values[0] is cm
+    assert out.rows[0].values[1].render() == r"\cmidrule[0.5pt](lr){2-2}"
+
+
+def test_validation_levels(monkeypatch):
+    def rows():
+        return [Row([Cell("a", multirow=2), Cell("b")]), Row([Cell(""), Cell("c")])]
+
+    cols = Columns(rows())
+    assert isinstance(cols.rows[0].cells[0], tabm.MultirowCell)
+    cols = Columns(rows(), validate="structural")
+    assert not isinstance(cols.rows[0].cells[0], tabm.MultirowCell)
+    assert cols.shape == (2, 2)
+
+    bad = [Row([Cell("a")]), Row([Cell("b"), Cell("c")])]
+    with pytest.raises(ValueError, match="columns differ"):
+        Columns(bad, validate="structural")
+    assert Columns(bad, validate="off").ncols == 1
+    with pytest.raises(ValueError, match="Validation level"):
+        Columns(rows(), validate="some")  # type: ignore
+
+    monkeypatch.setenv(tabm.VALIDATE_ENV, "off")
+    assert tabx.Table(bad).ncols == 1
+    monkeypatch.setenv(tabm.VALIDATE_ENV, "full")
+    with pytest.raises(ValueError, match="columns differ"):
+        tabx.Table(bad)
+
+
+def test_append_prepend_trusted():
+    tab = tabx.Table.from_values([[1, 2], [3, 4]])
+    out = tab.append_row(Row([Cell("5"), Cell("6")]))
+    assert out.rows[:2] == tab.rows
+    assert out.shape == (3, 2)
+    with pytest.raises(ValueError, match=re.escape("{1, 2}")):
+        tab.append_row(Row([Cell("5")]))
+    with pytest.raises(ValueError, match="Cmidrule end"):
+        tab.append_row(Cmidrule(1, 3))
+    with pytest.raises(ValueError, match="followed by"):
+        tab.append_row(Row([Cell("5", multirow=2), Cell("6")]))
+
+    # Multirow cells in a prepended row are linked to the rows below
+    tab = tabx.Table.from_values([["", 2], [3, 4]])
+    out = tab.prepend_row(Row([Cell("x", multirow=2), Cell("y")]))
+    mr = out.rows[0].cells[0]
+    assert isinstance(mr, tabm.MultirowCell)
+    assert out.rows[1].cells[0].mr is mr
+
+    # Inserting inside a multirow span is checked against the whole table
+    with pytest.raises(ValueError):
+        out.insert_row(Row([Cell("i"), Cell("j")]), 1)
+
+
+def test_rows_persistent():
+    r = [Row([Cell(str(i))]) for i in range(6)]
+    rows = tabm.Rows(r[2:4])
+    a = rows.with_row(r[4], 2).with_row(r[1], 0).with_row(r[0], 0)
+    assert a == r[:5]
+    assert list(a[1:4]) == r[1:4]
+    assert a[::2] == [r[0], r[2], r[4]]
+    assert a[-1] is r[4] and a[0] is r[0]
+    with pytest.raises(IndexError):
+        a[5]
+
+    # Older versions are unaffected and branching copies
+    assert rows == r[2:4]
+    b = rows.with_row(r[5], 2)
+    assert b == r[2:4] + [r[5]]
+    assert a == r[:5]
+    assert a.with_row(r[5], 2) == r[:2] + [r[5]] + r[2:5]
+    # Rows are immutable; list methods don't silently return new rows
+    assert not hasattr(a, "append") and not hasattr(a, "insert")
+
+    tab = tabx.Table.from_values([[1, 2]])
+    for i in range(3):
+        tab = tab.append_row(Row([Cell(str(i)), Cell(str(i))]))
+    assert isinstance(tab.rows, tabm.Rows)
+    assert tab.shape == (4, 2)
+    assert tab[1:].rows == list(tab.rows)[1:]
+
+
+def test_row_offsets():
+    row = Row([Cell("a", multicolumn=4), Cell("b"), Cell("c", multicolumn=2)])
+    assert row.offsets() == [0, 4, 5, 7]
+    assert len(row) == 7
+    assert [row.cell_index(i) for i in range(7)] == [0, 0, 0, 0, 1, 2, 2]
+    with pytest.raises(IndexError):
+        row.cell_index(7)
+
+    # Offsets are rebuilt after setting cells through the row
+    row[0] = Cell("a")
+    assert len(row) == 4
+    assert row.cell_index(1) == 1
+    row.cells = [Cell("x", multicolumn=2)]
+    assert row.offsets() == [0, 2]
+    assert row == Row([Cell("x", multicolumn=2)])
+
+
+def test_validate_column_rows_sweep():
+    # Spans of different heights in several columns are linked in one sweep
+    rows = [
+        Row([Cell("a", multirow=3), Cell("b", multirow=2), Cell("c")]),
+        Row([Cell(""), Cell(""), Cell("d", multirow=2)]),
+        Row([Cell(""), Cell("e"), Cell("")]),
+    ]
+    tabm.validate_column_rows(rows)
+    a, b, d = rows[0].cells[0], rows[0].cells[1], rows[1].cells[2]
+    assert [r.cells[0].mr for r in rows[1:]] == [a, a]
+    assert rows[1].cells[1].mr is b
+    assert rows[2].cells[2].mr is d
+
+    # The error of the first invalid multirow cell is raised
+    rows = [
+        Row([Cell("a", multirow=4), Cell("b", multirow=2)]),
+        Row([Cell(""), Cell("x")]),
+        Row([Cell(""), Cell("")]),
+    ]
+    with pytest.raises(ValueError, match=r"#rows=4 .* found 2 following cells"):
+        tabm.validate_column_rows(rows)
+    rows = [Row([Cell("a", multirow=2)]), Midrule(), Row([Cell("")])]
+    with pytest.raises(ValueError, match="must be followed by"):
+        tabm.validate_column_rows(rows)
+
+
+def test_cell_slots():
+    import pickle
+    from copy import deepcopy
+
+    cell = Cell("1", style="bold", colspec="l", multicolumn=2)
+    assert not hasattr(cell, "__dict__")
+    assert (cell.style, cell.colspec, cell.vpos, cell.width) == ("bold", "l", "", "*")
+    assert cell._fmt == Cell("2", style="bold", colspec="l")._fmt
+    assert Cell("1")._fmt == 0
+
+    cell.style = "math"
+    assert cell.render() == r"\multicolumn{2}{l}{$1$}"
+    assert cell == Cell("1", style="math", colspec="l", multicolumn=2)
+    assert cell != Cell("1", style="math", multicolumn=2)
+    assert Cell("") != tabm.EmptyCell()
+    with pytest.raises(ValueError, match="Unknown style"):
+        cell.style = "random"  # type: ignore
+
+    tab = tabx.multirow_column("mr", multirow=2, vpos="t", vmove="1pt") | Columns(
+        [Row([tabm.ColoredCell("x", color="red")]), Row([Cell("y")])]
+    )
+    for out in [pickle.loads(pickle.dumps(tab)), deepcopy(tab)]:
+        assert out.render() == tab.render()
+        assert out.rows[1].cells[0].mr is out.rows[0].cells[0]
+        assert out.rows[0].cells[1].color == "red"
+
+
+def test_columnar_storage():
+    values = [[i + j / 10 for j in range(4)] for i in range(6)]
+    header = Row([Cell(c) for c in "abcd"])
+
+    def tables(storage):
+        tab = tabx.Table.from_values(values, storage=storage)
+        return tab, header / Midrule() / tab
+
+    (tab, htab), (ctab, hctab) = tables("rows"), tables("columnar")
+    assert isinstance(hctab.rows, tabm.ColumnarRows)
+    assert hctab.render() == htab.render()
+    assert (ctab | ctab).render() == (tab | tab).render()
+    assert (hctab | hctab).render() == (htab | htab).render()
+    assert (hctab / ctab).render() == (htab / tab).render()
+    for index in [slice(1, 4), -1, (slice(2, 5), slice(1, 3))]:
+        assert hctab[index].render() == htab[index].render()
+    assert not hctab.rows.is_materialized()
+    assert isinstance((hctab | hctab)[2:].rows, tabm.ColumnarRows)
+    assert hctab[::2].render() == htab[::2].render()
+
+    # Rows are created on access and changes to them persist
+    row = hctab.rows[3]
+    assert row == htab.rows[3]
+    assert hctab.rows[3] is row
+    row[0] = Cell("x")
+    assert hctab.render().splitlines()[5].startswith("  x & ")
+
+    with pytest.raises(ValueError, match="columns differ"):
+        tabx.Table.from_values([[1, 2], [3]], storage="columnar")
+
+
+def test_columnar_views():
+    tab = tabx.Table.from_values([[i, i] for i in range(5)], storage="columnar")
+    before = tab.render()
+    # Rows set through a view stay in the view
+    view = tab[1:3]
+    view.rows[0][0] = Cell("X")
+    assert "X & 1" in view.render()
+    assert tab.render() == before
+    assert not tab.rows.is_materialized()
+
+    # Views see the rows set in the table before
+    tab.rows[2][1] = Cell("P")
+    view = tab[1:4]
+    assert "2 & P" in view.render()
+    view.rows[1][1] = Cell("Q")
+    assert "2 & P" in tab.render() and "Q" not in tab.render()
+
+
+def test_render_cache():
+    tab = tabx.Table.from_values([[1, 2], [3, 4]])
+    out = tab.rows[0].render()
+    assert tab.rows[0].render() is out
+    # Unrelated rows don't invalidate the cache
+    Row([Cell("a")])
+    assert tab.rows[0].render() is out
+
+    cell = tab.rows[0].cells[0]
+    cell.value = "x"
+    assert "x & 2" in tab.render()
+    cell.style = "bold"
+    assert r"\textbf{x} & 2" in tab.render()
+    tab.rows[1][1] = tabm.ColoredCell("y", color="red")
+    assert r"3 & \cellcolor{red}y" in tab.render()
+    tab.rows[1].cells[1].color = "blue"
+    assert r"\cellcolor{blue}y" in tab.render()
+    tab.set_align("lr")
+    assert tab.render().startswith(r"\begin{tabular}{@{}lr@{}}")
+    # Cells replaced without going through the row
+    tab.rows[0].cells[0] = Cell("NEW")
+    assert "NEW & 2" in tab.render()
+
+    # Multirow cells shrink when sliced
+    mr = tabx.multirow_column("m", multirow=3)
+    assert r"\multirow{3}" in mr.render()
+    assert r"\multirow{2}" in mr[1:].render()
+    assert r"\multirow{3}" in mr.render()
+
+
+def test_iter_render(tmp_path):
+    import io
+
+    tab = tabx.Table.from_values([[1, 2], [3, 4]])
+    stub = tabx.Table([Row([Cell("a"), Cell("b")]), Cmidrule(1, 1), Midrule()])
+    cases = [
+        tab,
+        stub / tab,
+        (stub / tab)[:, 1:],  # clipped cmidrule renders as an empty line
+        tabx.Table.from_values([[1, 2], [3, 4]], storage="columnar"),
+        tabx.Table.from_values([[1, 2], [3, 4]], storage="columnar") / stub,
+        tabx.multirow_column("m", multirow=3) | tabx.empty_table(3, 1),
+    ]
+    for tab in cases:
+        assert "\n".join(tab.iter_render()) == tab.render()
+        fp = io.StringIO()
+        tab.render_to(fp)
+        assert fp.getvalue() == tab.render()
+
+    # Streaming doesn't keep the renders of the rows around
+    tab = tabx.Table.from_values([[1, 2], [3, 4]])
+    tab.save(tmp_path / "table.tex", streaming=True)
+    assert all(row._rendered is None for row in tab.rows)
+    assert (tmp_path / "table.tex").read_text() == tab.render()
+
+    with pytest.raises(ValueError, match="empty"):
+        tabx.empty_table(0, 0).iter_render()
+
+
+def test_render_workers(monkeypatch, tmp_path):
+    import pickle
+    import subprocess
+    import sys
+
+    rows = [
+        Row(
+            [
+                Cell(i + j / 3, number_format=tabx.NumberFormat(decimals=2)),
+                Cell(f"{i}&{j}", escape=True),
+                tabm.ColoredCell(str(j), color="red") if i % 7 else Cell(str(i)),
+            ]
+        )
+        for i, j in enumerate(range(50))
+    ]
+    mr = tabx.multirow_column("m", multirow=50)
+    tabs = [
+        tabx.Table([Row([Cell("a", multicolumn=4)])]) / (tabx.Table(rows) | mr),
+        tabx.Table.from_values([[i, i + 1] for i in range(50)], storage="columnar")
+        / Midrule()
+        / tabx.Table([Row([Cell("a"), Cell("b")])]),
+    ]
+    started = []
+    start = tabm.start_render_worker
+
+    def start_worker():
+        started.append(proc := start())
+        return proc
+
+    monkeypatch.setattr(tabm, "start_render_worker", start_worker)
+    for tab in tabs:
+        out = tab.render()
+        started.clear()
+        assert tab.render(workers=3) == out
+        # The rows were rendered by the worker processes
+        assert len(started) == 3
+        assert all(proc.returncode == 0 for proc in started)
+        # Chunks are packed and pickled to the worker processes
+        chunks = tabm.row_chunks(tab.rows, 7)
+        assert sum(map(len, chunks)) == tab.nrows
+        packed = [pickle.loads(pickle.dumps(tabm.pack_rows(c))) for c in chunks]
+        assert "\n".join(map(tabm.render_packed, packed)) == tab.render_body()
+
+    # Scripts don't need an `if __name__ == "__main__"` guard
+    script = tmp_path / "script.py"
+    script.write_text(
+        "import tabx\n"
+        "tab = tabx.Table.from_values([[i, i] for i in range(20)])\n"
+        "assert tab.render(workers=2) == tab.render()\n"
+        "print('done')\n"
+    )
+    proc = subprocess.run(
+        [sys.executable, str(script)], capture_output=True, text=True, timeout=60
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout == "done\n"
+
+
+def test_split(tmp_path):
+    header = Row([Cell("a"), Cell("b")]) / Midrule()
+    spans = tabx.multirow_column("m", multirow=3) / tabx.multirow_column(
+        "n", multirow=3
+    )
+    tab = header / (spans | tabx.Table.from_values([[i] for i in range(6)]))
+
+    # Multirow spans are never cut, even if a table gets longer
+    for max_rows, sizes in [(2, [3, 3]), (3, [3, 3]), (5, [3, 3]), (6, [6])]:
+        parts = tab.split(max_rows, header_rows=2)
+        assert [p.nrows - 2 for p in parts] == sizes
+        assert all(p.rows[:2] == tab.rows[:2] for p in parts)
+        assert "\n".join(p.render_body() for p in parts).count("a & b") == len(sizes)
+    with pytest.raises(ValueError, match="multirow span"):
+        tab.split(2, header_rows=3)
+    with pytest.raises(ValueError, match="max_rows"):
+        tab.split(0)
+
+    columnar = tabx.Table.from_values([[i, i] for i in range(10)], storage="columnar")
+    parts = (header / columnar).split(4, header_rows=2)
+    assert [p.nrows for p in parts] == [6, 6, 4]
+    assert parts[2].render() == (header / columnar[8:]).render()
+    assert not columnar.rows.is_materialized()
+
+    out = tab.render_longtable(header_rows=2)
+    assert out.count("a & b") == 2
+    assert r"\multirow{3}{*}{m} & 0 \\*" in out
+    assert r" & 2 \\" + "\n" in out
+    assert out.startswith(r"\begin{longtable}{@{}cc@{}}")
+    assert out.endswith("\\end{longtable}")
+
+    paths = tab.save_split(tmp_path / "t.tex", max_rows=3, header_rows=2)
+    assert [p.name for p in paths] == ["t_1.tex", "t_2.tex"]
+    assert paths[1].read_text() == tab.split(3, header_rows=2)[1].render()
+    index = (tmp_path / "t.tex").read_text()
+    # Inputs are relative to the index s.t. the directory can be moved
+    assert index == "\\input{t_1.tex}\n\n\\input{t_2.tex}\n"
+
+
+def test_render_incremental(tmp_path):
+    tab = tabx.Table.from_values([[i, i + 1] for i in range(100)]) / Midrule()
+    out = tab.render_incremental()
+    assert out.text == tab.render()
+    assert out.changed and out.rendered_rows == 100
+
+    again = tab.render_incremental(out.text)
+    assert not again.changed and again.rendered_rows == 0
+    assert again.text is out.text
+
+    # Only edited rows are rendered again
+    tab.rows[3].cells[0].value = "x"
+    tab.rows[50][1] = Cell("y", style="bold")
+    out = tab.render_incremental(out.text)
+    assert out.changed and out.rendered_rows == 2
+    assert out.text == tab.render()
+    assert r"x & 4 \\" in out.text and r"\textbf{y}" in out.text
+
+    # Rows rendered elsewhere in between are still noticed
+    tab.rows[5].cells[1].value = "z"
+    tab.rows[5].render()
+    out = tab.render_incremental(out.text)
+    assert out.rendered_rows == 1 and out.text == tab.render()
+
+    longer = tab.insert_row(Row([Cell("a"), Cell("b")]), 0)
+    assert longer.render_incremental(out.text).rendered_rows == 1
+
+    file = tmp_path / "t.tex"
+    assert tab.save(file, skip_unchanged=True)
+    assert not tab.save(file, skip_unchanged=True)
+    tab.rows[0].cells[0].value = "w"
+    assert tab.save(file, skip_unchanged=True)
+    assert file.read_text() == tab.render()
+    with pytest.raises(ValueError, match="streaming"):
+        tab.save(file, streaming=True, skip_unchanged=True)
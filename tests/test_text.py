@@ -29,3 +29,68 @@ def test_rotatebox():
     assert (
         text.rotatebox("abc", angle=45, origin="l") == r"\rotatebox[origin=l]{45}{abc}"
     )
+
+
+def test_escape_latex():
+    assert text.escape_latex("plain text 1.5") == "plain text 1.5"
+    assert text.escape_latex("R&D_1 50%") == r"R\&D\_1 50\%"
+    assert text.escape_latex("$#{}") == r"\$\#\{\}"
+    assert text.escape_latex("~^\\") == (
+        r"\textasciitilde{}\textasciicircum{}\textbackslash{}"
+    )
+    assert text.escape_latex("<|>") == r"\textless{}\textbar{}\textgreater{}"
+
+
+@pytest.mark.parametrize("storage", ["rows", "columnar"])
+def test_escape_cells(storage):
+    cell = tabx.Cell("a_b", style="bold", escape=True)
+    assert cell.render() == r"\textbf{a\_b}"
+    assert cell.value == "a_b"
+    cell.escape = False
+    assert cell.render() == r"\textbf{a_b}"
+
+    tab = tabx.Table.from_values([["R&D", 1.5], ["x_1", 2]], storage=storage)
+    escaped = tab.escape()
+    assert escaped.render_body() == "R\\&D & 1.5 \\\\\nx\\_1 & 2 \\\\"
+    # The original table and its values are kept as is
+    assert tab.render_body() == "R&D & 1.5 \\\\\nx_1 & 2 \\\\"
+    assert escaped.rows[0].cells[0].value == "R&D"
+    assert escaped[1:].render_body() == "x\\_1 & 2 \\\\"
+    assert (escaped | tab).render_body() == (
+        "R\\&D & 1.5 & R&D & 1.5 \\\\\nx\\_1 & 2 & x_1 & 2 \\\\"
+    )
+    assert (escaped / tab).render_body() == (
+        "\n".join([escaped.render_body(), tab.render_body()])
+    )
+    assert escaped.escape(False).render_body() == tab.render_body()
+
+
+def test_escape_multirow():
+    tab = tabx.multirow_column("x_y", multirow=2) | tabx.Table.from_values(
+        [["a&"], ["b"]]
+    )
+    assert tab.escape().render_body() == (
+        "\\multirow{2}{*}{x\\_y} & a\\& \\\\\n & b \\\\"
+    )
+    assert tab.render_body() == "\\multirow{2}{*}{x_y} & a& \\\\\n & b \\\\"
+
+    # Cells converted to multirow cells keep their escaping
+    tab = tabx.Table(
+        [
+            tabx.Row([tabx.Cell("R&D", multirow=2, escape=True), tabx.Cell("a")]),
+            tabx.Row([tabx.Cell(""), tabx.Cell("b")]),
+        ]
+    )
+    assert tab.render_body() == "\\multirow{2}{*}{R\\&D} & a \\\\\n & b \\\\"
+
+
+def test_escape_clipped_multicolumn():
+    fmt = tabx.NumberFormat(decimals=1)
+    row = tabx.Row(
+        [
+            tabx.Cell("R&D", multicolumn=3, escape=True, style="bold"),
+            tabx.Cell(2.25, multicolumn=2, number_format=fmt),
+        ]
+    )
+    assert row[1:4].render() == ("\\multicolumn{2}{c}{\\textbf{R\\&D}} & 2.2 \\\\")
+    assert row[2:].render() == "\\textbf{R\\&D} & \\multicolumn{2}{c}{2.2} \\\\"